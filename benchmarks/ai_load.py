@@ -0,0 +1,128 @@
+"""
+Load test for the async AI path against the local model stand-in.
+
+Plays hands on many all-bot tables at once, with every model call going
+through the shared gateway, and reports hand latency, model calls, and how
+often bots fell back to rule-based play. Runs fully offline:
+
+    python benchmarks/ai_load.py --tables 50 --hands 3 --median 0.8 --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import List
+from five_card_poker.ai import GeminiPokerAgent
+from five_card_poker.clients import ClientPool
+from five_card_poker.gateway import LLMGateway
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.standin import StandInClient, StandInConfig
+
+
+def build_table(
+    table_id: str, bots: int, pool: ClientPool, gateway: LLMGateway
+) -> Table:
+    table = Table(table_id=table_id)
+    for i in range(bots):
+        agent = GeminiPokerAgent(api_key="standin", client_pool=pool, gateway=gateway)
+        table.add_player(
+            Player(id=f"bot{i}", name=f"Bot {i}", type=PlayerType.AI, agent=agent)
+        )
+    return table
+
+
+async def play(table: Table, hands: int, durations: List[float]) -> None:
+    for _ in range(hands):
+        for player in table.players:
+            player.balance = max(player.balance, 100)
+        began = time.perf_counter()
+        await table.actor.submit("start", 10)
+        await table.actor.join()
+        durations.append(time.perf_counter() - began)
+
+
+async def run(args: argparse.Namespace) -> None:
+    config = StandInConfig(
+        latency=args.latency,
+        median=args.median,
+        spread=args.spread,
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    )
+    clients: List[StandInClient] = []
+
+    def factory(api_key: str) -> StandInClient:
+        clients.append(StandInClient(config))
+        return clients[-1]
+
+    pool = ClientPool(size=args.clients, factory=factory)
+    gateway = LLMGateway(
+        max_concurrency=args.concurrency,
+        timeout=args.timeout,
+        rate=args.rate,
+        burst=args.rate or 1,
+    )
+    tables = [
+        build_table(f"t{i}", args.bots, pool, gateway) for i in range(args.tables)
+    ]
+
+    durations: List[float] = []
+    began = time.perf_counter()
+    await asyncio.gather(*(play(table, args.hands, durations) for table in tables))
+    elapsed = time.perf_counter() - began
+
+    calls = sum(c.calls for c in clients)
+    errors = sum(c.errors for c in clients)
+    malformed = sum(c.malformed for c in clients)
+    stats = gateway.stats()
+    fallbacks = (
+        errors + malformed + stats["timeouts"] + stats["rejected"] + stats["busy"]
+    )
+    durations.sort()
+
+    print(f"tables={args.tables} bots={args.bots} hands/table={args.hands}")
+    print(f"wall time          {elapsed:8.2f} s")
+    print(f"hands/s            {len(durations) / elapsed:8.2f}")
+    print(
+        f"hand p50 / p99     {statistics.median(durations):8.2f} / "
+        f"{durations[int(0.99 * (len(durations) - 1))]:.2f} s"
+    )
+    print(f"model calls        {calls:8d}  ({calls / elapsed:.1f}/s)")
+    print(f"errors / malformed {errors:8d} / {malformed}")
+    print(f"gateway            {stats}")
+    print(f"fallback moves     {fallbacks:8d}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tables", type=int, default=20)
+    parser.add_argument("--bots", type=int, default=3)
+    parser.add_argument("--hands", type=int, default=2)
+    parser.add_argument(
+        "--latency", default="lognormal", choices=["fixed", "uniform", "lognormal"]
+    )
+    parser.add_argument(
+        "--median", type=float, default=0.8, help="Median model latency (s)"
+    )
+    parser.add_argument("--spread", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument(
+        "--rate", type=float, default=0.0, help="Calls/s (0 = unlimited)"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log every AI move")
+    args = parser.parse_args()
+    if not args.verbose:
+        logging.getLogger("five_card_poker").setLevel(logging.CRITICAL)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
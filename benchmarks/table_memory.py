@@ -0,0 +1,78 @@
+"""
+Memory cost of holding many seated tables in one process.
+
+Builds tables seated with rule-based bots (no API key, so no model calls
+and no strategy caches to skew the numbers), optionally plays hands on
+each so they hold dealt cards and chat history, then reports the traced
+bytes per table:
+
+    python benchmarks/table_memory.py --tables 10000 --seats 3 --hands 1
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import tracemalloc
+from typing import List
+from five_card_poker.chat import ChatManager
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.ai import GeminiPokerAgent
+
+
+def build_table(table_id: str, seats: int) -> Table:
+    table = Table(chat_manager=ChatManager(), table_id=table_id)
+    for i in range(seats):
+        table.add_player(
+            Player(
+                id=f"bot{i}",
+                name=f"Bot {i}",
+                type=PlayerType.AI,
+                agent=GeminiPokerAgent(api_key=None),
+            )
+        )
+    return table
+
+
+async def play(tables: List[Table], hands: int) -> None:
+    for _ in range(hands):
+        for table in tables:
+            for player in table.players:
+                player.balance = max(player.balance, 100)
+            await table.actor.submit("start", 5)
+            await table.actor.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tables", type=int, default=10000)
+    parser.add_argument("--seats", type=int, default=3)
+    parser.add_argument(
+        "--hands", type=int, default=0, help="Hands to play on each table first"
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # Keyless agents warn once each
+
+    # Import-time data (such as the interned cards) is not per table
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    tables = [build_table(f"t{i}", args.seats) for i in range(args.tables)]
+    asyncio.run(play(tables, args.hands))
+    gc.collect()
+
+    after = tracemalloc.take_snapshot()
+    stats = after.compare_to(before, "filename")
+    total = sum(stat.size_diff for stat in stats)
+    print(f"tables:          {len(tables)}")
+    print(f"seats per table: {args.seats}")
+    print(f"hands played:    {args.hands}")
+    print(f"bytes per table: {total / len(tables):,.0f}")
+    print("top allocation sites per table:")
+    for stat in stats[:5]:
+        print(f"  {stat.size_diff / len(tables):>10,.0f}  {stat.traceback[0].filename}")
+
+
+if __name__ == "__main__":
+    main()
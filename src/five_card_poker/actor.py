@@ -0,0 +1,238 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple, TYPE_CHECKING
+from .models import PlayerType
+from .metrics import TABLE_COMMAND_SECONDS, TABLE_QUEUE_WAIT_SECONDS
+
+if TYPE_CHECKING:
+    from .logic import Table
+    from .persistence import TableStore
+    from .speculation import Speculator
+
+logger = logging.getLogger(__name__)
+
+ACTING_PHASES = ("betting_1", "betting_2", "drawing")
+
+# Command name -> Table method applied by the actor.
+COMMANDS = {
+    "start": "start_game",
+    "action": "handle_action",
+    "draw": "handle_draw",
+    "shuffle": "shuffle",
+    "ai_move": "process_ai_turn",
+}
+
+
+class TableActor:
+    """
+    Serializes every mutation of a Table through a single command queue.
+
+    Commands are applied one at a time, in submission order, by a drain task
+    that only exists while there is work queued. After each command the table
+    republishes its snapshot and, if an AI player is up next, an AI move is
+    queued behind it, so there is never more than one AI loop per table.
+
+    When the table enters the drawing phase every AI player's draw decision
+    is requested at once; the results are applied in seat order as each
+    bot's turn comes up, so the phase costs one model round trip, not one
+    per bot. With a `speculator` attached, the next AI's betting decision is
+    likewise computed ahead while a human is on turn.
+    """
+
+    def __init__(self, table: "Table") -> None:
+        self.table = table
+        # (command, args, caller's future, enqueue time)
+        self._queue: Deque[
+            Tuple[str, Tuple[Any, ...], Optional[asyncio.Future], float]
+        ] = deque()
+        self._worker: Optional[asyncio.Task] = None
+        self._ai_pending: bool = False
+        # Player id -> in-flight draw decision for the current drawing phase
+        self._draw_prefetch: Dict[str, asyncio.Task] = {}
+        self._draw_prefetched: bool = False
+        # Durable log of applied commands, attached by the registry if enabled
+        self.journal: Optional["TableStore"] = None
+        # Optional speculative executor for AI betting, attached by the registry
+        self.speculator: Optional["Speculator"] = None
+        self._detached = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    @property
+    def idle(self) -> bool:
+        """No command queued or being applied."""
+        worker = self._worker
+        return not self._queue and (worker is None or worker.done())
+
+    @property
+    def ai_in_flight(self) -> int:
+        """AI decisions running in the background ahead of their turn."""
+        count = sum(1 for task in self._draw_prefetch.values() if not task.done())
+        if self.speculator is not None:
+            count += self.speculator.stats()["in_flight"]
+        return count
+
+    async def submit(self, command: str, *args: Any) -> Any:
+        """Enqueue a command and wait until the actor has applied it."""
+        if command not in COMMANDS:
+            raise ValueError(f"Unknown command: {command}")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((command, args, future, time.perf_counter()))
+        self._ensure_worker()
+        return await future
+
+    def kick(self) -> None:
+        """Queue an AI move if an AI player is waiting to act."""
+        self._schedule_ai_move()
+        if self._queue:
+            self._ensure_worker()
+
+    async def join(self) -> None:
+        """Wait until the queue, including any chained AI moves, is drained."""
+        worker = self._worker
+        if worker is None or worker.done():
+            return
+        if worker.get_loop() is not asyncio.get_running_loop():
+            return
+        await asyncio.shield(worker)
+
+    def detach(self) -> None:
+        """
+        Stop journaling, speculating and scheduling bot moves for this
+        actor's table, e.g. once the registry has replaced it. A command
+        already running still finishes, but it can no longer overwrite the
+        replacement's record.
+        """
+        self._detached = True
+        self.journal = None
+        if self.speculator is not None:
+            self.speculator.discard()
+            self.speculator = None
+        for task in self._draw_prefetch.values():
+            task.cancel()
+        self._draw_prefetch.clear()
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        worker = self._worker
+        if worker is not None and not worker.done() and worker.get_loop() is loop:
+            return
+        self._worker = loop.create_task(self._drain())
+
+    def _ai_to_act(self) -> bool:
+        table = self.table
+        if table.phase not in ACTING_PHASES or not table.players:
+            return False
+        current_player = table.players[table.active_player_idx]
+        return current_player.type == PlayerType.AI and current_player.agent is not None
+
+    def _schedule_ai_move(self) -> None:
+        if self._ai_pending or self._detached or not self._ai_to_act():
+            return
+        self._ai_pending = True
+        self._queue.append(("ai_move", (), None, time.perf_counter()))
+
+    def _prefetch_draws(self) -> None:
+        """Start (or discard) the concurrent draw decisions for this phase."""
+        table = self.table
+        if table.phase != "drawing" or self._detached:
+            for task in self._draw_prefetch.values():
+                task.cancel()
+            self._draw_prefetch.clear()
+            self._draw_prefetched = False
+            return
+        if self._draw_prefetched:
+            return
+        self._draw_prefetched = True
+        loop = asyncio.get_running_loop()
+        for player in table.players:
+            if (
+                player.type != PlayerType.AI
+                or player.agent is None
+                or player.is_folded
+                or not player.is_active
+                or player.has_acted
+            ):
+                continue
+            self._draw_prefetch[player.id] = loop.create_task(
+                player.agent.decide_draw_action(*table.observe(player))
+            )
+
+    async def _precomputed_decision(self) -> Optional[Any]:
+        """A decision for the AI player on turn that is already in flight."""
+        table = self.table
+        if self.speculator is not None:
+            decision = await self.speculator.take(table)
+            if decision is not None:
+                return decision
+        if table.phase != "drawing":
+            return None
+        task = self._draw_prefetch.pop(table.players[table.active_player_idx].id, None)
+        if task is None:
+            return None
+        try:
+            return await task
+        except Exception as e:
+            # Fall back to asking the agent again on its turn
+            logger.warning(f"Prefetched draw decision failed: {e}")
+            return None
+
+    async def _drain(self) -> None:
+        while self._queue:
+            command, args, future, enqueued = self._queue.popleft()
+            if future is not None and future.done():
+                continue  # Caller went away (e.g. request cancelled)
+            started = time.perf_counter()
+            TABLE_QUEUE_WAIT_SECONDS.observe(started - enqueued, command)
+
+            table = self.table
+            turn_before = (table.phase, table.active_player_idx)
+            progressed = True
+            try:
+                if command == "ai_move" and not args:
+                    decision = await self._precomputed_decision()
+                    if decision is not None:
+                        args = (decision,)
+                result = getattr(table, COMMANDS[command])(*args)
+                if asyncio.iscoroutine(result):
+                    result = await result
+            except Exception as e:
+                progressed = False
+                if future is not None:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    logger.error(
+                        f"Error in table actor ({command}): {e}", exc_info=True
+                    )
+            else:
+                if future is not None and not future.done():
+                    future.set_result(result)
+            finally:
+                if command == "ai_move":
+                    self._ai_pending = False
+                    progressed = progressed and turn_before != (
+                        table.phase,
+                        table.active_player_idx,
+                    )
+
+            table.publish()
+            TABLE_COMMAND_SECONDS.observe(time.perf_counter() - started, command)
+            self._prefetch_draws()
+            if self.journal is not None and progressed:
+                self.journal.record(table, command, args)
+            # An AI move that failed or did not advance the turn would only
+            # repeat itself; wait for the next external command instead.
+            if progressed:
+                self._schedule_ai_move()
+            # A queued AI move claims its speculation; otherwise a human may
+            # be on turn, so speculate on their likely moves.
+            if self.speculator is not None and not self._ai_pending:
+                self.speculator.speculate(table)
+
+            # Let readers (e.g. /state polling) run between commands.
+            await asyncio.sleep(0)
@@ -0,0 +1,102 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, List, Optional, Protocol, Tuple
+from .models import PlayerState, TableState
+from .metrics import timed_decision
+
+
+class PokerAgent(Protocol):
+    """What a Table needs from a bot seat. `kind` names the agent for persistence."""
+
+    kind: str
+
+    async def decide_betting_action(
+        self, player_state: PlayerState, table_state: TableState
+    ) -> Tuple[str, int]: ...
+
+    async def decide_draw_action(
+        self, player_state: PlayerState, table_state: TableState
+    ) -> List[int]: ...
+
+    async def decide_chat_response(
+        self,
+        message: str,
+        history: List[str],
+        player_state: PlayerState,
+        table_state: TableState,
+    ) -> str: ...
+
+
+def _run_in_worker(agent: PokerAgent, method: str, *args: Any) -> Any:
+    """Entry point in the pool process: run one agent decision to completion."""
+    return asyncio.run(getattr(agent, method)(*args))
+
+
+class ProcessPoolAgent:
+    """
+    Runs a CPU-bound agent's betting and draw decisions in a process pool.
+
+    The wrapped agent must be picklable; it is sent with each call, so any
+    memoization it keeps at class level lives on in each worker process.
+    The event loop only awaits the result, so heavy bots never stall
+    `/state` or other tables. Chat replies are cheap and stay in-process.
+    """
+
+    def __init__(self, agent: PokerAgent, executor: Executor) -> None:
+        self.agent = agent
+        self.executor = executor
+        self.kind = agent.kind
+
+    async def _submit(self, method: str, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, _run_in_worker, self.agent, method, *args
+        )
+
+    @timed_decision("bet")
+    async def decide_betting_action(
+        self, player_state: PlayerState, table_state: TableState
+    ) -> Tuple[str, int]:
+        return await self._submit("decide_betting_action", player_state, table_state)
+
+    @timed_decision("draw")
+    async def decide_draw_action(
+        self, player_state: PlayerState, table_state: TableState
+    ) -> List[int]:
+        return await self._submit("decide_draw_action", player_state, table_state)
+
+    async def decide_chat_response(
+        self,
+        message: str,
+        history: List[str],
+        player_state: PlayerState,
+        table_state: TableState,
+    ) -> str:
+        return await self.agent.decide_chat_response(
+            message, history, player_state, table_state
+        )
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def shared_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """The process pool shared by every pooled agent, created on first use."""
+    global _executor
+    if _executor is None:
+        # Spawned, not forked: by now the store and chat-log writer threads
+        # are running, and forking a threaded process can deadlock the child
+        _executor = ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -4,24 +4,60 @@ import logging
 from google import genai
 from typing import List, Tuple, Optional
 from .models import PlayerState, TableState, Hand
+from .cache import ChatReplyCache, DecisionCache
+from .gateway import GatewayBusyError, LLMGateway
+from .clients import ClientPool
+from .metrics import AI_FALLBACKS, timed_decision
 
 logger = logging.getLogger(__name__)
 
 
 class GeminiPokerAgent:
+    kind = "gemini"
+
     def __init__(
-        self, api_key: Optional[str] = None, model_name: str = "gemini-2.5-pro"
+        self,
+        api_key: Optional[str] = None,
+        model_name: str = "gemini-2.5-pro",
+        decision_cache: Optional[DecisionCache] = None,
+        gateway: Optional[LLMGateway] = None,
+        client_pool: Optional[ClientPool] = None,
+        chat_cache: Optional[ChatReplyCache] = None,
     ):
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
         self.model_name = model_name
+        self.decision_cache = decision_cache
+        self.gateway = gateway
+        self.chat_cache = chat_cache
         self.client = None
-        if self.api_key:
+        if self.api_key and client_pool is not None:
+            self.client = client_pool.borrow(self.api_key)
+        elif self.api_key:
             self.client = genai.Client(api_key=self.api_key)
         else:
             logger.warning(
                 "No API key found for GeminiPokerAgent. Falling back to rule-based logic."
             )
 
+    @property
+    def _model_available(self) -> bool:
+        return self.client is not None and (
+            self.gateway is None or self.gateway.available
+        )
+
+    async def _generate(self, prompt: str):
+        client = self.client
+        if client is None:
+            raise RuntimeError("GeminiPokerAgent has no model client")
+        kwargs = dict(
+            model=self.model_name,
+            contents=prompt,
+            config={"response_mime_type": "application/json"},
+        )
+        if self.gateway is not None:
+            return await self.gateway.generate(client, **kwargs)
+        return await client.aio.models.generate_content(**kwargs)
+
     def _format_hand(self, hand: Optional[Hand]) -> str:
         if not hand:
             return "Unknown"
@@ -59,12 +95,28 @@ class GeminiPokerAgent:
         held = [i for i, c in enumerate(player_state.hand.cards) if counts[c.rank] >= 2]
         return held
 
+    @timed_decision("bet")
     async def decide_betting_action(
         self, player_state: PlayerState, table_state: TableState
     ) -> Tuple[str, int]:
-        if not self.client:
+        if not self._model_available:
+            AI_FALLBACKS.inc("bet", "unavailable")
             return self._rule_based_betting(player_state, table_state)
 
+        cache = self.decision_cache
+        key = None
+        if cache is not None:
+            _, key = cache.situation_key(
+                "bet", self.model_name, player_state, table_state
+            )
+            cached = cache.lookup(key)
+            if cached is not None:
+                action, raise_by = cached
+                # Raises are cached relative to the bet they were made over
+                if action == "raise":
+                    return action, table_state.current_bet + raise_by
+                return action, 0
+
         hand_str = self._format_hand(player_state.hand)
         prompt = f"""
         You are playing 5-Card Draw Poker.
@@ -89,26 +141,45 @@ class GeminiPokerAgent:
         """
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config={"response_mime_type": "application/json"},
-            )
+            response = await self._generate(prompt)
             if response.text:
                 data = json.loads(response.text)
-                return data.get("action", "fold"), data.get("amount", 0)
+                action, amount = data.get("action", "fold"), data.get("amount", 0)
+                if cache is not None and isinstance(amount, int):
+                    raise_by = amount - table_state.current_bet
+                    cache.put(key, (action, raise_by if action == "raise" else 0))
+                return action, amount
             else:
+                AI_FALLBACKS.inc("bet", "empty")
                 return self._rule_based_betting(player_state, table_state)
+        except GatewayBusyError:
+            AI_FALLBACKS.inc("bet", "busy")
+            return self._rule_based_betting(player_state, table_state)
         except Exception as e:
             logger.error(f"Gemini Betting Error: {e}")
+            AI_FALLBACKS.inc("bet", "error")
             return self._rule_based_betting(player_state, table_state)
 
+    @timed_decision("draw")
     async def decide_draw_action(
         self, player_state: PlayerState, table_state: TableState
     ) -> List[int]:
-        if not self.client:
+        if not self._model_available:
+            AI_FALLBACKS.inc("draw", "unavailable")
             return self._rule_based_draw(player_state)
 
+        cache = self.decision_cache
+        key = None
+        order: Tuple[int, ...] = ()
+        if cache is not None:
+            order, key = cache.situation_key(
+                "draw", self.model_name, player_state, table_state
+            )
+            cached = cache.lookup(key)
+            if cached is not None:
+                # Cached holds are positions in canonical order; map them back
+                return sorted(order[i] for i in cached)
+
         hand_str = self._format_hand(player_state.hand)
         prompt = f"""
         You are playing 5-Card Draw Poker. It is the Draw phase.
@@ -124,20 +195,28 @@ class GeminiPokerAgent:
         """
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config={"response_mime_type": "application/json"},
-            )
+            response = await self._generate(prompt)
             if response.text:
                 data = json.loads(response.text)
-                return data.get("held_indices", [])
+                held = data.get("held_indices", [])
+                if cache is not None and all(
+                    isinstance(i, int) and 0 <= i < len(order) for i in held
+                ):
+                    position = {idx: pos for pos, idx in enumerate(order)}
+                    cache.put(key, tuple(sorted(position[i] for i in held)))
+                return held
             else:
+                AI_FALLBACKS.inc("draw", "empty")
                 return self._rule_based_draw(player_state)
+        except GatewayBusyError:
+            AI_FALLBACKS.inc("draw", "busy")
+            return self._rule_based_draw(player_state)
         except Exception as e:
             logger.error(f"Gemini Draw Error: {e}")
+            AI_FALLBACKS.inc("draw", "error")
             return self._rule_based_draw(player_state)
 
+    @timed_decision("chat")
     async def decide_chat_response(
         self,
         message: str,
@@ -145,9 +224,20 @@ class GeminiPokerAgent:
         player_state: PlayerState,
         table_state: TableState,
     ) -> str:
-        if not self.client:
+        if not self._model_available:
+            AI_FALLBACKS.inc("chat", "unavailable")
             return "Nice move."
 
+        chat_cache = self.chat_cache
+        key = None
+        if chat_cache is not None:
+            key = chat_cache.context_key(
+                self.model_name, message, player_state, table_state
+            )
+            cached = chat_cache.pick(key)
+            if cached is not None:
+                return cached
+
         hand_str = self._format_hand(player_state.hand)
         history_str = "\n".join(history[-5:])
 
@@ -171,16 +261,20 @@ class GeminiPokerAgent:
         """
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config={"response_mime_type": "application/json"},
-            )
+            response = await self._generate(prompt)
             if response.text:
                 data = json.loads(response.text)
-                return data.get("response", "Good luck, you'll need it.")
+                reply = data.get("response", "Good luck, you'll need it.")
+                if chat_cache is not None and isinstance(reply, str):
+                    chat_cache.add(key, reply)
+                return reply
             else:
+                AI_FALLBACKS.inc("chat", "empty")
                 return "Nice move."
+        except GatewayBusyError:
+            AI_FALLBACKS.inc("chat", "busy")
+            return "Nice move."
         except Exception as e:
             logger.error(f"Gemini Chat Error: {e}")
+            AI_FALLBACKS.inc("chat", "error")
             return "Nice move."
@@ -0,0 +1,242 @@
+import itertools
+import random
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+from .models import Card, PlayerState, Rank, Suit, TableState
+
+RANK_ORDER = {rank: i for i, rank in enumerate(Rank)}
+SUIT_ORDER = {suit: i for i, suit in enumerate(Suit)}
+SUIT_PERMUTATIONS = list(itertools.permutations(range(len(Suit))))
+SUIT_LABELS = "abcd"
+
+
+class TTLCache:
+    """
+    Small LRU cache whose entries also expire after `ttl` seconds.
+
+    Tracks hits, misses and evictions so callers can report hit rates.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires, value = entry
+        if expires <= self.clock():
+            del self._data[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Like `get`, but without counting a hit or miss or refreshing LRU order."""
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= self.clock():
+            return None
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (self.clock() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+def canonical_hand(cards: Sequence[Card]) -> Tuple[List[int], Tuple[str, ...]]:
+    """
+    Suit-canonical form of a hand.
+
+    Returns the card order used (indices into `cards`, highest rank first)
+    and the hand written in that order under the suit relabelling that sorts
+    first, so hands that differ only by suit names or card order (A♥ K♥ vs
+    K♠ A♠) share the same key.
+    """
+    best: Optional[Tuple[Tuple[Tuple[int, int], ...], List[int]]] = None
+    for perm in SUIT_PERMUTATIONS:
+        keyed = sorted(
+            (-RANK_ORDER[c.rank], perm[SUIT_ORDER[c.suit]], i)
+            for i, c in enumerate(cards)
+        )
+        canon = tuple((rank, suit) for rank, suit, _ in keyed)
+        if best is None or canon < best[0]:
+            best = (canon, [i for _, _, i in keyed])
+    if best is None:
+        return [], ()
+    canon, order = best
+    return order, tuple(
+        f"{cards[i].rank.value}{SUIT_LABELS[suit]}"
+        for i, (_, suit) in zip(order, canon)
+    )
+
+
+def pot_odds_bucket(player_state: PlayerState, table_state: TableState) -> int:
+    to_call = max(table_state.current_bet - player_state.current_bet, 0)
+    if not to_call:
+        return 0
+    return 1 + int(9 * to_call / (table_state.pot + to_call))
+
+
+def stack_bucket(balance: int) -> int:
+    return min(max(balance, 0).bit_length(), 12)
+
+
+class DecisionCache(TTLCache):
+    """
+    Cache of AI betting/draw decisions keyed on a bucketed game situation:
+    suit-canonical hand, pot-odds bucket, stack bucket and phase.
+
+    `explore` is the probability of ignoring a cached answer so the agent
+    asks the model again and refreshes the entry.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float = 600.0,
+        explore: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl, clock=clock)
+        self.explore = explore
+        self.explorations = 0
+        self._rng = rng or random.Random()
+
+    def lookup(self, key: Hashable) -> Optional[Any]:
+        if self.explore and self._rng.random() < self.explore:
+            self.explorations += 1
+            self.misses += 1
+            return None
+        return self.get(key)
+
+    @staticmethod
+    def situation_key(
+        kind: str,
+        model_name: str,
+        player_state: PlayerState,
+        table_state: TableState,
+    ) -> Tuple[Tuple[int, ...], Hashable]:
+        """Key for a decision plus the card order the key was built from."""
+        cards = player_state.hand.cards if player_state.hand else []
+        order, hand = canonical_hand(cards)
+        if kind == "draw":
+            # Which cards to hold depends only on the hand itself
+            return tuple(order), (kind, model_name, hand)
+        key = (
+            kind,
+            model_name,
+            hand,
+            pot_odds_bucket(player_state, table_state),
+            stack_bucket(player_state.balance),
+            table_state.phase,
+        )
+        return tuple(order), key
+
+    def stats(self) -> Dict[str, float]:
+        stats = super().stats()
+        stats["explorations"] = self.explorations
+        return stats
+
+
+def normalize_message(text: str) -> str:
+    """Lower-case, drop punctuation and squeeze stretched letters ("Niiice!!" -> "nice")."""
+    text = re.sub(r"[^a-z0-9\s]", "", text.lower())
+    text = re.sub(r"(.)\1{2,}", r"\1", text)
+    return " ".join(text.split())
+
+
+class ChatReplyCache(TTLCache):
+    """
+    Cache of bot chat replies keyed on the normalized user message plus a
+    coarse game context (phase and the bot's hand category).
+
+    Each key keeps up to `variants` distinct replies and one is picked at
+    random. `fresh` is the probability of asking the model anyway, which
+    keeps adding variants and refreshing stale banter.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float = 1800.0,
+        variants: int = 4,
+        fresh: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl, clock=clock)
+        self.variants = variants
+        self.fresh = fresh
+        self.fresh_picks = 0
+        self._rng = rng or random.Random()
+
+    @staticmethod
+    def context_key(
+        model_name: str,
+        message: str,
+        player_state: PlayerState,
+        table_state: TableState,
+    ) -> Hashable:
+        category = player_state.hand.rank if player_state.hand else None
+        return (model_name, normalize_message(message), table_state.phase, category)
+
+    def pick(self, key: Hashable) -> Optional[str]:
+        if self.fresh and self._rng.random() < self.fresh:
+            self.fresh_picks += 1
+            self.misses += 1
+            return None
+        variants = self.get(key)
+        return self._rng.choice(variants) if variants else None
+
+    def add(self, key: Hashable, reply: str) -> None:
+        variants = list(self.peek(key) or ())
+        if reply in variants:
+            return
+        variants.append(reply)
+        self.put(key, tuple(variants[-self.variants :]))
+
+    def stats(self) -> Dict[str, float]:
+        stats = super().stats()
+        stats["fresh"] = self.fresh_picks
+        return stats
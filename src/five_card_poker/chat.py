@@ -1,24 +1,155 @@
-from typing import List
-from pydantic import BaseModel
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 import time
 import uuid
+from .events import GameEvent, render
+from .fanout import ChatFanout
+
+if TYPE_CHECKING:
+    from .chatlog import ChatLog
+
+# Messages kept per table; older ones fall off the ring buffer.
+CHAT_CAPACITY = 500
 
 
 class ChatMessage(BaseModel):
-    id: str = str(uuid.uuid4())
+    model_config = ConfigDict(frozen=True)
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    seq: int = 0
     player_id: str
     text: str
-    timestamp: float = time.time()
+    timestamp: float = Field(default_factory=time.time)
+
+    _json: Optional[bytes] = PrivateAttr(default=None)
+
+    def encoded(self) -> bytes:
+        """The message as JSON, encoded once and reused by every reader."""
+        # Read the private slot directly; attribute access to pydantic
+        # private attributes costs more than re-encoding
+        private = self.__pydantic_private__
+        assert private is not None  # Set by __init__ on models with private attrs
+        encoded = private["_json"]
+        if encoded is None:
+            encoded = private["_json"] = self.model_dump_json().encode()
+        return encoded
+
+
+def encode_messages(messages: List[ChatMessage]) -> bytes:
+    """A JSON array of messages, joined from their cached encodings."""
+    return b"[" + b",".join(m.encoded() for m in messages) + b"]"
 
 
 class ChatManager:
-    def __init__(self):
-        self.messages: List[ChatMessage] = []
+    """
+    Per-table chat history in a bounded ring buffer.
 
-    def add_message(self, player_id: str, text: str):
-        msg = ChatMessage(player_id=player_id, text=text)
-        self.messages.append(msg)
+    Every message gets the next sequence number for the table, so clients
+    can poll with `get_messages(after=<last seq seen>)` and only receive
+    what is new. With a `ChatLog` attached, messages are also appended to
+    disk, and reads reaching past the ring buffer are served from the log.
+    """
+
+    def __init__(self, capacity: int = CHAT_CAPACITY):
+        self._ring: Deque[ChatMessage] = deque(maxlen=capacity)
+        self.last_seq = 0
+        self.fanout = ChatFanout()
+        self.log: Optional["ChatLog"] = None
+        self.table_id = ""
+
+    def attach_log(
+        self,
+        log: "ChatLog",
+        table_id: str,
+        tail: Optional[Tuple[List[ChatMessage], int]] = None,
+    ) -> None:
+        """
+        Persist this table's chat to `log`. History already in the log
+        (from before a restart or reset) replaces the buffer, and the
+        sequence continues from it. Pass `tail`, the result of `log.tail`
+        read in a worker thread, to keep that disk read off the loop.
+        """
+        if tail is None:
+            tail = log.tail(table_id, self._ring.maxlen or 0)
+        recent, last_seq = tail
+        self.log = log
+        self.table_id = table_id
+        if recent:
+            self._ring.clear()
+            self._ring.extend(recent)
+        self.last_seq = max(self.last_seq, last_seq)
+
+    @property
+    def messages(self) -> List[ChatMessage]:
+        return list(self._ring)
+
+    def add_message(self, player_id: str, text: str, timestamp: Optional[float] = None):
+        self.last_seq += 1
+        msg = ChatMessage(
+            seq=self.last_seq,
+            player_id=player_id,
+            text=text,
+            timestamp=time.time() if timestamp is None else timestamp,
+        )
+        self._ring.append(msg)
+        if self.log is not None:
+            self.log.append(self.table_id, msg)
+        self.fanout.publish(msg)
         return msg
 
-    def get_messages(self, limit: int = 50):
-        return self.messages[-limit:]
+    def on_event(self, event: GameEvent) -> None:
+        """Event bus subscriber: post game events as system messages."""
+        self.add_message("system", render(event))
+
+    def get_messages(self, limit: int = 50, after: Optional[int] = None):
+        """
+        The last `limit` messages, or with `after`, the first `limit`
+        messages whose seq is greater than `after`. Reads reaching past
+        the buffer hit the log on disk; request handlers use
+        `fetch_messages` instead.
+        """
+        if limit <= 0 or (after is not None and after >= self.last_seq):
+            return []
+        messages, older = self._split(limit, after)
+        if self.log is None or older is None:
+            return messages
+        return (self.log.read(self.table_id, **older) + messages)[:limit]
+
+    async def fetch_messages(
+        self, limit: int = 50, after: Optional[int] = None
+    ) -> List[ChatMessage]:
+        """`get_messages` that reads from the log in a worker thread."""
+        if limit <= 0 or (after is not None and after >= self.last_seq):
+            return []
+        # The buffer is sliced before the await, so messages added while
+        # the log is read are neither missed nor repeated by the caller
+        messages, older = self._split(limit, after)
+        if self.log is None or older is None:
+            return messages
+        read = await asyncio.to_thread(self.log.read, self.table_id, **older)
+        return (read + messages)[:limit]
+
+    def _split(
+        self, limit: int, after: Optional[int]
+    ) -> Tuple[List[ChatMessage], Optional[Dict[str, int]]]:
+        """
+        The buffered part of a read, and the `log.read` arguments for the
+        part older than the buffer (None if the buffer covers it).
+        """
+        ring = self._ring
+        first = ring[0].seq if ring else self.last_seq + 1
+        if after is None:
+            messages = list(islice(ring, max(len(ring) - limit, 0), None))
+            if self.log is not None and len(messages) < limit and first > 1:
+                return messages, {"limit": limit - len(messages), "before": first}
+            return messages, None
+        # Sequence numbers are contiguous, so the cursor maps to an offset
+        start = max(after - first + 1, 0)
+        messages = list(islice(ring, start, start + limit))
+        if self.log is not None and after < first - 1:
+            # The cursor is older than the buffer; the log has the gap
+            return messages, {"after": after, "limit": limit, "before": first}
+        return messages, None
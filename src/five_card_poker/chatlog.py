@@ -0,0 +1,311 @@
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+from .chat import ChatMessage
+
+logger = logging.getLogger(__name__)
+
+# One index entry per record: (seq, byte offset in the segment)
+INDEX_ENTRY = struct.Struct("<QQ")
+
+
+class _Segment:
+    """
+    One append-only file of newline-terminated JSON records, named after
+    its first sequence number, with a sidecar `.idx` of (seq, offset).
+    """
+
+    def __init__(self, base: str, created: float) -> None:
+        self.base = base
+        self.created = created
+        self.seqs = array("Q")
+        self.offsets = array("Q")
+        self.size = 0
+
+    @property
+    def log_path(self) -> str:
+        return self.base + ".log"
+
+    @property
+    def idx_path(self) -> str:
+        return self.base + ".idx"
+
+    @classmethod
+    def load(cls, base: str) -> "_Segment":
+        """
+        A segment written before a restart. Its age counts from its first
+        message's timestamp (the file's mtime if it has none), so reopening
+        the log does not restart age-based rotation.
+        """
+        segment = cls(base, os.path.getmtime(base + ".log"))
+        with open(segment.idx_path, "rb") as f:
+            data = f.read()
+        # A crash can leave a partial entry at the end; drop it
+        data = data[: len(data) - len(data) % INDEX_ENTRY.size]
+        for seq, offset in INDEX_ENTRY.iter_unpack(data):
+            segment.seqs.append(seq)
+            segment.offsets.append(offset)
+        with open(segment.log_path, "rb") as f:
+            first = f.readline()
+            segment.size = f.seek(0, os.SEEK_END)
+        if segment.seqs:
+            try:
+                segment.created = ChatMessage.model_validate_json(first).timestamp
+            except ValueError:
+                pass  # Torn first record; keep the mtime
+        return segment
+
+
+class ChatLog:
+    """
+    Persistent per-table chat history as rotating segment files.
+
+    `append` only enqueues; a background thread writes everything queued
+    since its last pass in one batch, the same group-commit shape as
+    `TableStore`. A segment is closed once it reaches `segment_bytes` or
+    has been written to for `segment_seconds`, and only the newest
+    `max_segments` per table are kept.
+
+    Reads go through the in-memory (seq, offset) index and mmap only the
+    records they return, so old history never loads whole files.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 1 << 20,
+        segment_seconds: float = 3600.0,
+        max_segments: int = 16,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.max_segments = max_segments
+        self.clock = clock
+        os.makedirs(directory, exist_ok=True)
+        self._segments: Dict[str, List[_Segment]] = {}
+        self._appended: Dict[str, int] = {}
+        self._lock = threading.Lock()  # Guards the segment index
+        self._queue: "queue.Queue[Optional[Tuple[str, int, bytes]]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="chat-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _table_dir(self, table_id: str) -> str:
+        # Table ids come from clients; never let one name a path
+        return os.path.join(self.directory, "t_" + quote(table_id, safe=""))
+
+    def _index(self, table_id: str) -> List[_Segment]:
+        """The table's segments, oldest first, loaded on first use. Hold `_lock`."""
+        segments = self._segments.get(table_id)
+        if segments is None:
+            segments = []
+            directory = self._table_dir(table_id)
+            if os.path.isdir(directory):
+                names = sorted(n for n in os.listdir(directory) if n.endswith(".idx"))
+                for name in names:
+                    base = os.path.join(directory, name[: -len(".idx")])
+                    if os.path.exists(base + ".log"):
+                        segments.append(_Segment.load(base))
+            self._segments[table_id] = segments
+            written = segments[-1].seqs[-1] if segments and segments[-1].seqs else 0
+            if written > self._appended.get(table_id, 0):
+                self._appended[table_id] = written
+        return segments
+
+    # -- writes (non-blocking) -------------------------------------------
+
+    def append(self, table_id: str, msg: ChatMessage) -> None:
+        """
+        Queue a message; messages must arrive in increasing seq per table.
+        Runs on the event loop, so it only checks the in-memory seq (which
+        `tail` seeds from disk) and never takes the index lock.
+        """
+        if msg.seq <= self._appended.get(table_id, 0):
+            logger.warning(f"Chat log for {table_id} ignored stale seq {msg.seq}")
+            return
+        self._appended[table_id] = msg.seq
+        self._queue.put((table_id, msg.seq, msg.encoded() + b"\n"))
+
+    def flush(self) -> None:
+        """Block until every queued message has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        files: Dict[str, Tuple[_Segment, BinaryIO, BinaryIO]] = {}
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            # Group commit: take everything that queued up during the last write
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            by_table: Dict[str, List[Tuple[int, bytes]]] = {}
+            for item in batch:
+                if item is None:
+                    running = False
+                else:
+                    by_table.setdefault(item[0], []).append((item[1], item[2]))
+
+            try:
+                for table_id, records in by_table.items():
+                    self._write(files, table_id, records)
+            except OSError as e:
+                logger.error(f"Chat log write failed: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+        for _, log_f, idx_f in files.values():
+            log_f.close()
+            idx_f.close()
+
+    def _write(
+        self,
+        files: Dict[str, Tuple[_Segment, BinaryIO, BinaryIO]],
+        table_id: str,
+        records: List[Tuple[int, bytes]],
+    ) -> None:
+        open_file = files.get(table_id)
+        pending: List[Tuple[int, int]] = []
+        size = open_file[0].size if open_file else 0
+        for seq, line in records:
+            if open_file is None or self._full(open_file[0], size):
+                if open_file is not None:
+                    self._commit(open_file, pending, size)
+                    open_file[1].close()
+                    open_file[2].close()
+                    pending = []
+                open_file = files[table_id] = self._open_segment(table_id, seq)
+                size = open_file[0].size
+            open_file[1].write(line)
+            open_file[2].write(INDEX_ENTRY.pack(seq, size))
+            pending.append((seq, size))
+            size += len(line)
+        if open_file is not None:
+            self._commit(open_file, pending, size)
+
+    def _commit(
+        self,
+        open_file: Tuple[_Segment, BinaryIO, BinaryIO],
+        entries: List[Tuple[int, int]],
+        size: int,
+    ) -> None:
+        """Flush a segment's writes, then make them visible to readers."""
+        segment, log_f, idx_f = open_file
+        log_f.flush()
+        idx_f.flush()
+        with self._lock:
+            for seq, offset in entries:
+                segment.seqs.append(seq)
+                segment.offsets.append(offset)
+            segment.size = size
+
+    def _full(self, segment: _Segment, size: Optional[int] = None) -> bool:
+        return (
+            (segment.size if size is None else size) >= self.segment_bytes
+            or self.clock() - segment.created >= self.segment_seconds
+        )
+
+    def _open_segment(
+        self, table_id: str, first_seq: int
+    ) -> Tuple[_Segment, BinaryIO, BinaryIO]:
+        with self._lock:
+            segments = self._index(table_id)
+            if segments and not self._full(segments[-1]):
+                segment = segments[-1]  # Resume the newest segment after a restart
+            else:
+                directory = self._table_dir(table_id)
+                os.makedirs(directory, exist_ok=True)
+                segment = _Segment(
+                    os.path.join(directory, f"{first_seq:012d}"), self.clock()
+                )
+                segments.append(segment)
+                expired = segments[: -self.max_segments]
+                del segments[: -self.max_segments]
+                for old in expired:
+                    for path in (old.log_path, old.idx_path):
+                        os.remove(path)
+        return segment, open(segment.log_path, "ab"), open(segment.idx_path, "ab")
+
+    # -- reads -----------------------------------------------------------
+
+    def last_seq(self, table_id: str) -> int:
+        with self._lock:
+            self._index(table_id)
+        return self._appended.get(table_id, 0)
+
+    def tail(self, table_id: str, limit: int) -> Tuple[List[ChatMessage], int]:
+        """
+        The last `limit` messages and the last seq, once queued writes have
+        landed. Loads the index from disk on first use, so call it off the
+        event loop.
+        """
+        self.flush()
+        return self.read(table_id, limit=limit), self.last_seq(table_id)
+
+    def read(
+        self,
+        table_id: str,
+        after: Optional[int] = None,
+        limit: int = 50,
+        before: Optional[int] = None,
+    ) -> List[ChatMessage]:
+        """
+        Written messages with `after < seq < before`: the first `limit` of
+        them when `after` is given, otherwise the last `limit`.
+        """
+        picks: List[Tuple[_Segment, int, int]] = []
+        with self._lock:
+            segments = self._index(table_id)
+            ranges = []
+            for segment in segments:
+                seqs = segment.seqs
+                lo = bisect_right(seqs, after) if after is not None else 0
+                hi = bisect_left(seqs, before) if before is not None else len(seqs)
+                if lo < hi:
+                    ranges.append((segment, lo, hi))
+            if after is None:
+                ranges.reverse()
+            remaining = limit
+            for segment, lo, hi in ranges:
+                if remaining <= 0:
+                    break
+                if after is None:
+                    lo = max(lo, hi - remaining)
+                else:
+                    hi = min(hi, lo + remaining)
+                picks.append((segment, lo, hi))
+                remaining -= hi - lo
+        if after is None:
+            picks.reverse()
+
+        messages: List[ChatMessage] = []
+        for segment, lo, hi in picks:
+            offsets = segment.offsets[lo:hi]
+            try:
+                f = open(segment.log_path, "rb")
+            except FileNotFoundError:
+                continue  # Rotated out while we were reading
+            with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in offsets:
+                    end = mm.find(b"\n", offset)
+                    messages.append(ChatMessage.model_validate_json(mm[offset:end]))
+        return messages
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+from google import genai
+
+logger = logging.getLogger(__name__)
+
+
+def new_client(api_key: str) -> Any:
+    return genai.Client(api_key=api_key)
+
+
+class ClientPool:
+    """
+    Process-wide pool of genai clients shared by every agent.
+
+    A genai client keeps its HTTP connections alive between calls and is
+    safe to use from many coroutines at once, so agents borrow one of `size`
+    clients per API key (round robin) rather than each opening its own.
+    `warm_up` opens the connections before the first move and `aclose`
+    releases them at shutdown.
+    """
+
+    def __init__(
+        self, size: int = 4, factory: Callable[[str], Any] = new_client
+    ) -> None:
+        self.size = max(size, 1)
+        self.factory = factory
+        self._clients: Dict[str, List[Any]] = {}
+        self._next: Dict[str, int] = {}
+
+    def borrow(self, api_key: str) -> Any:
+        """A shared client for `api_key`; clients are created on first use."""
+        clients = self._clients.setdefault(api_key, [])
+        i = self._next.get(api_key, 0)
+        self._next[api_key] = (i + 1) % self.size
+        if i >= len(clients):
+            clients.append(self.factory(api_key))
+            return clients[-1]
+        return clients[i]
+
+    def fill(self, api_key: str) -> List[Any]:
+        """Create every client for `api_key` up front."""
+        clients = self._clients.setdefault(api_key, [])
+        while len(clients) < self.size:
+            clients.append(self.factory(api_key))
+        return clients
+
+    async def warm_up(
+        self, api_key: Optional[str], model_name: str, timeout: float = 5.0
+    ) -> None:
+        """Fill the pool and open a connection on each client."""
+        if not api_key:
+            return
+        clients = self.fill(api_key)
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(client.aio.models.get(model=model_name), timeout)
+                for client in clients
+            ),
+            return_exceptions=True,
+        )
+        failed = [r for r in results if isinstance(r, BaseException)]
+        if failed:
+            logger.warning(
+                f"Client warm-up failed for {len(failed)} clients: {failed[0]}"
+            )
+        logger.info(f"Warmed up {len(clients) - len(failed)} genai clients")
+
+    async def aclose(self) -> None:
+        for clients in self._clients.values():
+            for client in clients:
+                try:
+                    await client.aio.aclose()
+                    client.close()
+                except Exception as e:
+                    logger.warning(f"Error closing genai client: {e}")
+        self._clients.clear()
+        self._next.clear()
+
+    def __len__(self) -> int:
+        return sum(len(clients) for clients in self._clients.values())
@@ -0,0 +1,238 @@
+import asyncio
+import bisect
+import hashlib
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qs
+import httpx
+import uvicorn
+from .logic import DEFAULT_TABLE_ID
+from .metrics import CONTENT_TYPE, merge_expositions
+
+logger = logging.getLogger(__name__)
+
+# Headers that describe a single connection and must not be forwarded.
+HOP_BY_HOP_HEADERS = {
+    b"connection",
+    b"keep-alive",
+    b"proxy-authenticate",
+    b"proxy-authorization",
+    b"te",
+    b"trailer",
+    b"transfer-encoding",
+    b"upgrade",
+}
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent hash ring mapping table ids to worker indexes.
+
+    Each worker is placed on the ring `replicas` times so tables spread
+    evenly, and adding or removing a worker only moves ~1/N of the tables.
+    """
+
+    def __init__(self, nodes: Iterable[int], replicas: int = 64) -> None:
+        self._ring: List[int] = []
+        self._nodes: Dict[int, int] = {}
+        for node in nodes:
+            for r in range(replicas):
+                point = _hash(f"{node}:{r}")
+                self._nodes[point] = node
+                bisect.insort(self._ring, point)
+
+    def node_for(self, key: str) -> int:
+        if not self._ring:
+            raise ValueError("Hash ring has no nodes")
+        idx = bisect.bisect(self._ring, _hash(key)) % len(self._ring)
+        return self._nodes[self._ring[idx]]
+
+
+def table_id_from_query(query_string: bytes) -> str:
+    values = parse_qs(query_string.decode("latin-1")).get("table_id")
+    return values[0] if values else DEFAULT_TABLE_ID
+
+
+class TableRouter:
+    """
+    ASGI front end that forwards each request to the worker owning its table.
+
+    Requests are routed on the `table_id` query parameter (static assets and
+    requests without one go to the default table's worker) and proxied over
+    the worker's Unix socket with pooled keep-alive connections. Responses are
+    streamed back, so push channels pass through unbuffered. `/metrics` is
+    the exception: it scrapes every worker and merges their metrics.
+    """
+
+    def __init__(self, sockets: List[str]) -> None:
+        self.sockets = sockets
+        self.ring = HashRing(range(len(sockets)))
+        self._clients: Dict[int, httpx.AsyncClient] = {}
+
+    def _client(self, worker: int) -> httpx.AsyncClient:
+        client = self._clients.get(worker)
+        if client is None:
+            client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=self.sockets[worker]),
+                base_url="http://worker",
+                timeout=None,
+            )
+            self._clients[worker] = client
+        return client
+
+    async def aclose(self) -> None:
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await self.aclose()
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        if scope["path"] == "/metrics":
+            await self._scrape(send)
+            return
+
+        query_string = scope.get("query_string", b"")
+        worker = self.ring.node_for(table_id_from_query(query_string))
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        url = scope.get("raw_path") or scope["path"].encode()
+        if query_string:
+            url += b"?" + query_string
+        headers = [
+            (k, v) for k, v in scope["headers"] if k.lower() not in HOP_BY_HOP_HEADERS
+        ]
+
+        client = self._client(worker)
+        request = client.build_request(
+            scope["method"], url.decode("latin-1"), headers=headers, content=body
+        )
+        try:
+            response = await client.send(request, stream=True)
+        except httpx.TransportError as e:
+            logger.error(f"Worker {worker} unavailable: {e}")
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 503,
+                    "headers": [(b"content-type", b"text/plain")],
+                }
+            )
+            await send({"type": "http.response.body", "body": b"Worker unavailable"})
+            return
+
+        try:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": response.status_code,
+                    "headers": [
+                        (k, v)
+                        for k, v in response.headers.raw
+                        if k.lower() not in HOP_BY_HOP_HEADERS
+                    ],
+                }
+            )
+            async for chunk in response.aiter_raw():
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            await response.aclose()
+
+    async def _scrape(self, send) -> None:
+        """Every worker's metrics in one response, labelled by worker index."""
+
+        async def fetch(worker: int) -> Optional[bytes]:
+            try:
+                response = await self._client(worker).get("/metrics")
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.error(f"Worker {worker} metrics unavailable: {e}")
+                return None
+            return response.content
+
+        bodies = await asyncio.gather(*(fetch(i) for i in range(len(self.sockets))))
+        body = merge_expositions(
+            {str(i): body for i, body in enumerate(bodies) if body is not None}
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", CONTENT_TYPE.encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def run_worker(socket_path: str) -> None:
+    """Entry point of a worker process: serve the game app on a Unix socket."""
+    uvicorn.run("five_card_poker.main:app", uds=socket_path, log_level="info")
+
+
+def serve(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: int = 2,
+    socket_dir: Optional[str] = None,
+    startup_timeout: float = 30.0,
+) -> None:
+    """
+    Run `workers` game processes, each owning a shard of tables, behind a
+    table-affinity router listening on host:port. Single box, no broker.
+    """
+    socket_dir = socket_dir or tempfile.mkdtemp(prefix="five-card-poker-")
+    os.makedirs(socket_dir, exist_ok=True)
+    sockets = [os.path.join(socket_dir, f"worker-{i}.sock") for i in range(workers)]
+    for path in sockets:
+        if os.path.exists(path):
+            os.unlink(path)  # Stale socket from a previous run
+
+    ctx = multiprocessing.get_context("spawn")
+    processes = [
+        ctx.Process(target=run_worker, args=(path,), name=f"poker-worker-{i}")
+        for i, path in enumerate(sockets)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while not all(os.path.exists(path) for path in sockets):
+            if time.monotonic() > deadline:
+                raise RuntimeError("Timed out waiting for poker workers to start")
+            time.sleep(0.05)
+
+        logger.info(f"Routing {workers} workers via {socket_dir}")
+        uvicorn.run(TableRouter(sockets), host=host, port=port, log_level="info")
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(timeout=5)
@@ -0,0 +1,100 @@
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import Card
+
+# Keyed by rank value so `Rank` members (a str enum) look up directly
+RANK_VALUES = {
+    "2": 2,
+    "3": 3,
+    "4": 4,
+    "5": 5,
+    "6": 6,
+    "7": 7,
+    "8": 8,
+    "9": 9,
+    "10": 10,
+    "J": 11,
+    "Q": 12,
+    "K": 13,
+    "A": 14,
+}
+
+
+def hand_key(cards: Sequence["Card"]) -> Tuple[Tuple[int, ...], bool]:
+    """Everything a hand's strength depends on: sorted values and flushness."""
+    values = tuple(sorted((RANK_VALUES[c.rank] for c in cards), reverse=True))
+    return values, len({c.suit for c in cards}) == 1
+
+
+@lru_cache(maxsize=None)
+def _evaluate(values: Tuple[int, ...], is_flush: bool) -> Tuple[int, str]:
+    # At most 6,175 value multisets x flush, so the cache stays small
+    counts = Counter(values)
+    sorted_counts = counts.most_common()
+
+    is_straight = False
+    high_val = values[0]
+
+    unique_values = sorted(set(values))
+    if len(unique_values) == 5:
+        if unique_values[-1] - unique_values[0] == 4:
+            is_straight = True
+        elif unique_values == [2, 3, 4, 5, 14]:
+            is_straight = True
+            high_val = 5  # Wheel high card is 5
+
+    if is_flush and is_straight and values == (14, 13, 12, 11, 10):
+        return 900, "Royal Flush"
+    if is_flush and is_straight:
+        return 800 + high_val, "Straight Flush"
+    if sorted_counts[0][1] == 4:
+        return 700 + sorted_counts[0][0], "Four of a Kind"
+    if sorted_counts[0][1] == 3 and sorted_counts[1][1] == 2:
+        return 600 + sorted_counts[0][0], "Full House"
+    if is_flush:
+        return 500 + high_val, "Flush"
+    if is_straight:
+        return 400 + high_val, "Straight"
+    if sorted_counts[0][1] == 3:
+        return 300 + sorted_counts[0][0], "Three of a Kind"
+    if sorted_counts[0][1] == 2 and sorted_counts[1][1] == 2:
+        return 200 + max(sorted_counts[0][0], sorted_counts[1][0]), "Two Pair"
+    if sorted_counts[0][1] == 2:
+        return 100 + sorted_counts[0][0], "One Pair"
+    return high_val, "High Card"
+
+
+def evaluate_hand(cards: Sequence["Card"]) -> Tuple[int, str]:
+    """
+    (score, rank name) for five cards. Results are cached by `hand_key`,
+    so the same hand in any suits or order is only worked out once.
+    """
+    if len(cards) != 5:
+        return 0, "Invalid Hand"
+    return _evaluate(*hand_key(cards))
+
+
+def evaluate_values(values: Iterable[int], is_flush: bool) -> Tuple[int, str]:
+    """`evaluate_hand` from five card values (2-14) in any order."""
+    return _evaluate(tuple(sorted(values, reverse=True)), is_flush)
+
+
+def evaluate_many(hands: Iterable[Sequence["Card"]]) -> list[Tuple[int, str]]:
+    """`evaluate_hand` over several hands in one pass, e.g. at showdown."""
+    return [evaluate_hand(cards) for cards in hands]
+
+
+def stats() -> dict:
+    """Evaluator calls and how many the cache answered."""
+    info = _evaluate.cache_info()
+    calls = info.hits + info.misses
+    return {
+        "calls": calls,
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "hit_rate": info.hits / calls if calls else 0.0,
+    }
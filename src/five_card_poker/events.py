@@ -0,0 +1,76 @@
+import logging
+from typing import Callable, Dict, List, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class GameEvent(NamedTuple):
+    """
+    One state transition on a table. `player` is the acting player's name;
+    `amount` and `detail` carry the kind-specific value (bet, ante, pot,
+    cards drawn, hand score; hand rank).
+    """
+
+    kind: str
+    player: str = ""
+    amount: int = 0
+    detail: str = ""
+
+
+# Chat text for each event kind, filled from the event's fields
+TEMPLATES: Dict[str, str] = {
+    "shuffle": "Deck shuffled.",
+    "start": "Game started. Ante: ${amount}",
+    "turn": "{player}'s turn.",
+    "fold": "{player} folds.",
+    "call": "{player} calls.",
+    "raise": "{player} raises to {amount}.",
+    "check": "{player} checks.",
+    "draw_phase": "Drawing Phase. Choose cards to replace.",
+    "draw": "{player} drew {amount} cards.",
+    "draw_turn": "{player}'s turn to draw.",
+    "betting_2": "Second Betting Phase.",
+    "showdown": "--- Showdown ---",
+    "show": "{player} shows {detail} ({amount})",
+    "win": "{player} wins ${amount}!",
+    "win_uncontested": "{player} wins ${amount} (all others folded).",
+}
+
+
+def render(event: GameEvent) -> str:
+    """Human-readable text for an event, as shown in the table chat."""
+    return TEMPLATES[event.kind].format(**event._asdict())
+
+
+class EventBus:
+    """
+    Per-table publisher of `GameEvent`s.
+
+    The game engine publishes plain fields; the event tuple is only built
+    when someone is subscribed, and turning it into text is left to the
+    subscribers that want text (see `ChatManager.on_event`). A table
+    nobody watches pays one attribute check per transition.
+    """
+
+    def __init__(self) -> None:
+        self.subscribers: List[Callable[[GameEvent], None]] = []
+
+    def subscribe(self, callback: Callable[[GameEvent], None]) -> None:
+        if callback not in self.subscribers:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[GameEvent], None]) -> None:
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def publish(
+        self, kind: str, player: str = "", amount: int = 0, detail: str = ""
+    ) -> None:
+        if not self.subscribers:
+            return
+        event = GameEvent(kind, player, amount, detail)
+        for callback in self.subscribers:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Event subscriber failed on {kind}: {e}", exc_info=True)
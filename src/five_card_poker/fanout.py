@@ -0,0 +1,77 @@
+import asyncio
+from collections import deque
+from typing import Deque, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .chat import ChatMessage
+
+# Frames a subscriber may fall behind by before its oldest ones are dropped
+SUBSCRIBER_BACKLOG = 256
+
+
+def encode_frame(msg: "ChatMessage") -> bytes:
+    """A chat message as one server-sent event, with its seq as the event id."""
+    return b"id: %d\ndata: %s\n\n" % (msg.seq, msg.encoded())
+
+
+class Subscription:
+    """
+    One listener's bounded queue of encoded frames.
+
+    A slow consumer never holds up the publisher: when the queue is full
+    the oldest frame is dropped and counted in `dropped`.
+    """
+
+    def __init__(self, maxsize: int = SUBSCRIBER_BACKLOG) -> None:
+        self._frames: Deque[bytes] = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def push(self, frame: bytes) -> None:
+        if len(self._frames) == self._frames.maxlen:
+            self.dropped += 1
+        self._frames.append(frame)
+        self._ready.set()
+
+    async def get(self) -> List[bytes]:
+        """Wait for frames, then take everything queued so far."""
+        await self._ready.wait()
+        self._ready.clear()
+        frames = list(self._frames)
+        self._frames.clear()
+        return frames
+
+
+class ChatFanout:
+    """
+    Per-table pub/sub for chat push channels.
+
+    Each message is encoded once and the same bytes object is queued for
+    every subscriber, so publishing costs one serialization plus one
+    deque append per listener. Nothing is encoded while nobody listens.
+    """
+
+    def __init__(self, backlog: int = SUBSCRIBER_BACKLOG) -> None:
+        self.backlog = backlog
+        self.subscribers: List[Subscription] = []
+        self.published = 0
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.backlog)
+        self.subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        if subscription in self.subscribers:
+            self.subscribers.remove(subscription)
+
+    def publish(self, msg: "ChatMessage") -> None:
+        if not self.subscribers:
+            return
+        frame = encode_frame(msg)
+        for subscription in self.subscribers:
+            subscription.push(frame)
+        self.published += 1
@@ -0,0 +1,239 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the model while the circuit breaker is open."""
+
+
+class GatewayBusyError(Exception):
+    """Raised when a call got no rate token or concurrency slot in time."""
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: `rate` tokens per second, bursts up to
+    `capacity`. A rate of 0 disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self._updated = clock()
+
+    def try_acquire(self) -> float:
+        """Take a token; returns 0 on success, else seconds until one is free."""
+        if self.rate <= 0:
+            return 0.0
+        now = self.clock()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    async def acquire(self) -> None:
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failures. After `reset_after`
+    seconds one trial call is let through (half-open); its success closes
+    the breaker again, its failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        reset_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.clock = clock
+        self.failures = 0
+        self.trips = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self.clock() - self._opened_at >= self.reset_after:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_cancelled(self) -> None:
+        """A call was cancelled before it had an outcome; free the trial slot."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        # Calls already in flight when the breaker opened don't re-open it
+        if self._probing or (
+            self._opened_at is None and self.failures >= self.threshold
+        ):
+            self.trips += 1
+            self._opened_at = self.clock()
+            self._probing = False
+            logger.warning(f"LLM circuit breaker opened after {self.failures} failures")
+
+
+class LLMGateway:
+    """
+    Process-wide front door for model calls shared by every agent.
+
+    Each call waits up to `queue_timeout` seconds for a rate-limit token
+    and a concurrency slot (else `GatewayBusyError`), then the model must
+    answer within `timeout` seconds. Only the model call's own failures
+    and timeouts feed the circuit breaker, so local saturation never opens
+    it; while it is open calls fail fast with `CircuitOpenError`. Agents
+    fall back to their rule-based moves on any of these.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        timeout: float = 10.0,
+        queue_timeout: Optional[float] = None,
+        rate: float = 5.0,
+        burst: float = 10.0,
+        failure_threshold: int = 5,
+        reset_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.timeout = timeout
+        self.queue_timeout = timeout if queue_timeout is None else queue_timeout
+        self.max_concurrency = max_concurrency
+        # Created on first use inside the serving loop: on Python 3.9 an
+        # asyncio primitive binds to the loop current when it is built, and
+        # the gateway is built at import time
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.bucket = TokenBucket(rate, burst, clock=clock)
+        self.breaker = CircuitBreaker(failure_threshold, reset_after, clock=clock)
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.busy = 0
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """The concurrency limiter for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    @property
+    def available(self) -> bool:
+        """False while the breaker is open and calls would be rejected."""
+        return self.breaker.state != "open"
+
+    async def generate(self, client: Any, **kwargs: Any) -> Any:
+        """`client.aio.models.generate_content(**kwargs)` under the gateway's limits."""
+        if not self.available:
+            self.rejected += 1
+            raise CircuitOpenError("LLM circuit breaker is open")
+        semaphore = self.semaphore
+        if not await self._admit(semaphore):
+            self.busy += 1
+            raise GatewayBusyError(
+                f"No model call slot free within {self.queue_timeout}s"
+            )
+        try:
+            # Checked again once admitted: the breaker may have opened, and
+            # a half-open trial is only claimed by a call that will run now
+            if not self.breaker.allow():
+                self.rejected += 1
+                raise CircuitOpenError("LLM circuit breaker is open")
+            self.calls += 1
+            try:
+                response = await asyncio.wait_for(
+                    client.aio.models.generate_content(**kwargs), timeout=self.timeout
+                )
+            except asyncio.CancelledError:
+                self.breaker.record_cancelled()
+                raise
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                self.breaker.record_failure()
+                raise
+            except Exception:
+                self.failures += 1
+                self.breaker.record_failure()
+                raise
+            self.breaker.record_success()
+            return response
+        finally:
+            semaphore.release()
+
+    async def _admit(self, semaphore: asyncio.Semaphore) -> bool:
+        """Take a rate token and a slot within `queue_timeout`; False if not."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.queue_timeout
+        try:
+            await asyncio.wait_for(self.bucket.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            return False
+        acquire = asyncio.ensure_future(semaphore.acquire())
+
+        def give_back(task: "asyncio.Future[Any]") -> None:
+            # The slot was granted before the cancel landed; return it
+            if not task.cancelled():
+                semaphore.release()
+
+        try:
+            await asyncio.wait((acquire,), timeout=max(deadline - loop.time(), 0))
+        finally:
+            if not acquire.done():
+                acquire.cancel()
+                acquire.add_done_callback(give_back)
+        return acquire.done() and not acquire.cancelled()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "busy": self.busy,
+            "breaker": self.breaker.state,
+            "breaker_trips": self.breaker.trips,
+        }
@@ -1,16 +1,23 @@
 import random
 import logging
-import asyncio
 from collections import Counter
-from typing import List, Optional, Tuple, TYPE_CHECKING
-from .models import Card, Suit, Rank, Hand, PlayerType, PlayerState, TableState
-from .ai import GeminiPokerAgent
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from .models import DECK, Card, Suit, Rank, Hand, PlayerType, PlayerState, TableState
+from .agents import PokerAgent
+from .evaluator import evaluate_hand
+from .events import EventBus
+from .actor import TableActor
+from .replies import ChatReplier
+from .snapshot import TableSnapshot
 
 if TYPE_CHECKING:
     from .chat import ChatManager
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TABLE_ID = "default"
+MAX_SEATS = 10
+
 
 class GameLogic:
     def __init__(self) -> None:
@@ -22,7 +29,7 @@ class GameLogic:
         self.shuffle()
 
     def _create_deck(self) -> List[Card]:
-        return [Card(suit=s, rank=r) for s in Suit for r in Rank]
+        return list(DECK)
 
     def shuffle(self) -> None:
         self.deck = self._create_deck()
@@ -38,8 +45,7 @@ class GameLogic:
         self.balance -= bet
         self.shuffle()
         cards = [self.deck.pop() for _ in range(5)]
-        score, rank_name = self.evaluate_hand(cards)
-        self.current_hand = Hand(cards=cards, rank=rank_name, score=score)
+        self.current_hand = Hand(cards=cards)
         self.phase = "drawing"
         return self.current_hand
 
@@ -59,8 +65,7 @@ class GameLogic:
                 self.shuffle()
             new_cards[i] = self.deck.pop()
 
-        score, rank_name = self.evaluate_hand(new_cards)
-        self.current_hand = Hand(cards=new_cards, rank=rank_name, score=score)
+        self.current_hand = Hand(cards=new_cards)
         self.phase = "result"
         return self.current_hand
 
@@ -79,87 +84,70 @@ class GameLogic:
         }
         return payouts.get(hand_rank, 0) * bet
 
-    @staticmethod
-    def _rank_value(rank: Rank) -> int:
-        mapping = {
-            Rank.TWO: 2,
-            Rank.THREE: 3,
-            Rank.FOUR: 4,
-            Rank.FIVE: 5,
-            Rank.SIX: 6,
-            Rank.SEVEN: 7,
-            Rank.EIGHT: 8,
-            Rank.NINE: 9,
-            Rank.TEN: 10,
-            Rank.JACK: 11,
-            Rank.QUEEN: 12,
-            Rank.KING: 13,
-            Rank.ACE: 14,
-        }
-        return mapping[rank]
-
     def evaluate_hand(self, cards: list[Card]) -> Tuple[int, str]:
-        if len(cards) != 5:
-            return 0, "Invalid Hand"
-
-        values = sorted([self._rank_value(c.rank) for c in cards], reverse=True)
-        suits = [c.suit for c in cards]
-        counts = Counter(values)
-        sorted_counts = counts.most_common()
-
-        is_flush = len(set(suits)) == 1
-        is_straight = False
-        high_val = values[0]
-
-        unique_values = sorted(list(set(values)))
-        if len(unique_values) == 5:
-            if unique_values[-1] - unique_values[0] == 4:
-                is_straight = True
-            elif unique_values == [2, 3, 4, 5, 14]:
-                is_straight = True
-                high_val = 5  # Wheel high card is 5
-
-        if is_flush and is_straight and values == [14, 13, 12, 11, 10]:
-            return 900, "Royal Flush"
-        if is_flush and is_straight:
-            return 800 + high_val, "Straight Flush"
-        if sorted_counts[0][1] == 4:
-            return 700 + sorted_counts[0][0], "Four of a Kind"
-        if sorted_counts[0][1] == 3 and sorted_counts[1][1] == 2:
-            return 600 + sorted_counts[0][0], "Full House"
-        if is_flush:
-            return 500 + high_val, "Flush"
-        if is_straight:
-            return 400 + high_val, "Straight"
-        if sorted_counts[0][1] == 3:
-            return 300 + sorted_counts[0][0], "Three of a Kind"
-        if sorted_counts[0][1] == 2 and sorted_counts[1][1] == 2:
-            return 200 + max(sorted_counts[0][0], sorted_counts[1][0]), "Two Pair"
-        if sorted_counts[0][1] == 2:
-            return 100 + sorted_counts[0][0], "One Pair"
-        return high_val, "High Card"
+        return evaluate_hand(cards)
 
 
 class Player:
+    # Slotted: a process may hold tens of thousands of seated tables
+    __slots__ = (
+        "id",
+        "name",
+        "type",
+        "balance",
+        "hand",
+        "current_bet",
+        "last_action",
+        "has_acted",
+        "agent",
+        "seat",
+        "_table",
+        "_is_folded",
+        "_is_active",
+    )
+
     def __init__(
         self,
         id: str,
         name: str,
         type: PlayerType = PlayerType.HUMAN,
         balance: int = 100,
-        agent: Optional[GeminiPokerAgent] = None,
+        agent: Optional[PokerAgent] = None,
     ):
         self.id: str = id
         self.name: str = name
         self.type: PlayerType = type
         self.balance: int = balance
         self.hand: Optional[Hand] = None
-        self.is_folded: bool = False
         self.current_bet: int = 0
         self.last_action: str = ""
-        self.is_active: bool = True
         self.has_acted: bool = False
-        self.agent: Optional[GeminiPokerAgent] = agent
+        self.agent: Optional[PokerAgent] = agent
+        # Seat bookkeeping, set when the player is added to a Table
+        self.seat: int = -1
+        self._table: Optional["Table"] = None
+        self._is_folded: bool = False
+        self._is_active: bool = True
+
+    @property
+    def is_folded(self) -> bool:
+        return self._is_folded
+
+    @is_folded.setter
+    def is_folded(self, value: bool) -> None:
+        self._is_folded = value
+        if self._table is not None:
+            self._table._update_live(self)
+
+    @property
+    def is_active(self) -> bool:
+        return self._is_active
+
+    @is_active.setter
+    def is_active(self, value: bool) -> None:
+        self._is_active = value
+        if self._table is not None:
+            self._table._update_live(self)
 
     def to_state(self, hide_hand: bool = True) -> PlayerState:
         return PlayerState(
@@ -176,8 +164,24 @@ class Player:
         )
 
 
+class _TableView:
+    """Per-change cache behind `Table.to_state`: the public seats and fields."""
+
+    __slots__ = ("players", "fields", "own")
+
+    def __init__(self, players: List[PlayerState], fields: Dict[str, Any]) -> None:
+        self.players = players
+        self.fields = fields
+        self.own: Dict[str, PlayerState] = {}
+
+
 class Table:
-    def __init__(self, chat_manager: Optional["ChatManager"] = None) -> None:
+    def __init__(
+        self,
+        chat_manager: Optional["ChatManager"] = None,
+        table_id: str = DEFAULT_TABLE_ID,
+    ) -> None:
+        self.id: str = table_id
         self.players: List[Player] = []
         self.deck: List[Card] = []
         self.pot: int = 0
@@ -186,26 +190,132 @@ class Table:
         self.active_player_idx: int = 0
         self.dealer_idx: int = 0
         self.evaluator: GameLogic = GameLogic()  # Use existing evaluation logic
-        self.chat_manager: Optional["ChatManager"] = chat_manager
-        self._lock: asyncio.Lock = asyncio.Lock()
+        self.events: EventBus = EventBus()
+        self._chat_manager: Optional["ChatManager"] = None
+        self.chat_manager = chat_manager
+        self.spectators: List[str] = []
+        # Seat indexes: player id -> seat, plus one bit per seat for players
+        # still in the hand (active and not folded) and for players who are
+        # done with the current round (acted and matched, all-in, or drawn).
+        self._seat_index: Dict[str, int] = {}
+        self._live_mask: int = 0
+        self._settled_mask: int = 0
+        self._all_in_mask: int = 0
+        self.version: int = 0
+        self.snapshot: Optional[TableSnapshot] = None
+        # Cached `to_state` view; every engine change clears it
+        self._view: Optional[_TableView] = None
+        self.actor: TableActor = TableActor(self)
+        self.replier: ChatReplier = ChatReplier(self)
+
+    @property
+    def chat_manager(self) -> Optional["ChatManager"]:
+        return self._chat_manager
+
+    @chat_manager.setter
+    def chat_manager(self, chat_manager: Optional["ChatManager"]) -> None:
+        # The chat renders game events as system messages
+        if self._chat_manager is not None:
+            self.events.unsubscribe(self._chat_manager.on_event)
+        self._chat_manager = chat_manager
+        if chat_manager is not None:
+            self.events.subscribe(chat_manager.on_event)
 
     def add_player(self, player: Player) -> None:
+        self._view = None
+        if player.id in self._seat_index:
+            raise ValueError(f"Player {player.id} is already seated")
+        if len(self.players) >= MAX_SEATS:
+            raise ValueError("Table is full")
+        player.seat = len(self.players)
+        player._table = self
         self.players.append(player)
+        self._seat_index[player.id] = player.seat
+        self._update_live(player)
+        if player.id in self.spectators:
+            self.spectators.remove(player.id)
+        self.snapshot = None
+
+    def add_spectator(self, spectator_id: str) -> None:
+        if spectator_id in self._seat_index:
+            raise ValueError(f"Player {spectator_id} is already seated")
+        if spectator_id not in self.spectators:
+            self.spectators.append(spectator_id)
+
+    def remove_spectator(self, spectator_id: str) -> None:
+        if spectator_id in self.spectators:
+            self.spectators.remove(spectator_id)
+
+    def get_player(self, player_id: str) -> Optional[Player]:
+        seat = self._seat_index.get(player_id)
+        return self.players[seat] if seat is not None else None
+
+    def _update_live(self, player: Player) -> None:
+        self._view = None
+        bit = 1 << player.seat
+        if player.is_active and not player.is_folded:
+            self._live_mask |= bit
+        else:
+            self._live_mask &= ~bit
+
+    def _settle(self, player: Player) -> None:
+        """Update the acting player's bits after they acted this round."""
+        bit = 1 << player.seat
+        if player.balance == 0:
+            self._all_in_mask |= bit
+        if self.phase == "drawing":
+            done = player.has_acted
+        else:
+            done = player.balance == 0 or (
+                player.has_acted and player.current_bet == self.current_bet
+            )
+        if done:
+            self._settled_mask |= bit
+        else:
+            self._settled_mask &= ~bit
+
+    def _rebuild_masks(self) -> None:
+        """Recompute the round bitmasks from player fields (once per round)."""
+        self._settled_mask = 0
+        self._all_in_mask = 0
+        for p in self.players:
+            self._update_live(p)
+            self._settle(p)
+
+    def _round_complete(self) -> bool:
+        return self._live_mask & ~self._settled_mask == 0
+
+    def _next_live_seat(self, seat: int) -> int:
+        """Next live seat after `seat`, wrapping around; `seat` if none."""
+        mask = self._live_mask
+        above = mask >> (seat + 1) << (seat + 1)
+        if above:
+            return (above & -above).bit_length() - 1
+        if mask:
+            return (mask & -mask).bit_length() - 1
+        return seat
+
+    def _first_live_seat_from(self, seat: int) -> int:
+        if self._live_mask >> seat & 1:
+            return seat
+        return self._next_live_seat(seat)
 
     def _reset_has_acted(self) -> None:
         for p in self.players:
             p.has_acted = False
+        self._rebuild_masks()
 
     def _create_deck(self) -> List[Card]:
-        return [Card(suit=s, rank=r) for s in Suit for r in Rank]
+        return list(DECK)
 
     def shuffle(self) -> None:
+        self._view = None
         self.deck = self._create_deck()
         random.shuffle(self.deck)
-        if self.chat_manager:
-            self.chat_manager.add_message("system", "Deck shuffled.")
+        self.events.publish("shuffle")
 
     def start_game(self, ante: int = 5) -> None:
+        self._view = None
         if self.phase != "waiting":
             raise ValueError("Not in waiting phase")
 
@@ -216,10 +326,8 @@ class Table:
         self.pot = 0
         self.current_bet = 0
         self.phase = "betting_1"
-        self._reset_has_acted()
 
-        if self.chat_manager:
-            self.chat_manager.add_message("system", f"Game started. Ante: ${ante}")
+        self.events.publish("start", amount=ante)
 
         for player in self.players:
             if player.balance >= ante:
@@ -228,43 +336,36 @@ class Table:
                 player.is_folded = False
                 player.current_bet = 0
                 player.last_action = ""
-                # Deal 5 cards
-                cards = [self.deck.pop() for _ in range(5)]
-                score, rank_name = self.evaluator.evaluate_hand(cards)
-                player.hand = Hand(cards=cards, rank=rank_name, score=score)
+                # Deal 5 cards; the hand is evaluated only if someone looks
+                player.hand = Hand(cards=[self.deck.pop() for _ in range(5)])
             else:
                 player.is_active = False  # Out of chips
 
-        # Determine active player (left of dealer)
+        # After antes, so all-in seats are known
+        self._reset_has_acted()
+
+        # Determine active player (left of dealer), skipping inactive seats
         if self.players:
-            self.active_player_idx = (self.dealer_idx + 1) % len(self.players)
-            # Skip inactive
-            start_idx = self.active_player_idx
-            while not self.players[self.active_player_idx].is_active:
-                self.active_player_idx = (self.active_player_idx + 1) % len(
-                    self.players
-                )
-                if self.active_player_idx == start_idx:
-                    break  # All inactive
+            self.active_player_idx = self._first_live_seat_from(
+                (self.dealer_idx + 1) % len(self.players)
+            )
 
-            if self.chat_manager:
-                active_p = self.players[self.active_player_idx]
-                self.chat_manager.add_message("system", f"{active_p.name}'s turn.")
+            self.events.publish("turn", self.players[self.active_player_idx].name)
 
     def handle_action(self, player_id: str, action: str, amount: int = 0) -> None:
-        player = next((p for p in self.players if p.id == player_id), None)
+        self._view = None
+        player = self.get_player(player_id)
         if not player:
             raise ValueError("Player not found")
 
         # Validate turn
-        if self.players[self.active_player_idx].id != player_id:
+        if player.seat != self.active_player_idx:
             raise ValueError(f"It is not {player.name}'s turn")
 
         if action == "fold":
             player.is_folded = True
             player.last_action = "Fold"
-            if self.chat_manager:
-                self.chat_manager.add_message("system", f"{player.name} folds.")
+            self.events.publish("fold", player.name)
         elif action == "call":
             call_amount = self.current_bet - player.current_bet
             if player.balance < call_amount:
@@ -273,8 +374,7 @@ class Table:
             player.current_bet += call_amount
             self.pot += call_amount
             player.last_action = "Call"
-            if self.chat_manager:
-                self.chat_manager.add_message("system", f"{player.name} calls.")
+            self.events.publish("call", player.name)
         elif action == "raise":
             raise_to = amount
             if raise_to <= self.current_bet:
@@ -291,50 +391,34 @@ class Table:
             player.current_bet += total_needed
             self.pot += total_needed
             self.current_bet = raise_to
+            # Everyone who is not all-in has to act again
+            self._settled_mask = self._all_in_mask
             player.last_action = f"Raise to {raise_to}"
-            if self.chat_manager:
-                self.chat_manager.add_message(
-                    "system", f"{player.name} raises to {raise_to}."
-                )
+            self.events.publish("raise", player.name, raise_to)
         elif action == "check":
             if self.current_bet > player.current_bet:
                 raise ValueError("Cannot check when there is a bet")
             player.last_action = "Check"
-            if self.chat_manager:
-                self.chat_manager.add_message("system", f"{player.name} checks.")
+            self.events.publish("check", player.name)
 
         player.has_acted = True
+        self._settle(player)
         self._advance_turn()
 
     def _advance_turn(self) -> None:
-        # Check if round is over
-        active_players = [p for p in self.players if not p.is_folded and p.is_active]
-        if len(active_players) <= 1:
+        # Check if round is over: at most one live seat left
+        live = self._live_mask
+        if live & (live - 1) == 0:
             self._end_hand()
             return
 
         # Move to next player
-        start_idx = self.active_player_idx
-        next_idx = (self.active_player_idx + 1) % len(self.players)
-        while self.players[next_idx].is_folded or not self.players[next_idx].is_active:
-            next_idx = (next_idx + 1) % len(self.players)
-            if next_idx == start_idx:
-                break
-
-        self.active_player_idx = next_idx
+        self.active_player_idx = self._next_live_seat(self.active_player_idx)
 
         # Check if betting round is complete
         # Everyone active must have matched current_bet (or be all-in)
         # AND everyone must have acted at least once this round.
-        all_matched = all(
-            p.is_folded
-            or not p.is_active
-            or (p.current_bet == self.current_bet and p.has_acted)
-            or p.balance == 0
-            for p in self.players
-        )
-
-        if all_matched:
+        if self._round_complete():
             # Check if we should move to next phase
             if self.phase == "betting_1":
                 self.phase = "drawing"
@@ -343,10 +427,7 @@ class Table:
                 for p in self.players:
                     p.current_bet = 0
                 self._reset_active_player()
-                if self.chat_manager:
-                    self.chat_manager.add_message(
-                        "system", "Drawing Phase. Choose cards to replace."
-                    )
+                self.events.publish("draw_phase")
 
             elif self.phase == "betting_2":
                 self.phase = "showdown"
@@ -354,28 +435,24 @@ class Table:
 
             return
 
-        if self.chat_manager:
-            active_p = self.players[self.active_player_idx]
-            self.chat_manager.add_message("system", f"{active_p.name}'s turn.")
+        self.events.publish("turn", self.players[self.active_player_idx].name)
 
     def _reset_active_player(self) -> None:
-        self.active_player_idx = (self.dealer_idx + 1) % len(self.players)
-        while (
-            not self.players[self.active_player_idx].is_active
-            or self.players[self.active_player_idx].is_folded
-        ):
-            self.active_player_idx = (self.active_player_idx + 1) % len(self.players)
+        self.active_player_idx = self._first_live_seat_from(
+            (self.dealer_idx + 1) % len(self.players)
+        )
 
     def handle_draw(self, player_id: str, held_indices: List[int]) -> None:
+        self._view = None
         if self.phase != "drawing":
             raise ValueError("Not in drawing phase")
 
-        player = next((p for p in self.players if p.id == player_id), None)
+        player = self.get_player(player_id)
         if not player:
             raise ValueError("Player not found")
 
         # Validate turn
-        if self.players[self.active_player_idx].id != player_id:
+        if player.seat != self.active_player_idx:
             raise ValueError(f"It is not {player.name}'s turn to draw")
 
         if not player.hand:
@@ -393,59 +470,42 @@ class Table:
                 new_cards[i] = self.deck.pop()
                 count_drawn += 1
 
-        score, rank_name = self.evaluator.evaluate_hand(new_cards)
-        player.hand = Hand(cards=new_cards, rank=rank_name, score=score)
+        player.hand = Hand(cards=new_cards)
         player.last_action = "Draw"
         player.has_acted = True
+        self._settle(player)
 
-        if self.chat_manager:
-            self.chat_manager.add_message(
-                "system", f"{player.name} drew {count_drawn} cards."
-            )
+        self.events.publish("draw", player.name, count_drawn)
 
         self._advance_turn_drawing()
 
     def _advance_turn_drawing(self) -> None:
-        # Move to next active player who hasn't drawn yet
-        active_players = [p for p in self.players if not p.is_folded and p.is_active]
-
         # Current active player has just drawn.
         # Check if everyone has drawn.
-        all_drawn = all(p.has_acted for p in active_players)
-
-        if all_drawn:
+        if self._round_complete():
             self.phase = "betting_2"
             self.current_bet = 0
             self._reset_has_acted()
             for p in self.players:
                 p.current_bet = 0
             self._reset_active_player()
-            if self.chat_manager:
-                self.chat_manager.add_message("system", "Second Betting Phase.")
-                self.chat_manager.add_message(
-                    "system", f"{self.players[self.active_player_idx].name}'s turn."
-                )
+            self.events.publish("betting_2")
+            self.events.publish("turn", self.players[self.active_player_idx].name)
         else:
             # Move to next player
             self._move_to_next_active_player()
-            if self.chat_manager:
-                self.chat_manager.add_message(
-                    "system",
-                    f"{self.players[self.active_player_idx].name}'s turn to draw.",
-                )
+            self.events.publish("draw_turn", self.players[self.active_player_idx].name)
 
     def _move_to_next_active_player(self) -> None:
-        start_idx = self.active_player_idx
-        next_idx = (self.active_player_idx + 1) % len(self.players)
-        while self.players[next_idx].is_folded or not self.players[next_idx].is_active:
-            next_idx = (next_idx + 1) % len(self.players)
-            if next_idx == start_idx:
-                break
-        self.active_player_idx = next_idx
-
-    async def process_ai_turn(self) -> None:
+        self.active_player_idx = self._next_live_seat(self.active_player_idx)
+
+    async def process_ai_turn(self, decision: Optional[Any] = None) -> None:
         """
         If the current active player is an AI, use their agent to decide and execute a move.
+
+        `decision` is a move already decided for this player (held indices
+        while drawing, `(action, amount)` while betting; see `TableActor`).
+        The agent is only asked when it is not given.
         """
         current_player = self.players[self.active_player_idx]
         if current_player.type != PlayerType.AI or not current_player.agent:
@@ -454,21 +514,24 @@ class Table:
         logger.info(
             f"Processing AI turn for {current_player.name} in phase {self.phase}"
         )
-        table_state = self.to_state(current_player.id)
-        player_state = current_player.to_state(hide_hand=False)
+        player_state, table_state = self.observe(current_player)
 
         if self.phase == "drawing":
-            held_indices = await current_player.agent.decide_draw_action(
-                player_state, table_state
-            )
+            held_indices = decision
+            if held_indices is None:
+                held_indices = await current_player.agent.decide_draw_action(
+                    player_state, table_state
+                )
             # Validate indices just in case
             valid_indices = [i for i in held_indices if 0 <= i < 5]
             self.handle_draw(current_player.id, valid_indices)
 
         elif self.phase in ["betting_1", "betting_2"]:
-            action, amount = await current_player.agent.decide_betting_action(
-                player_state, table_state
-            )
+            if decision is None:
+                decision = await current_player.agent.decide_betting_action(
+                    player_state, table_state
+                )
+            action, amount = decision
             # Basic validation/fallback
             if action not in ["fold", "call", "raise", "check"]:
                 action = "fold"
@@ -486,7 +549,7 @@ class Table:
 
     def ai_draw(self, player_id: str) -> None:
         # Legacy method - kept for compatibility
-        player = next((p for p in self.players if p.id == player_id), None)
+        player = self.get_player(player_id)
         if not player or not player.hand:
             return
 
@@ -506,13 +569,15 @@ class Table:
         if not active_players:
             return
 
-        if self.chat_manager:
-            self.chat_manager.add_message("system", "--- Showdown ---")
+        # Folded hands are never evaluated; live ones are, all at once
+        Hand.evaluate_all(p.hand for p in active_players if p.hand)
+
+        events = self.events
+        if events.subscribers:
+            events.publish("showdown")
             for p in active_players:
                 assert p.hand is not None
-                self.chat_manager.add_message(
-                    "system", f"{p.name} shows {p.hand.rank} ({p.hand.score})"
-                )
+                events.publish("show", p.name, p.hand.score, p.hand.rank)
 
         winner = max(active_players, key=lambda p: p.hand.score if p.hand else -1)
         if winner.hand:
@@ -522,40 +587,113 @@ class Table:
             winner.balance += self.pot
             winner.last_action = f"Wins ${self.pot}"
 
-        if self.chat_manager:
-            self.chat_manager.add_message("system", f"{winner.name} wins ${self.pot}!")
+        self.events.publish("win", winner.name, self.pot)
 
         self.pot = 0
         self.phase = "waiting"
         self.dealer_idx = (self.dealer_idx + 1) % len(self.players)
 
     def _end_hand(self) -> None:
-        active_players = [p for p in self.players if not p.is_folded and p.is_active]
-        if active_players:
-            winner = active_players[0]
+        live = self._live_mask
+        if live:
+            winner = self.players[(live & -live).bit_length() - 1]
             winner.balance += self.pot
             winner.last_action = f"Wins ${self.pot} (everyone else folded)"
-            if self.chat_manager:
-                self.chat_manager.add_message(
-                    "system", f"{winner.name} wins ${self.pot} (all others folded)."
-                )
+            self.events.publish("win_uncontested", winner.name, self.pot)
 
         self.pot = 0
         self.phase = "waiting"
         self.dealer_idx = (self.dealer_idx + 1) % len(self.players)
 
+    def clone(self) -> "Table":
+        """
+        A copy of the engine state only (seats, pot, bets, phase, deck) for
+        trying moves out: no actor, reply worker, chat or agents, and its
+        events reach no one. Much cheaper than a dump/restore round trip.
+        """
+        clone = Table.__new__(Table)
+        clone.id = self.id
+        clone.deck = list(self.deck)
+        clone.pot = self.pot
+        clone.current_bet = self.current_bet
+        clone.phase = self.phase
+        clone.active_player_idx = self.active_player_idx
+        clone.dealer_idx = self.dealer_idx
+        clone.evaluator = self.evaluator
+        clone.events = EventBus()
+        clone._chat_manager = None
+        clone.spectators = []
+        clone._seat_index = dict(self._seat_index)
+        clone._live_mask = self._live_mask
+        clone._settled_mask = self._settled_mask
+        clone._all_in_mask = self._all_in_mask
+        clone.version = self.version
+        clone.snapshot = None
+        clone._view = None
+        clone.players = []
+        for player in self.players:
+            copy = Player.__new__(Player)
+            for slot in Player.__slots__:
+                setattr(copy, slot, getattr(player, slot))
+            copy.agent = None
+            copy._table = clone
+            clone.players.append(copy)
+        return clone
+
+    def publish(self) -> TableSnapshot:
+        """
+        Bump the table version and replace the published snapshot.
+        Called by the actor after every applied command.
+        """
+        self.version += 1
+        self._view = None
+        self.snapshot = TableSnapshot.capture(self, self.version)
+        return self.snapshot
+
+    def published(self) -> TableSnapshot:
+        """Latest published snapshot, publishing one for fresh tables."""
+        snapshot = self.snapshot
+        if snapshot is None:
+            snapshot = self.publish()
+        return snapshot
+
     def to_state(self, observer_id: str) -> TableState:
-        return TableState(
-            players=[
-                p.to_state(hide_hand=(p.id != observer_id and self.phase != "showdown"))
-                for p in self.players
-            ],
-            pot=self.pot,
-            current_bet=self.current_bet,
-            phase=self.phase,
-            active_player_id=self.players[self.active_player_idx].id
-            if self.players
-            else None,
-            dealer_idx=self.dealer_idx,
-            deck_count=len(self.deck),
-        )
+        """
+        The table as `observer_id` sees it. The public view is built once
+        and shared by every observer until the next engine change; only the
+        observer's own seat is swapped for a copy with the hand visible.
+        Callers must treat the returned states as read-only.
+        """
+        view = self._view
+        if view is None:
+            reveal = self.phase == "showdown"
+            view = self._view = _TableView(
+                players=[p.to_state(hide_hand=not reveal) for p in self.players],
+                fields={
+                    "pot": self.pot,
+                    "current_bet": self.current_bet,
+                    "phase": self.phase,
+                    "active_player_id": self.players[self.active_player_idx].id
+                    if self.players
+                    else None,
+                    "dealer_idx": self.dealer_idx,
+                    "deck_count": len(self.deck),
+                },
+            )
+
+        players = view.players
+        seat = self._seat_index.get(observer_id)
+        if seat is not None and players[seat].hand is None:
+            own = view.own.get(observer_id)
+            if own is None:
+                own = view.own[observer_id] = self.players[seat].to_state(
+                    hide_hand=False
+                )
+            if own.hand is not None:
+                players = players[:seat] + [own] + players[seat + 1 :]
+        return TableState(players=players, **view.fields)
+
+    def observe(self, player: Player) -> Tuple[PlayerState, TableState]:
+        """A seated player's own state (hand visible) and their table view."""
+        table_state = self.to_state(player.id)
+        return table_state.players[player.seat], table_state
@@ -1,16 +1,30 @@
+import argparse
+import asyncio
 import uvicorn
 import logging
-import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, Request, HTTPException, Depends, BackgroundTasks, Query
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 import os
-from .logic import Table, Player, PlayerType
+from typing import Optional
+from .logic import Table, DEFAULT_TABLE_ID
 from .models import ActionRequest, DrawRequest, BetRequest, ChatRequest
-from .ai import GeminiPokerAgent
-from .chat import ChatManager
+from .chat import CHAT_CAPACITY, ChatManager, encode_messages
+from .fanout import encode_frame
+from .wire import COMPACT_MEDIA_TYPE
+from .registry import (
+    TableLimitError,
+    TableRegistry,
+    MODEL_NAME,
+    client_pool,
+    model_api_key,
+)
+from .persistence import TableStore
+from .chatlog import ChatLog
+from .agents import shutdown_executor
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY, RequestTimer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,62 +38,83 @@ TEMPLATES_DIR = os.path.join(BASE_DIR, "templates")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    chat_manager = ChatManager()
-    table = Table(chat_manager=chat_manager)
-    table.add_player(Player(id="player1", name="You", type=PlayerType.HUMAN))
-    agent1 = GeminiPokerAgent(model_name="gemini-2.5-pro")
-    agent2 = GeminiPokerAgent(model_name="gemini-2.5-pro")
-    table.add_player(Player(id="bot1", name="Bot 1", type=PlayerType.AI, agent=agent1))
-    table.add_player(Player(id="bot2", name="Bot 2", type=PlayerType.AI, agent=agent2))
-
-    app.state.table = table
-    app.state.chat_manager = chat_manager
+    # Tables are created (or restored) lazily per table_id on first request
+    db_path = os.environ.get("POKER_DB_PATH")
+    store = TableStore(db_path) if db_path else None
+    chat_log_dir = os.environ.get("POKER_CHAT_LOG_DIR")
+    chat_log = (
+        ChatLog(
+            chat_log_dir,
+            segment_bytes=int(os.environ.get("POKER_CHAT_SEGMENT_BYTES", "1048576")),
+            segment_seconds=float(os.environ.get("POKER_CHAT_SEGMENT_SECONDS", "3600")),
+        )
+        if chat_log_dir
+        else None
+    )
+    app.state.tables = TableRegistry(store=store, chat_log=chat_log)
+    REGISTRY.register(*app.state.tables.gauges())
+    # Open the shared model connections before the first bot move
+    await client_pool.warm_up(model_api_key(), MODEL_NAME)
     logger.info("Game state initialized")
     yield
-    # Clean up if needed
     logger.info("Shutting down")
+    await client_pool.aclose()
+    shutdown_executor()
+    if store:
+        # Commit anything still queued before exiting
+        await asyncio.to_thread(store.close)
+    if chat_log:
+        await asyncio.to_thread(chat_log.close)
 
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(RequestTimer)
 
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 templates = Jinja2Templates(directory=TEMPLATES_DIR)
 
 
-async def get_table() -> Table:
-    return app.state.table
+async def get_table(table_id: str = DEFAULT_TABLE_ID) -> Table:
+    try:
+        return await app.state.tables.open(table_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Table not found")
 
 
-async def get_chat_manager() -> ChatManager:
-    return app.state.chat_manager
+async def get_chat_manager(table: Table = Depends(get_table)) -> ChatManager:
+    if table.chat_manager is None:
+        table.chat_manager = ChatManager()
+    return table.chat_manager
 
 
-async def run_ai_turns(table: Table):
+class JSONBytesResponse(Response):
     """
-    Background task to process AI turns sequentially.
+    Response for JSON that is already encoded (snapshots, cached chat
+    messages), bypassing FastAPI's `jsonable_encoder` and re-validation.
     """
-    try:
-        while True:
-            # Check if game is in a phase where players act
-            if table.phase not in ["betting_1", "betting_2", "drawing"]:
-                break
 
-            # Check if active player is AI
-            current_player = table.players[table.active_player_idx]
-            if current_player.type != PlayerType.AI:
-                break
+    media_type = "application/json"
+
 
-            # Process the turn
-            # process_ai_turn in logic.py is async and handles:
-            # 1. Getting state
-            # 2. Calling AI (yields)
-            # 3. Handling action (sync)
-            await table.process_ai_turn()
+def wants_compact(request: Request) -> bool:
+    """Whether the client negotiated the compact wire format (see wire.py)."""
+    return COMPACT_MEDIA_TYPE in request.headers.get("accept", "")
 
-            # Small pause to allow other tasks (like state polling) to run effectively
-            await asyncio.sleep(0.1)
-    except Exception as e:
-        logger.error(f"Error in AI background loop: {e}", exc_info=True)
+
+def state_response(
+    table: Table, player_id: str, compact: bool = False
+) -> JSONBytesResponse:
+    # Served from the immutable snapshot the actor publishes after each
+    # command: no lock, and only the observer's own hand is spliced in.
+    snapshot = table.published()
+    headers = {"X-Table-Version": str(snapshot.version), "Vary": "Accept"}
+    if compact:
+        return JSONBytesResponse(
+            content=snapshot.compact.render(player_id),
+            headers=headers,
+            media_type=COMPACT_MEDIA_TYPE,
+        )
+    return JSONBytesResponse(content=snapshot.render(player_id), headers=headers)
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -87,118 +122,112 @@ async def read_root(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 
-@app.get("/state")
-async def get_state(player_id: str = "player1", table: Table = Depends(get_table)):
-    # We acquire lock to ensure we don't read partial updates if handle_action runs?
-    # handle_action is sync, so it's atomic in asyncio.
-    # But lock usage is good practice if we expand to threads.
-    async with table._lock:
-        return table.to_state(player_id)
+@app.get("/state", response_class=JSONBytesResponse)
+async def get_state(
+    player_id: str = "player1",
+    table: Table = Depends(get_table),
+    compact: bool = Depends(wants_compact),
+):
+    return state_response(table, player_id, compact)
 
 
-@app.post("/action")
+@app.post("/action", response_class=JSONBytesResponse)
 async def take_action(
     request: ActionRequest,
     background_tasks: BackgroundTasks,
     table: Table = Depends(get_table),
+    compact: bool = Depends(wants_compact),
 ):
-    async with table._lock:
-        try:
-            amount = request.amount if request.amount is not None else 0
-            table.handle_action(request.player_id, request.action, amount)
-        except ValueError as e:
-            logger.error(f"Action error: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    # Check if AI turn follows
-    current_player = table.players[table.active_player_idx]
-    if current_player.type == PlayerType.AI and table.phase in [
-        "betting_1",
-        "betting_2",
-        "drawing",
-    ]:
-        background_tasks.add_task(run_ai_turns, table)
+    try:
+        amount = request.amount if request.amount is not None else 0
+        await table.actor.submit("action", request.player_id, request.action, amount)
+    except ValueError as e:
+        logger.error(f"Action error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return table.to_state(request.player_id)
+    # Any AI turns that follow are chained by the actor; keep the request
+    # alive until they have been applied.
+    background_tasks.add_task(table.actor.join)
+    return state_response(table, request.player_id, compact)
 
 
-@app.post("/draw")
+@app.post("/draw", response_class=JSONBytesResponse)
 async def draw_cards(
     request: DrawRequest,
     background_tasks: BackgroundTasks,
     table: Table = Depends(get_table),
+    compact: bool = Depends(wants_compact),
 ):
-    async with table._lock:
-        try:
-            player_id = request.player_id or "player1"
-            table.handle_draw(player_id, request.held_indices)
-        except ValueError as e:
-            logger.error(f"Draw error: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    # Check if AI turn follows
-    current_player = table.players[table.active_player_idx]
-    if current_player.type == PlayerType.AI and table.phase in [
-        "betting_1",
-        "betting_2",
-        "drawing",
-    ]:
-        background_tasks.add_task(run_ai_turns, table)
+    player_id = request.player_id or "player1"
+    try:
+        await table.actor.submit("draw", player_id, request.held_indices)
+    except ValueError as e:
+        logger.error(f"Draw error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return table.to_state(player_id)
+    background_tasks.add_task(table.actor.join)
+    return state_response(table, player_id, compact)
 
 
-@app.post("/bet")  # Legacy support for Deal button
+@app.post("/bet", response_class=JSONBytesResponse)  # Legacy support for Deal button
 async def place_bet(
     request: BetRequest,
     background_tasks: BackgroundTasks,
     table: Table = Depends(get_table),
+    compact: bool = Depends(wants_compact),
 ):
-    async with table._lock:
-        try:
-            if request.bet <= 0:
-                raise ValueError("Bet must be positive")
-
-            table.start_game(ante=request.bet)
-        except ValueError as e:
-            logger.error(f"Bet error: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
+    try:
+        if request.bet <= 0:
+            raise ValueError("Bet must be positive")
 
-    # Check if AI turn follows (e.g. if dealer button makes AI first)
-    current_player = table.players[table.active_player_idx]
-    if current_player.type == PlayerType.AI and table.phase in [
-        "betting_1",
-        "betting_2",
-        "drawing",
-    ]:
-        background_tasks.add_task(run_ai_turns, table)
+        await table.actor.submit("start", request.bet)
+    except ValueError as e:
+        logger.error(f"Bet error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return table.to_state("player1")
+    # The actor queues AI turns if the dealer button makes an AI act first
+    background_tasks.add_task(table.actor.join)
+    return state_response(table, "player1", compact)
 
 
 @app.post("/shuffle")
 async def shuffle_deck(table: Table = Depends(get_table)):
-    async with table._lock:
-        table.shuffle()
-        return {"message": "Deck shuffled"}
+    await table.actor.submit("shuffle")
+    return {"message": "Deck shuffled"}
 
 
 @app.post("/reset")
-async def reset_game():
-    chat_manager = ChatManager()
-    table = Table(chat_manager=chat_manager)
-    table.add_player(Player(id="player1", name="You", type=PlayerType.HUMAN))
-    agent1 = GeminiPokerAgent(model_name="gemini-2.5-pro")
-    agent2 = GeminiPokerAgent(model_name="gemini-2.5-pro")
-    table.add_player(Player(id="bot1", name="Bot 1", type=PlayerType.AI, agent=agent1))
-    table.add_player(Player(id="bot2", name="Bot 2", type=PlayerType.AI, agent=agent2))
-
-    app.state.table = table
-    app.state.chat_manager = chat_manager
+async def reset_game(table_id: str = DEFAULT_TABLE_ID):
+    tables = app.state.tables
+    try:
+        # Hold the table first so its chat history carries over to the new game
+        await tables.open(table_id)
+        tables.reset(table_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Table not found")
+    except TableLimitError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     return {"message": "Game reset"}
 
 
-@app.post("/chat/send")
+@app.post("/tables")
+async def create_table(table_id: str, bots: Optional[str] = None):
+    """
+    Create (or reopen) a table; other endpoints only serve existing ones.
+    `bots` lists an agent kind per bot seat of a new table, e.g.
+    `strategy,gemini`; it defaults to `POKER_BOT_AGENTS`.
+    """
+    kinds = bots.split(",") if bots else None
+    try:
+        await app.state.tables.open(table_id, create=True, bots=kinds)
+    except TableLimitError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"table_id": table_id}
+
+
+@app.post("/chat/send", response_class=JSONBytesResponse)
 async def send_chat_message(
     request: ChatRequest,
     table: Table = Depends(get_table),
@@ -206,40 +235,82 @@ async def send_chat_message(
 ):
     msg = chat_manager.add_message(request.player_id, request.text)
 
-    # Trigger bot responses
+    # Bot replies are produced by the table's reply worker and show up in
+    # the chat feed; the sender does not wait for the model.
     if request.player_id == "player1":
-        # Get history for context
-        history = [m.text for m in chat_manager.get_messages(limit=10)]
+        table.replier.submit(request.text)
 
-        # Pick a bot to respond (or all)
-        for player in table.players:
-            if player.type == PlayerType.AI and player.agent:
-                # 50% chance for a bot to respond to keep it from being too noisy
-                import random
+    return JSONBytesResponse(msg.encoded())
 
-                if random.random() < 0.5:
-                    async with table._lock:
-                        player_state = player.to_state(hide_hand=False)
-                        table_state = table.to_state(player.id)
 
-                    response_text = await player.agent.decide_chat_response(
-                        request.text, history, player_state, table_state
-                    )
-                    chat_manager.add_message(player.id, response_text)
-                    break  # Only one bot responds per user message
-
-    return msg
+@app.get("/chat/messages", response_class=JSONBytesResponse)
+async def get_chat_messages(
+    limit: int = Query(50, ge=0, le=CHAT_CAPACITY),
+    after: Optional[int] = None,
+    chat_manager: ChatManager = Depends(get_chat_manager),
+):
+    """Recent messages, or only those newer than the `after` sequence number."""
+    return JSONBytesResponse(
+        encode_messages(await chat_manager.fetch_messages(limit=limit, after=after))
+    )
 
 
-@app.get("/chat/messages")
-async def get_chat_messages(
-    limit: int = 50, chat_manager: ChatManager = Depends(get_chat_manager)
+@app.get("/chat/stream")
+async def stream_chat_messages(
+    after: Optional[int] = None,
+    chat_manager: ChatManager = Depends(get_chat_manager),
 ):
-    return chat_manager.get_messages(limit=limit)
+    """
+    Server-sent events feed of the table chat. Pass `after` (a sequence
+    number) to first replay buffered messages newer than it.
+    """
+    subscription = chat_manager.fanout.subscribe()
+    try:
+        backlog = (
+            await chat_manager.fetch_messages(after=after) if after is not None else []
+        )
+    except BaseException:
+        chat_manager.fanout.unsubscribe(subscription)
+        raise
+
+    async def frames():
+        try:
+            if backlog:
+                yield b"".join(encode_frame(msg) for msg in backlog)
+            while True:
+                yield b"".join(await subscription.get())
+        finally:
+            chat_manager.fanout.unsubscribe(subscription)
+
+    return StreamingResponse(frames(), media_type="text/event-stream")
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """This process's metrics in the Prometheus text format."""
+    return Response(REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
 
 
 def main():
-    uvicorn.run("five_card_poker.main:app", host="0.0.0.0", port=8000, reload=True)
+    parser = argparse.ArgumentParser(description="5-Card Draw Poker server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("POKER_WORKERS", "1")),
+        help="Worker processes; more than one enables table-sharded serving",
+    )
+    args = parser.parse_args()
+
+    if args.workers > 1:
+        from .cluster import serve
+
+        serve(host=args.host, port=args.port, workers=args.workers)
+    else:
+        uvicorn.run(
+            "five_card_poker.main:app", host=args.host, port=args.port, reload=True
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,320 @@
+import functools
+import time
+from bisect import bisect_left
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+# Exposition format served by /metrics
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds in seconds, from a cached /state read to a slow model call
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Labels = Tuple[str, ...]
+# (sample name, (label name, label value) pairs, value)
+Sample = Tuple[str, Tuple[Tuple[str, str], ...], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format(value: float) -> str:
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+class Metric:
+    """Base for one named metric family with a fixed set of label names."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+
+    def samples(self) -> Iterable[Sample]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """A monotonically increasing count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labels)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> Iterable[Sample]:
+        for labels, value in list(self._values.items()):
+            yield self.name, tuple(zip(self.labels, labels)), value
+
+
+class Histogram(Metric):
+    """
+    Observations counted into fixed buckets per label set.
+
+    Each series is one flat list: a count per bucket, an overflow count
+    and the running sum. Observing is a bisect and two additions, and the
+    cumulative form Prometheus expects is only computed at scrape time.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0.0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> Iterable[Sample]:
+        for labels, series in list(self._series.items()):
+            pairs = tuple(zip(self.labels, labels))
+            series = list(series)
+            total = 0.0
+            for bound, count in zip(self.buckets, series):
+                total += count
+                yield self.name + "_bucket", pairs + (("le", _format(bound)),), total
+            total += series[-2]
+            yield self.name + "_bucket", pairs + (("le", "+Inf"),), total
+            yield self.name + "_sum", pairs, series[-1]
+            yield self.name + "_count", pairs, total
+
+
+class Gauge(Metric):
+    """
+    A value read at scrape time from `collect`, which returns either one
+    number or (labels, value) pairs. Nothing runs between scrapes. Pass
+    `kind="counter"` for totals another object already keeps (cache hits).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        collect: Callable[[], Any],
+        labels: Sequence[str] = (),
+        kind: str = "gauge",
+    ) -> None:
+        super().__init__(name, help, labels)
+        self.collect = collect
+        self.kind = kind
+
+    def samples(self) -> Iterable[Sample]:
+        values = self.collect()
+        if not self.labels:
+            yield self.name, (), values
+            return
+        for labels, value in values:
+            yield self.name, tuple(zip(self.labels, labels)), value
+
+
+class MetricsRegistry:
+    """
+    The metrics this process exposes, by name.
+
+    No collector takes a lock: every observation is made on the event
+    loop thread, and scrapes run there too, so a scrape never sees a
+    half-applied update.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, *metrics: Metric) -> None:
+        """Add metrics, replacing any already registered under the same name."""
+        for metric in metrics:
+            self._metrics[metric.name] = metric
+
+    def render(self) -> bytes:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {_escape(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, pairs, value in metric.samples():
+                if pairs:
+                    labels = ",".join(f'{k}="{_escape(str(v))}"' for k, v in pairs)
+                    name = f"{name}{{{labels}}}"
+                lines.append(f"{name} {_format(value)}")
+        lines.append("")
+        return "\n".join(lines).encode()
+
+
+def merge_expositions(expositions: Dict[str, bytes], label: str = "worker") -> bytes:
+    """
+    Several processes' `render` output as one exposition: every sample
+    gains `label` set to its process's key, and each family keeps a single
+    HELP and TYPE header followed by the samples of all processes.
+    """
+    families: Dict[str, Tuple[Dict[str, str], List[str]]] = {}
+    for key, body in expositions.items():
+        pair = f'{label}="{_escape(key)}"'
+        samples: Optional[List[str]] = None
+        for line in body.decode().splitlines():
+            if line.startswith("# "):
+                parts = line.split(" ", 3)  # "# HELP <name> <text>"
+                if len(parts) < 3:
+                    continue
+                headers, samples = families.setdefault(parts[2], ({}, []))
+                headers.setdefault(parts[1], line)
+            elif line and samples is not None:
+                # A metric name never contains "{" or " "; label values may
+                name = line.split("{", 1)[0].split(" ", 1)[0]
+                rest = line[len(name) :]
+                if rest.startswith("{"):
+                    samples.append(f"{name}{{{pair},{rest[1:]}")
+                else:
+                    samples.append(f"{name}{{{pair}}}{rest}")
+
+    lines: List[str] = []
+    for headers, samples in families.values():
+        lines.extend(headers.values())
+        lines.extend(samples)
+    lines.append("")
+    return "\n".join(lines).encode()
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_SECONDS = Histogram(
+    "poker_http_request_duration_seconds",
+    "Time to first response byte, by route template.",
+    ("method", "route", "status"),
+)
+TABLE_QUEUE_WAIT_SECONDS = Histogram(
+    "poker_table_queue_wait_seconds",
+    "Time a command waited in its table's actor queue (lock wait).",
+    ("command",),
+)
+TABLE_COMMAND_SECONDS = Histogram(
+    "poker_table_command_seconds",
+    "Time the table actor spent applying a command (lock hold).",
+    ("command",),
+)
+AI_DECISION_SECONDS = Histogram(
+    "poker_ai_decision_seconds",
+    "AI decision latency by agent kind and method.",
+    ("agent", "method"),
+)
+AI_FALLBACKS = Counter(
+    "poker_ai_fallbacks_total",
+    "AI decisions answered by the rule-based fallback instead of the model.",
+    ("method", "reason"),
+)
+REGISTRY.register(
+    REQUEST_SECONDS,
+    TABLE_QUEUE_WAIT_SECONDS,
+    TABLE_COMMAND_SECONDS,
+    AI_DECISION_SECONDS,
+    AI_FALLBACKS,
+)
+
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def timed_decision(method: str) -> Callable[[F], F]:
+    """Record an agent coroutine method's latency under `self.kind`."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                AI_DECISION_SECONDS.observe(
+                    time.perf_counter() - start, self.kind, method
+                )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def _route_label(scope: Dict[str, Any]) -> str:
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    if scope.get("endpoint") is not None:
+        return scope.get("root_path", "") + "/*"  # A mounted app, e.g. /static
+    return "unmatched"
+
+
+class RequestTimer:
+    """
+    ASGI middleware recording each HTTP request's time to its response
+    start, labelled by route template (not raw path, so table ids never
+    become labels). Streams are timed to their first byte, not their end.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+
+        async def timed_send(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                REQUEST_SECONDS.observe(
+                    time.perf_counter() - start,
+                    scope["method"],
+                    _route_label(scope),
+                    str(message["status"]),
+                )
+            await send(message)
+
+        await self.app(scope, receive, timed_send)
@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field
+from .evaluator import evaluate_hand, evaluate_many
 
 
 class Suit(str, Enum):
@@ -27,17 +28,93 @@ class Rank(str, Enum):
 
 
 class Card(BaseModel):
+    """
+    A playing card. Cards are immutable and the engine only uses the 52
+    interned instances in `DECK`; get one with `Card.of(suit, rank)`.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
     suit: Suit
     rank: Rank
 
     def __str__(self) -> str:
         return f"{self.rank.value} of {self.suit.value}"
 
+    @staticmethod
+    def of(suit: str, rank: str) -> "Card":
+        """The interned card for a suit and rank (enum members or their values)."""
+        return _CARDS[(suit, rank)]
+
+
+# Every distinct card, created once and shared by all decks and hands
+DECK: Tuple[Card, ...] = tuple(Card(suit=s, rank=r) for s in Suit for r in Rank)
+_CARDS: Dict[Tuple[str, str], Card] = {(c.suit, c.rank): c for c in DECK}
+
+
+def _private(model: BaseModel) -> Dict[str, Any]:
+    """
+    A model's private attribute values. Reading the dict directly skips
+    pydantic's `__getattr__`, which costs more than the evaluation cache.
+    """
+    private = model.__pydantic_private__
+    assert private is not None  # Set by __init__ on models with private attrs
+    return private
+
 
 class Hand(BaseModel):
+    """
+    Five cards. `rank` and `score` are evaluated on first access and kept
+    on the hand, so a hand that is folded before anyone looks at it is
+    never evaluated. Pass both to the constructor to skip evaluation.
+    """
+
     cards: List[Card]
-    rank: str  # e.g., "Full House", "Flush", etc.
-    score: int  # For comparison
+    _rank: Optional[str] = PrivateAttr(default=None)
+    _score: Optional[int] = PrivateAttr(default=None)
+
+    def __init__(
+        self, rank: Optional[str] = None, score: Optional[int] = None, **data: Any
+    ) -> None:
+        super().__init__(**data)
+        if rank is not None and score is not None:
+            _private(self).update(_rank=rank, _score=score)
+
+    def __eq__(self, other: object) -> bool:
+        # Rank and score follow from the cards, evaluated yet or not
+        if isinstance(other, Hand):
+            return self.cards == other.cards
+        return NotImplemented
+
+    @property
+    def evaluated(self) -> bool:
+        return _private(self)["_score"] is not None
+
+    def _evaluate(self) -> Dict[str, Any]:
+        private = _private(self)
+        if private["_score"] is None:
+            private["_score"], private["_rank"] = evaluate_hand(self.cards)
+        return private
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def rank(self) -> str:
+        """e.g. "Full House", "Flush"."""
+        return self._evaluate()["_rank"]
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def score(self) -> int:
+        """For comparison; higher wins."""
+        return self._evaluate()["_score"]
+
+    @staticmethod
+    def evaluate_all(hands: Iterable["Hand"]) -> None:
+        """Evaluate every hand not evaluated yet, in one batch."""
+        pending = [hand for hand in hands if not hand.evaluated]
+        results = evaluate_many(hand.cards for hand in pending)
+        for hand, (score, rank) in zip(pending, results):
+            _private(hand).update(_rank=rank, _score=score)
 
 
 class PlayerType(str, Enum):
@@ -0,0 +1,248 @@
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from .models import Card, Hand, PlayerType
+from .logic import Table, Player
+from .chat import ChatManager
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tables (
+    table_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS actions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    command TEXT NOT NULL,
+    args TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS actions_by_table ON actions (table_id, version);
+"""
+
+# Recent chat kept in each table snapshot.
+CHAT_HISTORY = 100
+
+
+def _card(card: Card) -> Tuple[str, str]:
+    return card.suit.value, card.rank.value
+
+
+def _agent_kind(agent: Any) -> Optional[str]:
+    kind = getattr(agent, "kind", None)
+    return kind if isinstance(kind, str) else None
+
+
+def dump_table(table: Table) -> Dict[str, Any]:
+    """Plain-data record of a table, detached from the live objects."""
+    return {
+        "id": table.id,
+        "version": table.version,
+        "pot": table.pot,
+        "current_bet": table.current_bet,
+        "phase": table.phase,
+        "active_player_idx": table.active_player_idx,
+        "dealer_idx": table.dealer_idx,
+        "deck": [_card(c) for c in table.deck],
+        "players": [
+            {
+                "id": p.id,
+                "name": p.name,
+                "type": p.type.value,
+                "balance": p.balance,
+                # Rank and score follow from the cards; saving them would
+                # evaluate every hand on every save
+                "hand": {"cards": [_card(c) for c in p.hand.cards]} if p.hand else None,
+                "is_folded": p.is_folded,
+                "current_bet": p.current_bet,
+                "last_action": p.last_action,
+                "is_active": p.is_active,
+                "has_acted": p.has_acted,
+                "agent": _agent_kind(p.agent),
+            }
+            for p in table.players
+        ],
+        "chat_seq": table.chat_manager.last_seq if table.chat_manager else 0,
+        "chat": [
+            (m.player_id, m.text, m.timestamp)
+            for m in (
+                table.chat_manager.get_messages(limit=CHAT_HISTORY)
+                if table.chat_manager
+                else []
+            )
+        ],
+    }
+
+
+def restore_table(record: Dict[str, Any], agent_factory: Callable[..., Any]) -> Table:
+    """
+    Rebuild a Table from `dump_table` output. AI seats get a fresh agent
+    from `agent_factory`, called with the seat's recorded agent kind if any.
+    """
+    chat_manager = ChatManager()
+    chat = record.get("chat", [])
+    # Continue the sequence so polling clients' cursors stay valid
+    chat_manager.last_seq = max(record.get("chat_seq", 0) - len(chat), 0)
+    for player_id, text, timestamp in chat:
+        chat_manager.add_message(player_id, text, timestamp)
+
+    table = Table(chat_manager=chat_manager, table_id=record["id"])
+    for data in record["players"]:
+        player_type = PlayerType(data["type"])
+        agent = None
+        if player_type == PlayerType.AI:
+            kind = data.get("agent")
+            agent = agent_factory(kind) if kind else agent_factory()
+        player = Player(
+            id=data["id"],
+            name=data["name"],
+            type=player_type,
+            balance=data["balance"],
+            agent=agent,
+        )
+        if data["hand"]:
+            player.hand = Hand(cards=[Card.of(s, r) for s, r in data["hand"]["cards"]])
+        player.is_folded = data["is_folded"]
+        player.current_bet = data["current_bet"]
+        player.last_action = data["last_action"]
+        player.is_active = data["is_active"]
+        player.has_acted = data["has_acted"]
+        table.add_player(player)
+
+    table.deck = [Card.of(s, r) for s, r in record["deck"]]
+    table.pot = record["pot"]
+    table.current_bet = record["current_bet"]
+    table.phase = record["phase"]
+    table.active_player_idx = record["active_player_idx"]
+    table.dealer_idx = record["dealer_idx"]
+    table.version = record["version"]
+    table._rebuild_masks()
+    return table
+
+
+class TableStore:
+    """
+    SQLite (WAL) store for table snapshots and the per-table action log.
+
+    Writes never touch the event loop: `record`/`save` only enqueue, and a
+    single background thread group-commits everything queued since its last
+    commit in one transaction, so one fsync covers a whole burst of actions.
+    Snapshots for the same table within a batch collapse to the newest one.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._queue: "queue.Queue[Optional[Tuple[str, Any]]]" = queue.Queue()
+        self._reader = self._connect()
+        self._reader.executescript(SCHEMA)
+        self._lock = threading.Lock()  # Guards the shared reader connection
+        self._thread = threading.Thread(
+            target=self._run, name="table-store-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    # -- writes (non-blocking) -------------------------------------------
+
+    def save(self, table: Table) -> None:
+        """Queue a snapshot of the table's current state."""
+        self._queue.put(("snapshot", dump_table(table)))
+
+    def record(self, table: Table, command: str, args: Tuple[Any, ...]) -> None:
+        """Append an applied command to the action log and snapshot the table."""
+        self._queue.put(
+            ("action", (table.id, table.version, command, json.dumps(args)))
+        )
+        self.save(table)
+
+    def flush(self) -> None:
+        """Block until every queued write has been committed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        with self._lock:
+            self._reader.close()
+
+    def _run(self) -> None:
+        conn = self._connect()
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            # Group commit: take everything that queued up during the last fsync
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            snapshots: Dict[str, Dict[str, Any]] = {}
+            actions: List[Tuple[Any, ...]] = []
+            for item in batch:
+                if item is None:
+                    running = False
+                elif item[0] == "snapshot":
+                    snapshots[item[1]["id"]] = item[1]
+                else:
+                    actions.append(item[1] + (time.time(),))
+
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO actions (table_id, version, command, args, created_at)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        actions,
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO tables (table_id, version, state, updated_at)"
+                        " VALUES (?, ?, ?, ?)",
+                        [
+                            (tid, rec["version"], json.dumps(rec), time.time())
+                            for tid, rec in snapshots.items()
+                        ],
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Table store write failed: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
+
+    # -- reads -----------------------------------------------------------
+
+    def table_ids(self) -> Set[str]:
+        with self._lock:
+            rows = self._reader.execute("SELECT table_id FROM tables").fetchall()
+        return {row[0] for row in rows}
+
+    def load(self, table_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._reader.execute(
+                "SELECT state FROM tables WHERE table_id = ?", (table_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def actions(self, table_id: str) -> List[Tuple[int, str, Any]]:
+        with self._lock:
+            rows = self._reader.execute(
+                "SELECT version, command, args FROM actions"
+                " WHERE table_id = ? ORDER BY id",
+                (table_id,),
+            ).fetchall()
+        return [(version, command, json.loads(args)) for version, command, args in rows]
@@ -0,0 +1,455 @@
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from .logic import Table, Player, PlayerType, DEFAULT_TABLE_ID
+from .ai import GeminiPokerAgent
+from .chat import CHAT_CAPACITY, ChatManager, ChatMessage
+from .persistence import TableStore, restore_table
+from .chatlog import ChatLog
+from .cache import ChatReplyCache, DecisionCache
+from .speculation import Speculator
+from .gateway import LLMGateway
+from .clients import ClientPool, new_client
+from .standin import StandInClient, StandInConfig
+from .strategy import StrategyAgent
+from .agents import PokerAgent, ProcessPoolAgent, shared_executor
+from . import evaluator
+from .metrics import REGISTRY, Gauge
+
+logger = logging.getLogger(__name__)
+
+
+# Shared by every Gemini seat in this process
+decision_cache = DecisionCache(
+    ttl=float(os.environ.get("POKER_AI_CACHE_TTL", "600")),
+    explore=float(os.environ.get("POKER_AI_EXPLORE", "0")),
+)
+
+# Bot banter for repeated messages ("gg", "nice hand") is served from here
+chat_cache = ChatReplyCache(
+    ttl=float(os.environ.get("POKER_CHAT_CACHE_TTL", "1800")),
+    fresh=float(os.environ.get("POKER_CHAT_FRESH", "0.2")),
+)
+
+MODEL_NAME = "gemini-2.5-pro"
+
+# "gemini", or "standin" for the offline model stand-in used in load tests
+LLM_BACKEND = os.environ.get("POKER_LLM_BACKEND", "gemini")
+if LLM_BACKEND not in ("gemini", "standin"):
+    raise ValueError(f"Unknown POKER_LLM_BACKEND: {LLM_BACKEND}")
+
+
+def model_api_key() -> Optional[str]:
+    if LLM_BACKEND == "standin":
+        return "standin"  # Any key; the stand-in never checks it
+    return os.environ.get("GEMINI_API_KEY")
+
+
+def _new_standin_client(api_key: str) -> StandInClient:
+    return StandInClient(StandInConfig.from_env())
+
+
+# genai clients (and their kept-alive connections) shared by every bot
+client_pool = ClientPool(
+    size=int(os.environ.get("POKER_GENAI_CLIENTS", "4")),
+    factory=_new_standin_client if LLM_BACKEND == "standin" else new_client,
+)
+
+# Concurrency cap, deadline, rate limit and circuit breaker for every model call
+gateway = LLMGateway(
+    max_concurrency=int(os.environ.get("POKER_LLM_CONCURRENCY", "8")),
+    timeout=float(os.environ.get("POKER_LLM_TIMEOUT", "10")),
+    queue_timeout=float(
+        os.environ.get(
+            "POKER_LLM_QUEUE_TIMEOUT", os.environ.get("POKER_LLM_TIMEOUT", "10")
+        )
+    ),
+    rate=float(os.environ.get("POKER_LLM_RATE", "5")),
+    burst=float(os.environ.get("POKER_LLM_BURST", "10")),
+    failure_threshold=int(os.environ.get("POKER_LLM_BREAKER_FAILURES", "5")),
+    reset_after=float(os.environ.get("POKER_LLM_BREAKER_RESET", "30")),
+)
+
+
+def _cache_stats() -> Dict[str, Dict[str, float]]:
+    return {
+        "evaluator": evaluator.stats(),
+        "decision": decision_cache.stats(),
+        "chat": chat_cache.stats(),
+    }
+
+
+# Read from the counters these objects already keep, only when scraped
+REGISTRY.register(
+    Gauge(
+        "poker_evaluator_calls_total",
+        "Hand evaluations requested, cached or not.",
+        lambda: evaluator.stats()["calls"],
+        kind="counter",
+    ),
+    Gauge(
+        "poker_cache_hits_total",
+        "Lookups answered from cache.",
+        lambda: [((name,), s["hits"]) for name, s in _cache_stats().items()],
+        ("cache",),
+        kind="counter",
+    ),
+    Gauge(
+        "poker_cache_misses_total",
+        "Lookups that missed the cache.",
+        lambda: [((name,), s["misses"]) for name, s in _cache_stats().items()],
+        ("cache",),
+        kind="counter",
+    ),
+    Gauge(
+        "poker_cache_hit_ratio",
+        "Share of lookups answered from cache since startup.",
+        lambda: [((name,), s["hit_rate"]) for name, s in _cache_stats().items()],
+        ("cache",),
+    ),
+    Gauge(
+        "poker_llm_calls_total",
+        "Model calls made through the gateway.",
+        lambda: gateway.calls,
+        kind="counter",
+    ),
+    Gauge(
+        "poker_llm_errors_total",
+        "Model calls that failed, timed out, were rejected by the open "
+        "breaker, or found no free slot in time (busy).",
+        lambda: [
+            (("failure",), gateway.failures),
+            (("timeout",), gateway.timeouts),
+            (("rejected",), gateway.rejected),
+            (("busy",), gateway.busy),
+        ],
+        ("reason",),
+        kind="counter",
+    ),
+    Gauge(
+        "poker_llm_breaker_open",
+        "1 while the model circuit breaker is open.",
+        lambda: int(gateway.breaker.state == "open"),
+    ),
+)
+
+# Wasted speculative AI calls allowed per table and hand; 0 disables speculation
+SPECULATION_BUDGET = int(os.environ.get("POKER_SPECULATION_BUDGET", "0"))
+
+
+# Tables one process holds at most; beyond this, idle tables are evicted
+MAX_TABLES = int(os.environ.get("POKER_MAX_TABLES", "10000"))
+
+# Seconds without a request before a table may be evicted to make room
+TABLE_IDLE_SECONDS = float(os.environ.get("POKER_TABLE_IDLE_SECONDS", "1800"))
+
+# Agent kind for each bot seat of a new table: "gemini" or "strategy".
+# A table created with its own `bots` list uses that instead.
+BOT_AGENTS = os.environ.get("POKER_BOT_AGENTS", "gemini,gemini").split(",")
+
+# Worker processes for CPU-bound bots; 0 runs them on the event loop. An
+# unmemoized strategy hold search takes ~30 ms, too long for the loop.
+AGENT_PROCESSES = int(
+    os.environ.get("POKER_AGENT_PROCESSES", str(min(4, os.cpu_count() or 1)))
+)
+
+
+def new_agent(kind: str = GeminiPokerAgent.kind) -> PokerAgent:
+    if kind == StrategyAgent.kind:
+        if AGENT_PROCESSES > 0:
+            return ProcessPoolAgent(StrategyAgent(), shared_executor(AGENT_PROCESSES))
+        return StrategyAgent()
+    if kind != GeminiPokerAgent.kind:
+        raise ValueError(f"Unknown bot agent: {kind}")
+    return GeminiPokerAgent(
+        api_key=model_api_key(),
+        model_name=MODEL_NAME,
+        decision_cache=decision_cache,
+        gateway=gateway,
+        client_pool=client_pool,
+        chat_cache=chat_cache,
+    )
+
+
+def new_table(
+    table_id: str = DEFAULT_TABLE_ID, bots: Optional[Sequence[str]] = None
+) -> Table:
+    """
+    Build a fresh table with one human seat and a bot per entry of `bots`
+    (agent kinds, `BOT_AGENTS` by default). Raises `ValueError` for an
+    unknown kind.
+    """
+    chat_manager = ChatManager()
+    table = Table(chat_manager=chat_manager, table_id=table_id)
+    table.add_player(Player(id="player1", name="You", type=PlayerType.HUMAN))
+    for i, kind in enumerate(bots or BOT_AGENTS, start=1):
+        table.add_player(
+            Player(
+                id=f"bot{i}",
+                name=f"Bot {i}",
+                type=PlayerType.AI,
+                agent=new_agent(kind.strip()),
+            )
+        )
+    return table
+
+
+class TableLimitError(Exception):
+    """Raised when a table cannot be created because every slot is busy."""
+
+
+class TableRegistry:
+    """
+    The tables owned by this process, keyed by table id.
+
+    Only the default table is created on first access; any other table
+    must be created explicitly with `create`, so a request naming an
+    unknown table id cannot allocate anything. A worker in a
+    multi-process deployment only ever holds the shard of tables routed
+    to it. With a store, startup only reads the index of saved table ids;
+    each saved table is restored the first time it is requested. New
+    tables come from `factory(table_id, bots)`, where `bots` is the agent
+    kinds asked for at creation (None for the default seats); a reset
+    game keeps the kinds of bot the old one had.
+
+    At most `max_tables` are held. Creating one more evicts the least
+    recently used table if it has been idle for `idle_seconds` (a saved
+    table can be restored again later); otherwise creation fails with
+    `TableLimitError`.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str, Optional[Sequence[str]]], Table] = new_table,
+        store: Optional[TableStore] = None,
+        agent_factory: Callable[..., PokerAgent] = new_agent,
+        speculation_budget: int = SPECULATION_BUDGET,
+        chat_log: Optional[ChatLog] = None,
+        max_tables: int = MAX_TABLES,
+        idle_seconds: float = TABLE_IDLE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.factory = factory
+        self.store = store
+        self.chat_log = chat_log
+        self.agent_factory = agent_factory
+        self.speculation_budget = speculation_budget
+        self.max_tables = max_tables
+        self.idle_seconds = idle_seconds
+        self.clock = clock
+        # Least recently used first, with the time each table was last used
+        self._tables: "OrderedDict[str, Table]" = OrderedDict()
+        self._last_used: "OrderedDict[str, float]" = OrderedDict()
+        self._saved: Set[str] = store.table_ids() if store else set()
+        # Saved records and chat log tails read off the loop by `open`,
+        # consumed by `_restore` and `_attach`
+        self._records: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._chat_tails: Dict[str, Tuple[List[ChatMessage], int]] = {}
+        if self._saved:
+            logger.info(f"{len(self._saved)} saved tables available for restore")
+
+    def get(self, table_id: str = DEFAULT_TABLE_ID) -> Table:
+        """
+        A held or saved table. Raises `KeyError` for an unknown id, except
+        the default table, which is created on first access.
+        """
+        table = self._tables.get(table_id)
+        if table is not None:
+            self._touch(table_id)
+            return table
+        if table_id in self._saved or table_id == DEFAULT_TABLE_ID:
+            return self.create(table_id)
+        raise KeyError(table_id)
+
+    def create(self, table_id: str, bots: Optional[Sequence[str]] = None) -> Table:
+        """
+        The table for `table_id`, restored or created if not held yet. A
+        new table gets a bot per agent kind in `bots`, if given; an
+        existing one keeps its seats.
+        """
+        table = self._tables.get(table_id)
+        if table is not None:
+            self._touch(table_id)
+            return table
+        self._make_room()
+        table = self._restore(table_id)
+        if table is None:
+            table = self._create(table_id, bots=bots)
+            logger.info(f"Created table {table_id}")
+        self._hold(table_id, table)
+        return table
+
+    async def open(
+        self,
+        table_id: str = DEFAULT_TABLE_ID,
+        create: bool = False,
+        bots: Optional[Sequence[str]] = None,
+    ) -> Table:
+        """
+        `get` (or with `create`, `create`) for request handlers. A table
+        about to be held has its saved record and chat log tail read in a
+        worker thread first, so restoring it never blocks the event loop
+        on disk.
+        """
+        if table_id not in self._tables:
+            if self.store is not None and table_id in self._saved:
+                self._records[table_id] = await asyncio.to_thread(
+                    self.store.load, table_id
+                )
+            if self.chat_log is not None and (
+                create or table_id in self._saved or table_id == DEFAULT_TABLE_ID
+            ):
+                self._chat_tails[table_id] = await asyncio.to_thread(
+                    self.chat_log.tail, table_id, CHAT_CAPACITY
+                )
+        try:
+            return self.create(table_id, bots) if create else self.get(table_id)
+        finally:
+            self._records.pop(table_id, None)
+            self._chat_tails.pop(table_id, None)
+
+    def put(self, table_id: str, table: Table) -> None:
+        table.id = table_id
+        self._attach(table)
+        self._hold(table_id, table)
+
+    def _touch(self, table_id: str) -> None:
+        self._tables.move_to_end(table_id)
+        self._last_used[table_id] = self.clock()
+        self._last_used.move_to_end(table_id)
+
+    def _hold(self, table_id: str, table: Table) -> None:
+        self._tables[table_id] = table
+        self._touch(table_id)
+
+    def _make_room(self) -> None:
+        if len(self._tables) < self.max_tables:
+            return
+        now = self.clock()
+        for table_id, last_used in self._last_used.items():
+            if now - last_used < self.idle_seconds:
+                break  # Everything after this was used more recently
+            table = self._tables[table_id]
+            if table.actor.idle and not table.replier.pending:
+                self.evict(table_id)
+                return
+        raise TableLimitError(f"All {self.max_tables} tables are in use")
+
+    def evict(self, table_id: str) -> None:
+        """Drop a held table; a saved one is restored on its next request."""
+        table = self._tables.pop(table_id, None)
+        self._last_used.pop(table_id, None)
+        if table is not None:
+            table.chat_manager = None
+            table.actor.detach()
+            logger.info(f"Evicted idle table {table_id}")
+
+    def reset(self, table_id: str = DEFAULT_TABLE_ID) -> Table:
+        """A fresh game for a held, saved or default table; `KeyError` otherwise."""
+        old = self._tables.get(table_id)
+        if old is None:
+            if table_id not in self._saved and table_id != DEFAULT_TABLE_ID:
+                raise KeyError(table_id)
+            self._make_room()
+        # Chat history, its sequence and push subscribers outlive the game,
+        # and the new game seats the same kinds of bot
+        chat_manager = old.chat_manager if old else None
+        bots = [p.agent.kind for p in old.players if p.agent] if old else None
+        if old is not None:
+            old.chat_manager = None  # Stop the old game's events reaching it
+            # A bot move still in flight must not journal over the new game
+            old.actor.detach()
+        table = self._create(table_id, chat_manager, bots)
+        self._hold(table_id, table)
+        return table
+
+    def _attach(self, table: Table) -> None:
+        table.actor.journal = self.store
+        chat_manager = table.chat_manager
+        if self.chat_log is not None and chat_manager and chat_manager.log is None:
+            tail = self._chat_tails.pop(table.id, None)
+            chat_manager.attach_log(self.chat_log, table.id, tail)
+        if self.speculation_budget > 0:
+            table.actor.speculator = Speculator(budget=self.speculation_budget)
+
+    def _create(
+        self,
+        table_id: str,
+        chat_manager: Optional[ChatManager] = None,
+        bots: Optional[Sequence[str]] = None,
+    ) -> Table:
+        table = self.factory(table_id, bots)
+        if chat_manager is not None:
+            table.chat_manager = chat_manager
+        self._attach(table)
+        if self.store:
+            self.store.save(table)
+            self._saved.add(table_id)
+        return table
+
+    def _restore(self, table_id: str) -> Optional[Table]:
+        if self.store is None or table_id not in self._saved:
+            return None
+        if table_id in self._records:
+            record = self._records.pop(table_id)
+        else:
+            record = self.store.load(table_id)
+        if record is None:
+            return None
+        table = restore_table(record, self.agent_factory)
+        self._attach(table)
+        logger.info(f"Restored table {table_id} at version {table.version}")
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Resume a hand that was interrupted on an AI player's turn
+            table.actor.kick()
+        return table
+
+    def gauges(self) -> List[Gauge]:
+        """Table, seat and background AI work counts, read at scrape time."""
+
+        def players() -> List:
+            seated = {"human": 0, "ai": 0}
+            for table in self._tables.values():
+                for player in table.players:
+                    seated[player.type.value] += 1
+            return [((kind,), count) for kind, count in seated.items()]
+
+        def ai_tasks() -> List:
+            queued = replies = in_flight = 0
+            for table in self._tables.values():
+                queued += table.actor.pending
+                replies += table.replier.pending
+                in_flight += table.actor.ai_in_flight
+            return [
+                (("actor",), queued),
+                (("chat_replies",), replies),
+                (("prefetch",), in_flight),
+            ]
+
+        return [
+            Gauge("poker_tables_active", "Tables held by this process.", self.__len__),
+            Gauge("poker_players_seated", "Seated players.", players, ("type",)),
+            Gauge(
+                "poker_ai_tasks_pending",
+                "Background AI work: queued table commands, chat replies "
+                "waiting for a bot, and decisions computed ahead of turn.",
+                ai_tasks,
+                ("queue",),
+            ),
+        ]
+
+    def __contains__(self, table_id: object) -> bool:
+        return table_id in self._tables
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __iter__(self) -> Iterator[Table]:
+        return iter(list(self._tables.values()))
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import random
+from collections import deque
+from typing import Deque, Optional, TYPE_CHECKING
+from .models import PlayerType
+
+if TYPE_CHECKING:
+    from .logic import Table
+
+logger = logging.getLogger(__name__)
+
+# Chance that a bot answers a given human message, to keep chat from being too noisy
+REPLY_CHANCE = 0.5
+
+
+class ChatReplier:
+    """
+    Produces bot chat replies off the request path.
+
+    `/chat/send` only enqueues the human's message; a per-table worker asks
+    one bot for a reply and posts it to the table chat. At most
+    `max_pending` messages wait for an answer. When more arrive, the oldest
+    unanswered one is dropped, so a burst of messages is answered once,
+    in reply to the latest.
+    """
+
+    def __init__(self, table: "Table", max_pending: int = 1) -> None:
+        self.table = table
+        self.max_pending = max_pending
+        self._pending: Deque[str] = deque()
+        self._worker: Optional[asyncio.Task] = None
+        self.replied = 0
+        self.coalesced = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(self, text: str) -> None:
+        """Queue a reply to a human message without waiting for it."""
+        while len(self._pending) >= self.max_pending:
+            self._pending.popleft()
+            self.coalesced += 1
+        self._pending.append(text)
+
+        loop = asyncio.get_running_loop()
+        worker = self._worker
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            self._worker = loop.create_task(self._drain())
+
+    async def join(self) -> None:
+        """Wait until every queued reply has been posted."""
+        worker = self._worker
+        if worker is None or worker.done():
+            return
+        if worker.get_loop() is not asyncio.get_running_loop():
+            return
+        await asyncio.shield(worker)
+
+    async def _drain(self) -> None:
+        while self._pending:
+            text = self._pending.popleft()
+            try:
+                await self._reply(text)
+            except Exception as e:
+                logger.error(f"Chat reply failed: {e}", exc_info=True)
+
+    async def _reply(self, text: str) -> None:
+        table = self.table
+        chat_manager = table.chat_manager
+        if chat_manager is None:
+            return
+        # Get history for context
+        history = [m.text for m in chat_manager.get_messages(limit=10)]
+
+        for player in table.players:
+            if player.type == PlayerType.AI and player.agent:
+                if random.random() < REPLY_CHANCE:
+                    response_text = await player.agent.decide_chat_response(
+                        text, history, *table.observe(player)
+                    )
+                    chat_manager.add_message(player.id, response_text)
+                    self.replied += 1
+                    break  # Only one bot responds per user message
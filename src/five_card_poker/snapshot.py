@@ -0,0 +1,205 @@
+import json
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, Mapping, Tuple, TYPE_CHECKING
+from .models import DECK, Card, Hand
+from .wire import compact_player, compact_table, encode
+
+if TYPE_CHECKING:
+    from .logic import Player, Table
+
+
+# JSON for each interned card, so hands are joined rather than serialized
+CARD_JSON: Mapping[Card, bytes] = MappingProxyType(
+    {card: card.model_dump_json().encode() for card in DECK}
+)
+
+
+def _dumps(value: object) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _seat_parts(player: "Player") -> Tuple[bytes, bytes]:
+    """The seat's `PlayerState` JSON before and after the hand value."""
+    head = b'{"id":%s,"name":%s,"type":"%s","balance":%d,"hand":' % (
+        _dumps(player.id),
+        _dumps(player.name),
+        player.type.value.encode(),
+        player.balance,
+    )
+    tail = (
+        b',"is_folded":%s,"current_bet":%d,"last_action":%s,"is_active":%s,'
+        b'"has_acted":%s}'
+        % (
+            b"true" if player.is_folded else b"false",
+            player.current_bet,
+            _dumps(player.last_action),
+            b"true" if player.is_active else b"false",
+            b"true" if player.has_acted else b"false",
+        )
+    )
+    return head, tail
+
+
+def encode_hand(hand: Hand) -> bytes:
+    """A hand's JSON from cached card fragments; evaluates the hand."""
+    cards = b",".join(CARD_JSON[card] for card in hand.cards)
+    return b'{"cards":[%s],"rank":%s,"score":%d}' % (
+        cards,
+        _dumps(hand.rank),
+        hand.score,
+    )
+
+
+def encode_seat(player: "Player") -> Tuple[bytes, bytes]:
+    """
+    The seat's `PlayerState` JSON with the hand visible and hidden, built
+    from cached card fragments without constructing or validating models.
+    """
+    head, tail = _seat_parts(player)
+    hidden = head + b"null" + tail
+    if player.hand is None:
+        return hidden, hidden
+    return head + encode_hand(player.hand) + tail, hidden
+
+
+class _LazyFragments(Mapping[str, bytes]):
+    """
+    Fragments built on first lookup and then kept, so a seat's visible
+    hand is only encoded (and evaluated) once its owner actually asks.
+    """
+
+    __slots__ = ("_build", "_built")
+
+    def __init__(self, build: Dict[str, Callable[[], bytes]]) -> None:
+        self._build = build
+        self._built: Dict[str, bytes] = {}
+
+    def __getitem__(self, key: str) -> bytes:
+        fragment = self._built.get(key)
+        if fragment is None:
+            fragment = self._built[key] = self._build[key]()
+        return fragment
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._build)
+
+    def __len__(self) -> int:
+        return len(self._build)
+
+
+def _ready(fragment: bytes) -> Callable[[], bytes]:
+    return lambda: fragment
+
+
+def _visible(head: bytes, hand: Hand, tail: bytes) -> Callable[[], bytes]:
+    return lambda: head + encode_hand(hand) + tail
+
+
+@dataclass(frozen=True)
+class TableSnapshot:
+    """
+    Immutable, pre-serialized view of a table at one version.
+
+    `public` holds one JSON fragment per seat with hidden hands; `private`
+    holds the same fragment with the hand visible, keyed by player id and
+    built on first lookup. A reader only swaps in its own private fragment
+    and joins the bytes, so serving /state never touches the live Table
+    or its players.
+    """
+
+    version: int
+    seats: Mapping[str, int]
+    public: Tuple[bytes, ...]
+    private: Mapping[str, bytes]
+    tail: bytes
+    players_key: bytes = b"players"
+
+    def render(self, observer_id: str) -> bytes:
+        fragments = self.public
+        seat = self.seats.get(observer_id)
+        if seat is not None:
+            fragments = (
+                fragments[:seat] + (self.private[observer_id],) + fragments[seat + 1 :]
+            )
+        return b'{"%s":[%s],%s' % (self.players_key, b",".join(fragments), self.tail)
+
+    @cached_property
+    def compact(self) -> "TableSnapshot":
+        """
+        The same snapshot in the compact wire format (see `wire.py`),
+        converted on first use so tables without compact clients never
+        pay for it.
+        """
+
+        def convert(fragment: bytes) -> bytes:
+            return encode(compact_player(json.loads(fragment)))
+
+        tail = encode(compact_table(json.loads(b"{" + self.tail)))[1:]
+        public = tuple(convert(fragment) for fragment in self.public)
+
+        def build(player_id: str, seat: int) -> Callable[[], bytes]:
+            def compact_private() -> bytes:
+                fragment = self.private[player_id]
+                return (
+                    public[seat] if fragment == self.public[seat] else convert(fragment)
+                )
+
+            return compact_private
+
+        return TableSnapshot(
+            version=self.version,
+            seats=self.seats,
+            public=public,
+            private=_LazyFragments(
+                {
+                    player_id: build(player_id, seat)
+                    for player_id, seat in self.seats.items()
+                }
+            ),
+            tail=tail,
+            players_key=b"pl",
+        )
+
+    @classmethod
+    def capture(cls, table: "Table", version: int) -> "TableSnapshot":
+        reveal = table.phase == "showdown"
+        public = []
+        private: Dict[str, Callable[[], bytes]] = {}
+        for p in table.players:
+            head, tail = _seat_parts(p)
+            hidden = head + b"null" + tail
+            if p.hand is None:
+                private[p.id] = _ready(hidden)
+                public.append(hidden)
+            elif reveal:
+                visible = head + encode_hand(p.hand) + tail
+                private[p.id] = _ready(visible)
+                public.append(visible)
+            else:
+                # Hands nobody looks at are never evaluated
+                private[p.id] = _visible(head, p.hand, tail)
+                public.append(hidden)
+
+        tail = json.dumps(
+            {
+                "pot": table.pot,
+                "current_bet": table.current_bet,
+                "phase": table.phase,
+                "active_player_id": table.players[table.active_player_idx].id
+                if table.players
+                else None,
+                "dealer_idx": table.dealer_idx,
+                "deck_count": len(table.deck),
+            },
+            separators=(",", ":"),
+        ).encode()[1:]
+
+        return cls(
+            version=version,
+            seats=MappingProxyType({p.id: i for i, p in enumerate(table.players)}),
+            public=tuple(public),
+            private=_LazyFragments(private),
+            tail=tail,
+        )
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+from .models import PlayerState, PlayerType, TableState
+
+if TYPE_CHECKING:
+    from .logic import Table
+
+logger = logging.getLogger(__name__)
+
+BETTING_PHASES = ("betting_1", "betting_2")
+
+SituationKey = Tuple[str, str, str]
+
+
+def situation_key(player_state: PlayerState, table_state: TableState) -> SituationKey:
+    """Exact inputs of a betting decision; a speculation is only used on a match."""
+    return (
+        player_state.id,
+        player_state.model_dump_json(),
+        table_state.model_dump_json(),
+    )
+
+
+class Speculator:
+    """
+    Precomputes the next AI player's betting decision while a human decides.
+
+    For each likely human move (check or call, and fold) the table is cloned,
+    the move applied, and the AI seat that would act next is asked for its
+    decision in the background. When that AI's turn really comes, the
+    speculation whose inputs match the real state is committed and the rest
+    are cancelled, so the bot answers as soon as the human acts.
+
+    `budget` caps the speculative calls a table may waste (cancelled or
+    unused) in one hand; every speculation that is committed earns one
+    call back, and the allowance is renewed when the next hand starts.
+    """
+
+    def __init__(self, budget: int = 20) -> None:
+        self.budget = budget
+        self.launched = 0
+        self.hits = 0
+        self.wasted = 0
+        self._tasks: Dict[SituationKey, asyncio.Task] = {}
+        # The human the outstanding speculations are for, and the last
+        # phase seen, to notice a change of turn and a new hand
+        self._human: Optional[str] = None
+        self._phase: Optional[str] = None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    def speculate(self, table: "Table") -> None:
+        """
+        Start speculating on the human player whose turn it is.
+
+        Outstanding speculations are kept while the same human is still on
+        turn and discarded otherwise.
+        """
+        # A hand always opens with betting_1 after some other phase
+        if table.phase == "betting_1" and self._phase != "betting_1":
+            self.wasted = 0
+        self._phase = table.phase
+
+        human = (
+            table.players[table.active_player_idx]
+            if table.phase in BETTING_PHASES and table.players
+            else None
+        )
+        if human is None or human.type != PlayerType.HUMAN:
+            self.discard()
+            return
+        if self._tasks and human.id != self._human:
+            self.discard()
+        if self._tasks or self.wasted >= self.budget:
+            return
+
+        self._human = human.id
+
+        move = "call" if table.current_bet > human.current_bet else "check"
+        loop = asyncio.get_running_loop()
+        for action in (move, "fold"):
+            if self.wasted + len(self._tasks) >= self.budget:
+                break
+            clone = table.clone()
+            try:
+                clone.handle_action(human.id, action)
+            except ValueError:
+                continue
+            if clone.phase not in BETTING_PHASES:
+                continue
+            bot = clone.players[clone.active_player_idx]
+            agent = table.players[clone.active_player_idx].agent
+            if bot.type != PlayerType.AI or agent is None:
+                continue
+
+            player_state, table_state = clone.observe(bot)
+            key = situation_key(player_state, table_state)
+            if key in self._tasks:
+                continue
+            self._tasks[key] = loop.create_task(
+                agent.decide_betting_action(player_state, table_state)
+            )
+            self.launched += 1
+
+    async def take(self, table: "Table") -> Optional[Tuple[str, int]]:
+        """
+        The speculated decision for the AI player now on turn, if one matches.
+
+        Every other speculation is discarded.
+        """
+        if not self._tasks or table.phase not in BETTING_PHASES:
+            self.discard()
+            return None
+        player = table.players[table.active_player_idx]
+        key = situation_key(*table.observe(player))
+        task = self._tasks.pop(key, None)
+        self.discard()
+        if task is None:
+            return None
+        try:
+            decision = await task
+        except Exception as e:
+            self.wasted += 1
+            logger.warning(f"Speculative decision failed: {e}")
+            return None
+        self.hits += 1
+        self.wasted = max(self.wasted - 1, 0)
+        return decision
+
+    def discard(self) -> None:
+        """Cancel all outstanding speculations, charging them to the budget."""
+        for task in self._tasks.values():
+            task.cancel()
+        self.wasted += len(self._tasks)
+        self._tasks.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "launched": self.launched,
+            "hits": self.hits,
+            "wasted": self.wasted,
+            "in_flight": len(self._tasks),
+        }
@@ -0,0 +1,148 @@
+import asyncio
+import json
+import os
+import random
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+
+class StandInError(Exception):
+    """Simulated API failure (e.g. a 503 from the model endpoint)."""
+
+
+@dataclass(frozen=True)
+class StandInConfig:
+    """
+    Behaviour of the local model stand-in.
+
+    `latency` picks the distribution of response times around `median`
+    seconds: fixed, uniform over median ± spread, or lognormal with shape
+    `spread`. `error_rate` and `malformed_rate` are the probabilities of a
+    call raising `StandInError` or answering with invalid JSON.
+    """
+
+    latency: str = "lognormal"
+    median: float = 0.8
+    spread: float = 0.5
+    error_rate: float = 0.0
+    malformed_rate: float = 0.0
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {self.latency}")
+
+    @classmethod
+    def from_env(cls) -> "StandInConfig":
+        seed = os.environ.get("POKER_STANDIN_SEED")
+        return cls(
+            latency=os.environ.get("POKER_STANDIN_LATENCY", "lognormal"),
+            median=float(os.environ.get("POKER_STANDIN_MEDIAN", "0.8")),
+            spread=float(os.environ.get("POKER_STANDIN_SPREAD", "0.5")),
+            error_rate=float(os.environ.get("POKER_STANDIN_ERROR_RATE", "0")),
+            malformed_rate=float(os.environ.get("POKER_STANDIN_MALFORMED_RATE", "0")),
+            seed=int(seed) if seed else None,
+        )
+
+
+class StandInResponse:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class _StandInModels:
+    def __init__(self, client: "StandInClient") -> None:
+        self._client = client
+
+    async def generate_content(
+        self, model: str, contents: str, config: Any = None
+    ) -> StandInResponse:
+        return await self._client.generate(contents)
+
+    async def get(self, model: str) -> Dict[str, str]:
+        return {"name": model}
+
+
+class _StandInAio:
+    def __init__(self, client: "StandInClient") -> None:
+        self.models = _StandInModels(client)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class StandInClient:
+    """
+    Offline replacement for the parts of `genai.Client` the agents use
+    (`aio.models.generate_content`, `aio.models.get`, `aio.aclose`, `close`).
+
+    Answers are plausible JSON for the betting, draw and chat prompts in
+    `ai.py`, returned after a simulated latency, so the async AI path,
+    gateway limits and fallbacks can be load-tested without the API.
+    """
+
+    def __init__(self, config: Optional[StandInConfig] = None) -> None:
+        self.config = config or StandInConfig()
+        self.rng = random.Random(self.config.seed)
+        self.aio = _StandInAio(self)
+        self.calls = 0
+        self.errors = 0
+        self.malformed = 0
+
+    def close(self) -> None:
+        pass
+
+    def sample_latency(self) -> float:
+        config = self.config
+        if config.latency == "fixed":
+            return config.median
+        if config.latency == "uniform":
+            return max(
+                self.rng.uniform(
+                    config.median - config.spread, config.median + config.spread
+                ),
+                0.0,
+            )
+        return self.rng.lognormvariate(0.0, config.spread) * config.median
+
+    async def generate(self, prompt: str) -> StandInResponse:
+        self.calls += 1
+        await asyncio.sleep(self.sample_latency())
+        if self.rng.random() < self.config.error_rate:
+            self.errors += 1
+            raise StandInError("503 UNAVAILABLE (stand-in)")
+        if self.rng.random() < self.config.malformed_rate:
+            self.malformed += 1
+            return StandInResponse('{"action": "call", "amount": ')
+        return StandInResponse(json.dumps(self._answer(prompt)))
+
+    def _answer(self, prompt: str) -> Dict[str, Any]:
+        if '"held_indices"' in prompt:
+            return {
+                "held_indices": sorted(
+                    self.rng.sample(range(5), self.rng.randint(0, 5))
+                )
+            }
+        if '"response"' in prompt:
+            return {
+                "response": self.rng.choice(
+                    ["Nice try.", "All in my head.", "Read you like a book."]
+                )
+            }
+
+        match = re.search(r"Current Bet to Match: (\d+)", prompt)
+        current_bet = int(match.group(1)) if match else 0
+        action = self.rng.choices(["check", "call", "raise", "fold"], [4, 4, 1, 1])[0]
+        if action == "raise":
+            return {"action": action, "amount": current_bet + 10}
+        return {"action": action, "amount": 0}
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "malformed": self.malformed,
+        }
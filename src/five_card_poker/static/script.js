@@ -22,6 +22,61 @@ document.addEventListener('DOMContentLoaded', () => {
     let heldIndices = [];
     let currentPhase = 'waiting';
     let playerId = 'player1';
+    // Tables are selected with ?table_id=... on the page URL
+    const pageParams = new URLSearchParams(window.location.search);
+    const tableId = pageParams.get('table_id') || 'default';
+
+    function apiUrl(path) {
+        const sep = path.includes('?') ? '&' : '?';
+        return `${path}${sep}table_id=${encodeURIComponent(tableId)}`;
+    }
+
+    // Game state is requested in the compact wire format (short keys,
+    // "Th"-style card codes) and expanded to the full field names here.
+    const COMPACT_TYPE = 'application/vnd.five-card-poker.compact+json';
+    const STATE_HEADERS = { 'Content-Type': 'application/json', 'Accept': COMPACT_TYPE };
+    const SUIT_NAMES = { h: 'Hearts', d: 'Diamonds', c: 'Clubs', s: 'Spades' };
+
+    function decodeCards(codes) {
+        const cards = [];
+        for (let i = 0; i < codes.length; i += 2) {
+            cards.push({
+                suit: SUIT_NAMES[codes[i + 1]],
+                rank: codes[i] === 'T' ? '10' : codes[i]
+            });
+        }
+        return cards;
+    }
+
+    function decodePlayer(p) {
+        return {
+            id: p.i,
+            name: p.n,
+            type: p.t === 'h' ? 'human' : 'ai',
+            balance: p.b,
+            hand: p.h ? { cards: decodeCards(p.h.c), rank: p.h.r, score: p.h.s } : null,
+            is_folded: Boolean(p.f),
+            current_bet: p.cb || 0,
+            last_action: p.la || '',
+            is_active: p.ac === undefined ? true : Boolean(p.ac),
+            has_acted: Boolean(p.ha)
+        };
+    }
+
+    async function readState(response) {
+        const data = await response.json();
+        const type = response.headers.get('Content-Type') || '';
+        if (!type.startsWith(COMPACT_TYPE)) return data;
+        return {
+            players: data.pl.map(decodePlayer),
+            pot: data.po,
+            current_bet: data.cb,
+            phase: data.ph,
+            active_player_id: data.ap,
+            dealer_idx: data.di,
+            deck_count: data.dc
+        };
+    }
 
     // Theme toggle
     themeToggle.addEventListener('click', () => {
@@ -29,14 +84,24 @@ document.addEventListener('DOMContentLoaded', () => {
         localStorage.setItem('theme', body.classList.contains('dark-mode') ? 'dark' : 'light');
     });
 
-    // Initialize state
-    fetchState();
+    // Initialize state; tables other than the default one are created first
+    if (tableId === 'default') {
+        fetchState();
+    } else {
+        // `bots` (e.g. `strategy,gemini`) picks the agents of a new table
+        const bots = pageParams.get('bots');
+        const query = `table_id=${encodeURIComponent(tableId)}` +
+            (bots ? `&bots=${encodeURIComponent(bots)}` : '');
+        fetch(`/tables?${query}`, { method: 'POST' })
+            .then(fetchState);
+    }
 
     async function fetchState() {
         try {
-            const response = await fetch(`/state?player_id=${playerId}`);
-            const data = await response.json();
-            updateUI(data);
+            const response = await fetch(apiUrl(`/state?player_id=${playerId}`), {
+                headers: { 'Accept': COMPACT_TYPE }
+            });
+            updateUI(await readState(response));
         } catch (error) {
             console.error('Error fetching state:', error);
         }
@@ -156,9 +221,9 @@ document.addEventListener('DOMContentLoaded', () => {
     dealBtn.addEventListener('click', async () => {
         try {
             const bet = parseInt(betAmountInput.value);
-            const response = await fetch('/bet', {
+            const response = await fetch(apiUrl('/bet'), {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: STATE_HEADERS,
                 body: JSON.stringify({ bet })
             });
             if (!response.ok) {
@@ -166,7 +231,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 alert(error.detail || 'Failed to deal');
                 return;
             }
-            updateUI(await response.json());
+            updateUI(await readState(response));
         } catch (error) {
             console.error('Error dealing:', error);
             alert('Connection error');
@@ -175,12 +240,12 @@ document.addEventListener('DOMContentLoaded', () => {
 
     callBtn.addEventListener('click', async () => {
         try {
-            const response = await fetch('/action', {
+            const response = await fetch(apiUrl('/action'), {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: STATE_HEADERS,
                 body: JSON.stringify({ player_id: playerId, action: 'call' })
             });
-            updateUI(await response.json());
+            updateUI(await readState(response));
         } catch (error) {
             console.error('Error calling:', error);
         }
@@ -189,9 +254,9 @@ document.addEventListener('DOMContentLoaded', () => {
     raiseBtn.addEventListener('click', async () => {
         try {
             const amount = parseInt(betAmountInput.value);
-            const response = await fetch('/action', {
+            const response = await fetch(apiUrl('/action'), {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: STATE_HEADERS,
                 body: JSON.stringify({ player_id: playerId, action: 'raise', amount })
             });
             if (!response.ok) {
@@ -199,7 +264,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 alert(error.detail || 'Failed to raise');
                 return;
             }
-            updateUI(await response.json());
+            updateUI(await readState(response));
         } catch (error) {
             console.error('Error raising:', error);
         }
@@ -207,12 +272,12 @@ document.addEventListener('DOMContentLoaded', () => {
 
     foldBtn.addEventListener('click', async () => {
         try {
-            const response = await fetch('/action', {
+            const response = await fetch(apiUrl('/action'), {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: STATE_HEADERS,
                 body: JSON.stringify({ player_id: playerId, action: 'fold' })
             });
-            updateUI(await response.json());
+            updateUI(await readState(response));
         } catch (error) {
             console.error('Error folding:', error);
         }
@@ -220,26 +285,26 @@ document.addEventListener('DOMContentLoaded', () => {
 
     drawBtn.addEventListener('click', async () => {
         try {
-            const response = await fetch('/draw', {
+            const response = await fetch(apiUrl('/draw'), {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: STATE_HEADERS,
                 body: JSON.stringify({ player_id: playerId, held_indices: heldIndices })
             });
-            updateUI(await response.json());
+            updateUI(await readState(response));
         } catch (error) {
             console.error('Error drawing:', error);
         }
     });
 
     shuffleBtn.addEventListener('click', async () => {
-        await fetch('/shuffle', { method: 'POST' });
+        await fetch(apiUrl('/shuffle'), { method: 'POST' });
         alert('Deck shuffled!');
         fetchState();
     });
 
     resetBtn.addEventListener('click', async () => {
         if (confirm('Are you sure you want to reset the entire game? All progress will be lost.')) {
-            await fetch('/reset', { method: 'POST' });
+            await fetch(apiUrl('/reset'), { method: 'POST' });
             fetchState();
             fetchChatMessages();
         }
@@ -259,11 +324,15 @@ document.addEventListener('DOMContentLoaded', () => {
     const chatMessagesDiv = document.getElementById('chat-messages');
     const chatInput = document.getElementById('chat-input');
     const chatSendBtn = document.getElementById('chat-send-btn');
-    let lastMessageTimestamp = 0;
+    // Sequence number of the newest message rendered; polls only fetch newer ones
+    let lastChatSeq = 0;
+    const MAX_CHAT_ELEMENTS = 200;
 
     async function fetchChatMessages() {
         try {
-            const response = await fetch('/chat/messages?limit=50');
+            // First load shows the latest messages, later polls only what is new
+            const query = lastChatSeq ? `after=${lastChatSeq}&limit=50` : 'limit=50';
+            const response = await fetch(apiUrl(`/chat/messages?${query}`));
             if (response.ok) {
                 const messages = await response.json();
                 renderChatMessages(messages);
@@ -274,18 +343,10 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 
     function renderChatMessages(messages) {
-        let shouldScroll = false;
-        
-        // Only append new messages (simple check via length or content, 
-        // but for now we clear and re-render or check against last rendered count?
-        // Actually, re-rendering all is easiest for now, but not efficient.
-        // Let's just clear and re-render.
-        // To avoid flicker, we could diff, but let's keep it simple.
-        
+        if (messages.length === 0) return;
+
         const wasAtBottom = chatMessagesDiv.scrollHeight - chatMessagesDiv.scrollTop === chatMessagesDiv.clientHeight;
         
-        chatMessagesDiv.innerHTML = '';
-        
         messages.forEach(msg => {
             const div = document.createElement('div');
             div.classList.add('chat-msg');
@@ -305,8 +366,13 @@ document.addEventListener('DOMContentLoaded', () => {
             }
             
             chatMessagesDiv.appendChild(div);
+            lastChatSeq = Math.max(lastChatSeq, msg.seq);
         });
 
+        while (chatMessagesDiv.childElementCount > MAX_CHAT_ELEMENTS) {
+            chatMessagesDiv.firstElementChild.remove();
+        }
+
         if (wasAtBottom) {
             chatMessagesDiv.scrollTop = chatMessagesDiv.scrollHeight;
         }
@@ -317,7 +383,7 @@ document.addEventListener('DOMContentLoaded', () => {
         if (!text) return;
 
         try {
-            await fetch('/chat/send', {
+            await fetch(apiUrl('/chat/send'), {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ player_id: playerId, text: text })
@@ -0,0 +1,214 @@
+import itertools
+from collections import Counter
+from math import comb
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from .models import Card, PlayerState, Suit, TableState
+from .cache import TTLCache, canonical_hand
+from .evaluator import RANK_VALUES, evaluate_values
+from .metrics import timed_decision
+
+VALUES = tuple(range(2, 15))
+DECK_SIZE = 52
+ALL_HANDS = comb(DECK_SIZE, 5)
+HOLDS = [held for k in range(6) for held in itertools.combinations(range(5), k)]
+
+# Equity thresholds for betting (equity = strength ** live opponents)
+RAISE_EQUITY = 0.8
+MIN_RAISE = 10
+
+
+def score(values: Sequence[int], flush: bool) -> int:
+    """Same score `evaluator.evaluate_hand` gives, from card values (2-14)."""
+    return evaluate_values(values, flush)[0]
+
+
+def _build_strength_table() -> Dict[Tuple[int, ...], Tuple[float, Optional[float]]]:
+    """
+    Percentile of every 5-card hand among all C(52, 5) hands, keyed by its
+    sorted card values: (percentile off-suit, percentile suited or None).
+
+    Built by enumerating the 6175 possible value multisets and weighting
+    each by how many suit assignments produce it, so it is exact.
+    """
+    weights: Counter = Counter()
+    hands = []
+    for values in itertools.combinations_with_replacement(VALUES, 5):
+        counts = Counter(values)
+        if max(counts.values()) > 4:
+            continue
+        ways = 1
+        for m in counts.values():
+            ways *= comb(4, m)
+        plain, suited = score(values, False), None
+        if len(counts) == 5:
+            suited = score(values, True)
+            weights[suited] += 4
+            ways -= 4
+        weights[plain] += ways
+        hands.append((values, plain, suited))
+
+    scores = sorted(weights)
+    below = list(itertools.accumulate([0] + [weights[s] for s in scores]))
+    percentile = {
+        s: (below[i] + weights[s] / 2) / ALL_HANDS for i, s in enumerate(scores)
+    }
+    return {
+        values: (percentile[plain], percentile[suited] if suited else None)
+        for values, plain, suited in hands
+    }
+
+
+STRENGTH = _build_strength_table()
+# Value multisets of size k with their (value, multiplicity) counts
+MULTISETS = {
+    k: [
+        (values, tuple(Counter(values).items()))
+        for values in itertools.combinations_with_replacement(VALUES, k)
+    ]
+    for k in range(6)
+}
+
+
+def hand_strength(values: Sequence[int], suits: Sequence[object]) -> float:
+    """Percentile of a 5-card hand among all possible hands (0-1)."""
+    plain, suited = STRENGTH[tuple(sorted(values))]
+    return suited if suited is not None and len(set(suits)) == 1 else plain
+
+
+def hold_ev(
+    values: Sequence[int], suits: Sequence[object], held: Sequence[int]
+) -> float:
+    """
+    Exact expected strength percentile after holding `held` and drawing
+    the rest from the 47 unseen cards.
+    """
+    dead = set(zip(values, suits))
+    avail = Counter({v: 4 for v in VALUES})
+    avail.subtract(values)
+    held_values = [values[i] for i in held]
+    held_suits = {suits[i] for i in held}
+    flush_suits: Set[object]
+    if not held:
+        flush_suits = set(Suit)
+    elif len(held_suits) == 1:
+        flush_suits = held_suits
+    else:
+        flush_suits = set()
+
+    draw = 5 - len(held)
+    total = 0.0
+    for drawn, counts in MULTISETS[draw]:
+        ways = 1
+        for v, m in counts:
+            ways *= comb(avail[v], m)
+            if not ways:
+                break
+        if not ways:
+            continue
+        plain, suited = STRENGTH[tuple(sorted(held_values + list(drawn)))]
+        if suited is not None and flush_suits:
+            flush_ways = sum(
+                all((v, s) not in dead for v in drawn) for s in flush_suits
+            )
+            total += (ways - flush_ways) * plain + flush_ways * suited
+        else:
+            total += ways * plain
+    return total / comb(DECK_SIZE - 5, draw)
+
+
+def best_hold(cards: Sequence[Card]) -> Tuple[List[int], float]:
+    """The hold with the highest exact EV, and that EV."""
+    values = [RANK_VALUES[c.rank] for c in cards]
+    suits = [c.suit for c in cards]
+    best: Tuple[int, ...] = ()
+    best_ev = -1.0
+    for held in HOLDS:
+        ev = hold_ev(values, suits, held)
+        if ev > best_ev:
+            best, best_ev = held, ev
+    return list(best), best_ev
+
+
+class StrategyAgent:
+    """
+    Deterministic CPU bot with the same interface as `GeminiPokerAgent`.
+
+    Betting compares equity (hand-strength percentile from precomputed
+    tables, raised to the number of live opponents) against pot odds;
+    before the draw the strength is the EV of the best hold. Draws hold
+    the cards with the highest exact EV. Results for suit-equivalent hands
+    are memoized, so repeated situations take microseconds; a new hand's
+    hold search takes tens of milliseconds, which is why strategy seats
+    run in a process pool by default (see `registry.AGENT_PROCESSES`).
+    """
+
+    kind = "strategy"
+
+    # Draw decisions per suit-canonical hand, shared by every strategy seat
+    holds = TTLCache(maxsize=200_000, ttl=float("inf"))
+
+    def _hold(self, cards: Sequence[Card]) -> Tuple[List[int], float]:
+        order, key = canonical_hand(cards)
+        cached = self.holds.get(key)
+        if cached is None:
+            best, best_ev = best_hold([cards[i] for i in order])
+            cached = (tuple(best), best_ev)
+            self.holds.put(key, cached)
+        held, ev = cached
+        return sorted(order[i] for i in held), ev
+
+    def equity(self, player_state: PlayerState, table_state: TableState) -> float:
+        cards = player_state.hand.cards if player_state.hand else []
+        if len(cards) != 5:
+            return 0.0
+        if table_state.phase == "betting_1":
+            strength = self._hold(cards)[1]
+        else:
+            strength = hand_strength(
+                [RANK_VALUES[c.rank] for c in cards], [c.suit for c in cards]
+            )
+        opponents = sum(
+            1
+            for p in table_state.players
+            if p.id != player_state.id and not p.is_folded and p.is_active
+        )
+        return strength ** max(opponents, 1)
+
+    @timed_decision("bet")
+    async def decide_betting_action(
+        self, player_state: PlayerState, table_state: TableState
+    ) -> Tuple[str, int]:
+        if not player_state.hand:
+            return "fold", 0
+        equity = self.equity(player_state, table_state)
+        to_call = max(table_state.current_bet - player_state.current_bet, 0)
+
+        if equity >= RAISE_EQUITY:
+            raise_to = min(
+                table_state.current_bet + max(MIN_RAISE, table_state.pot // 2),
+                player_state.current_bet + player_state.balance,
+            )
+            if raise_to > table_state.current_bet:
+                return "raise", raise_to
+        if not to_call:
+            return "check", 0
+        pot_odds = to_call / (table_state.pot + to_call)
+        return ("call", 0) if equity >= pot_odds else ("fold", 0)
+
+    @timed_decision("draw")
+    async def decide_draw_action(
+        self, player_state: PlayerState, table_state: TableState
+    ) -> List[int]:
+        if not player_state.hand or len(player_state.hand.cards) != 5:
+            return [0, 1, 2, 3, 4]
+        return self._hold(player_state.hand.cards)[0]
+
+    @timed_decision("chat")
+    async def decide_chat_response(
+        self,
+        message: str,
+        history: List[str],
+        player_state: PlayerState,
+        table_state: TableState,
+    ) -> str:
+        return "Nice move."
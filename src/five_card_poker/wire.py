@@ -0,0 +1,84 @@
+import json
+from typing import Any, Dict, Mapping
+from types import MappingProxyType
+from .models import DECK, Card
+
+# Clients ask for the compact encoding with this Accept header
+COMPACT_MEDIA_TYPE = "application/vnd.five-card-poker.compact+json"
+
+# Two-character card codes: rank ("T" for ten) then suit initial, e.g. "Th"
+CARD_CODES: Mapping[Card, str] = MappingProxyType(
+    {
+        card: ("T" if card.rank.value == "10" else card.rank.value)
+        + card.suit.value[0].lower()
+        for card in DECK
+    }
+)
+_CODE_FOR = {
+    (card.suit.value, card.rank.value): code for card, code in CARD_CODES.items()
+}
+
+# Short keys for TableState / PlayerState fields
+TABLE_KEYS = {
+    "players": "pl",
+    "pot": "po",
+    "current_bet": "cb",
+    "phase": "ph",
+    "active_player_id": "ap",
+    "dealer_idx": "di",
+    "deck_count": "dc",
+}
+PLAYER_KEYS = {
+    "id": "i",
+    "name": "n",
+    "type": "t",
+    "balance": "b",
+    "hand": "h",
+    "is_folded": "f",
+    "current_bet": "cb",
+    "last_action": "la",
+    "is_active": "ac",
+    "has_acted": "ha",
+}
+# Player fields left out of the compact form when they hold these values
+PLAYER_DEFAULTS = {
+    "hand": None,
+    "is_folded": False,
+    "current_bet": 0,
+    "last_action": "",
+    "is_active": True,
+    "has_acted": False,
+}
+
+
+def compact_player(player: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    A `PlayerState` JSON object in compact form: short keys, defaults
+    omitted, booleans as 0/1, type as "h"/"a" and the hand's cards as one
+    string of two-character codes ("ThJhQhKhAh").
+    """
+    out: Dict[str, Any] = {}
+    for field, value in player.items():
+        if field in PLAYER_DEFAULTS and value == PLAYER_DEFAULTS[field]:
+            continue
+        if field == "type":
+            value = value[0]
+        elif field == "hand":
+            value = {
+                "c": "".join(_CODE_FOR[c["suit"], c["rank"]] for c in value["cards"]),
+                "r": value["rank"],
+                "s": value["score"],
+            }
+        elif isinstance(value, bool):
+            value = int(value)
+        out[PLAYER_KEYS[field]] = value
+    return out
+
+
+def compact_table(table: Dict[str, Any]) -> Dict[str, Any]:
+    """Table-level fields (everything but players) in compact form."""
+    return {TABLE_KEYS[field]: value for field, value in table.items()}
+
+
+def encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
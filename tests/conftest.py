@@ -3,6 +3,14 @@ from fastapi.testclient import TestClient
 from five_card_poker.main import app
 from five_card_poker.ai import GeminiPokerAgent
 
+# Modules that exercise the real agent methods against a mocked or stand-in client
+UNMOCKED_AGENT_MODULES = (
+    "test_ai_player",
+    "test_decision_cache",
+    "test_gateway",
+    "test_standin",
+)
+
 
 @pytest.fixture
 def client():
@@ -12,11 +20,14 @@ def client():
 @pytest.fixture(autouse=True)
 def mock_gemini_agent(monkeypatch, request):
     """
-    Mock GeminiPokerAgent globally for all tests EXCEPT test_ai_player.py.
+    Mock GeminiPokerAgent globally for all tests EXCEPT UNMOCKED_AGENT_MODULES.
     This ensures integration tests pass with deterministic bot behavior,
     while unit tests can test the actual agent logic.
     """
-    if "test_ai_player" in request.node.name or "test_ai_player" in str(request.fspath):
+    if any(
+        name in request.node.name or name in str(request.fspath)
+        for name in UNMOCKED_AGENT_MODULES
+    ):
         return
 
     async def mock_decide_betting(self, player_state, table_state):
@@ -0,0 +1,26 @@
+from five_card_poker.models import Hand, PlayerState, PlayerType, TableState
+
+
+def make_states(cards, pot=10, current_bet=10, phase="betting_1", opponents=0):
+    """(player state, table state) for bot1 to act holding `cards`."""
+    me = PlayerState(
+        id="bot1",
+        name="Bot 1",
+        type=PlayerType.AI,
+        balance=100,
+        hand=Hand(cards=cards),
+    )
+    others = [
+        PlayerState(id=f"p{i}", name=f"P{i}", type=PlayerType.HUMAN, balance=100)
+        for i in range(opponents)
+    ]
+    table_state = TableState(
+        players=[me] + others,
+        pot=pot,
+        current_bet=current_bet,
+        phase=phase,
+        active_player_id="bot1",
+        dealer_idx=0,
+        deck_count=52 - 5 * (1 + opponents),
+    )
+    return me, table_state
@@ -0,0 +1,109 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.ai import GeminiPokerAgent
+
+
+def make_table():
+    table = Table()
+    table.add_player(Player(id="p1", name="Alice", type=PlayerType.HUMAN))
+    for i in (1, 2):
+        agent = MagicMock(spec=GeminiPokerAgent)
+        agent.decide_betting_action = AsyncMock(return_value=("call", 0))
+        agent.decide_draw_action = AsyncMock(return_value=[])
+        table.add_player(
+            Player(id=f"bot{i}", name=f"Bot {i}", type=PlayerType.AI, agent=agent)
+        )
+    return table
+
+
+@pytest.mark.asyncio
+async def test_actor_chains_ai_moves_until_human_turn():
+    table = make_table()
+    table.dealer_idx = 0  # bot1 acts first
+
+    await table.actor.submit("start", 5)
+    await table.actor.join()
+
+    assert table.phase == "betting_1"
+    assert table.players[table.active_player_idx].id == "p1"
+    assert table.snapshot is not None
+    assert table.snapshot.version == table.version
+
+
+@pytest.mark.asyncio
+async def test_actor_runs_single_ai_loop_under_concurrent_commands():
+    table = make_table()
+    table.dealer_idx = 2  # p1 acts first
+    await table.actor.submit("start", 5)
+
+    # Several concurrent kicks must not spawn duplicate AI moves
+    await table.actor.submit("action", "p1", "check")
+    for _ in range(5):
+        table.actor.kick()
+    await table.actor.join()
+
+    for p in table.players[1:]:
+        assert p.agent.decide_betting_action.await_count == 1
+    assert table.phase == "drawing"
+
+
+@pytest.mark.asyncio
+async def test_actor_propagates_errors_and_keeps_order():
+    table = make_table()
+    table.dealer_idx = 2
+
+    results = await asyncio.gather(
+        table.actor.submit("start", 5),
+        table.actor.submit("action", "bot1", "check"),
+        return_exceptions=True,
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], ValueError)
+    assert "not Bot 1's turn" in str(results[1])
+    assert table.version >= 2
+
+
+@pytest.mark.asyncio
+async def test_actor_prefetches_draw_decisions_concurrently():
+    table = make_table()
+    table.add_player(
+        Player(
+            id="bot3",
+            name="Bot 3",
+            type=PlayerType.AI,
+            agent=MagicMock(spec=GeminiPokerAgent),
+        )
+    )
+    started = []
+
+    async def slow_draw(player_state, table_state):
+        started.append(player_state.id)
+        await asyncio.sleep(0.2)
+        return [0, 1]
+
+    for p in table.players[1:]:
+        p.agent.decide_betting_action = AsyncMock(return_value=("call", 0))
+        p.agent.decide_draw_action = AsyncMock(side_effect=slow_draw)
+
+    table.dealer_idx = 0  # p1 acts last, so bot1 draws first
+    await table.actor.submit("start", 5)
+    await table.actor.join()
+    assert table.players[table.active_player_idx].id == "p1"
+
+    loop = asyncio.get_running_loop()
+    began = loop.time()
+    await table.actor.submit("action", "p1", "check")
+    await table.actor.join()
+    elapsed = loop.time() - began
+
+    # All three bots drew in seat order off one round of concurrent calls
+    assert table.phase == "drawing"
+    assert table.players[table.active_player_idx].id == "p1"
+    assert started == ["bot1", "bot2", "bot3"]
+    assert elapsed < 0.4
+    for p in table.players[1:]:
+        assert p.agent.decide_draw_action.await_count == 1
+        assert p.last_action == "Draw"
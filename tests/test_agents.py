@@ -0,0 +1,78 @@
+import pytest
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from five_card_poker.agents import ProcessPoolAgent, shared_executor, shutdown_executor
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.models import Card, Suit, Rank
+from five_card_poker.persistence import dump_table
+from five_card_poker.strategy import StrategyAgent
+from helpers import make_states
+
+
+@pytest.fixture
+def executor():
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        yield pool
+
+
+@pytest.mark.asyncio
+async def test_pooled_agent_matches_in_process_agent(executor):
+    cards = [
+        Card(suit=Suit.HEARTS, rank=Rank.TEN),
+        Card(suit=Suit.HEARTS, rank=Rank.JACK),
+        Card(suit=Suit.HEARTS, rank=Rank.QUEEN),
+        Card(suit=Suit.HEARTS, rank=Rank.KING),
+        Card(suit=Suit.CLUBS, rank=Rank.THREE),
+    ]
+    pooled = ProcessPoolAgent(StrategyAgent(), executor)
+    states = make_states(cards, current_bet=0, phase="drawing")
+
+    # The loop keeps ticking while the worker process computes
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    beat = asyncio.create_task(heartbeat())
+    held = await pooled.decide_draw_action(*states)
+    beat.cancel()
+
+    assert held == await StrategyAgent().decide_draw_action(*states)
+    assert ticks > 1
+    assert await pooled.decide_betting_action(*states) == ("check", 0)
+    assert pooled.kind == StrategyAgent.kind
+
+
+@pytest.mark.asyncio
+async def test_pooled_agents_play_a_hand(executor):
+    table = Table()
+    for i in range(3):
+        agent = ProcessPoolAgent(StrategyAgent(), executor)
+        table.add_player(
+            Player(id=f"bot{i}", name=f"Bot {i}", type=PlayerType.AI, agent=agent)
+        )
+    await table.actor.submit("start", 5)
+    await table.actor.join()
+
+    assert table.phase == "waiting"
+    assert {p["agent"] for p in dump_table(table)["players"]} == {"strategy"}
+
+
+@pytest.mark.asyncio
+async def test_shared_pool_spawns_workers():
+    # Forking after the writer threads start could deadlock the workers
+    executor = shared_executor(1)
+    try:
+        assert executor._mp_context.get_start_method() == "spawn"
+        pooled = ProcessPoolAgent(StrategyAgent(), executor)
+        cards = [Card.of(Suit.SPADES, rank) for rank in list(Rank)[:4]]
+        cards.append(Card.of(Suit.HEARTS, Rank.ACE))
+        states = make_states(cards)
+        assert await pooled.decide_draw_action(*states) == (
+            await StrategyAgent().decide_draw_action(*states)
+        )
+    finally:
+        shutdown_executor()
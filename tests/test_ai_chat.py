@@ -48,9 +48,9 @@ def test_chat_trigger_in_main():
 
     client = TestClient(app)
 
-    # Use app.state.table after startup
+    # Use the default table after startup
     with client as c:
-        table = app.state.table
+        table = app.state.tables.get("default")
         # Mock the agents to avoid real API calls
         for p in table.players:
             if p.type == PlayerType.AI and p.agent:
@@ -69,3 +69,33 @@ def test_chat_trigger_in_main():
         # We expect player1's message AND at least one bot reply
         assert len(messages) >= 2
         assert any(msg["player_id"] in ["bot1", "bot2"] for msg in messages)
+
+
+@pytest.mark.asyncio
+async def test_chat_replies_coalesce_off_request_path():
+    import asyncio
+    from five_card_poker.chat import ChatManager
+    from five_card_poker.logic import Table, Player
+
+    table = Table(chat_manager=ChatManager())
+    table.add_player(Player(id="player1", name="You"))
+    agent = MagicMock(spec=GeminiPokerAgent)
+
+    async def slow_reply(message, history, player_state, table_state):
+        await asyncio.sleep(0.1)
+        return f"re: {message}"
+
+    agent.decide_chat_response = AsyncMock(side_effect=slow_reply)
+    table.add_player(Player(id="bot1", name="Bot 1", type=PlayerType.AI, agent=agent))
+
+    with patch("random.random", return_value=0.1):
+        # Submitting never waits for the model
+        for i in range(5):
+            table.replier.submit(f"msg {i}")
+        assert table.replier.pending == 1
+        await table.replier.join()
+
+    # The burst was answered once, in reply to the latest message
+    assert agent.decide_chat_response.await_count == 1
+    assert table.replier.coalesced == 4
+    assert [m.text for m in table.chat_manager.messages] == ["re: msg 4"]
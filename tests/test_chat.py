@@ -1,3 +1,4 @@
+import json
 from fastapi.testclient import TestClient
 from five_card_poker.main import app
 from five_card_poker.logic import Table, Player, PlayerType
@@ -24,6 +25,36 @@ def test_chat_manager_get_messages():
     assert msgs[1].text == "Msg 2"
 
 
+def test_chat_messages_get_fresh_ids_and_timestamps():
+    manager = ChatManager()
+    first = manager.add_message("p1", "a")
+    second = manager.add_message("p1", "b")
+    assert first.id != second.id
+    assert second.timestamp >= first.timestamp
+    assert (first.seq, second.seq) == (1, 2)
+
+
+def test_chat_manager_is_bounded_and_reads_after_cursor():
+    manager = ChatManager(capacity=3)
+    for i in range(5):
+        manager.add_message("p1", f"Msg {i}")
+    assert [m.text for m in manager.messages] == ["Msg 2", "Msg 3", "Msg 4"]
+    assert manager.last_seq == 5
+
+    assert [m.seq for m in manager.get_messages(after=3)] == [4, 5]
+    # A cursor older than the buffer gets everything still kept
+    assert [m.seq for m in manager.get_messages(after=0)] == [3, 4, 5]
+    assert [m.seq for m in manager.get_messages(after=0, limit=2)] == [3, 4]
+    assert manager.get_messages(after=5) == []
+    assert [m.seq for m in manager.get_messages(limit=2)] == [4, 5]
+
+
+def test_chat_message_is_encoded_once():
+    msg = ChatManager().add_message("p1", "Hi")
+    assert msg.encoded() is msg.encoded()
+    assert json.loads(msg.encoded()) == msg.model_dump(mode="json")
+
+
 def test_table_logs_events():
     # Setup table with chat manager
     chat_manager = ChatManager()
@@ -76,3 +107,23 @@ def test_api_chat_get():
     message_texts = [msg["text"] for msg in data[-2:]]
 
     assert "Test Get" in message_texts
+
+
+def test_api_chat_get_after_cursor():
+    cursor = client.get("/chat/messages?limit=1").json()[-1]["seq"]
+    client.post("/chat/send", json={"player_id": "player1", "text": "Only new"})
+
+    data = client.get(f"/chat/messages?after={cursor}").json()
+    assert data[0]["text"] == "Only new"
+    assert all(msg["seq"] > cursor for msg in data)
+
+
+def test_bad_limits_are_rejected_not_500():
+    manager = ChatManager()
+    manager.add_message("p1", "Hi")
+    assert manager.get_messages(limit=-1, after=0) == []
+
+    with TestClient(app) as client:
+        response = client.get("/chat/messages?after=0&limit=-1")
+        assert response.status_code == 422
+        assert client.get("/chat/messages?limit=100000").status_code == 422
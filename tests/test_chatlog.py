@@ -0,0 +1,191 @@
+import asyncio
+import os
+import threading
+from unittest import mock
+import pytest
+from five_card_poker.chat import ChatManager, ChatMessage
+from five_card_poker.chatlog import ChatLog
+from five_card_poker.registry import TableRegistry, new_table
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def make_log(tmp_path):
+    logs = []
+
+    def make(**kwargs):
+        log = ChatLog(str(tmp_path / "chat"), **kwargs)
+        logs.append(log)
+        return log
+
+    yield make
+    for log in logs:
+        log.close()
+
+
+def fill(log, table_id, count, start=1):
+    for seq in range(start, start + count):
+        log.append(table_id, ChatMessage(seq=seq, player_id="p1", text=f"Msg {seq}"))
+    log.flush()
+
+
+def segment_files(log, table_id):
+    return sorted(os.listdir(log._table_dir(table_id)))
+
+
+def test_reads_last_n_and_after_cursor_across_segments(make_log):
+    log = make_log(segment_bytes=500)
+    fill(log, "t1", 30)
+
+    assert len(segment_files(log, "t1")) > 4
+    assert [m.seq for m in log.read("t1", limit=3)] == [28, 29, 30]
+    assert [m.seq for m in log.read("t1", after=5, limit=4)] == [6, 7, 8, 9]
+    assert [m.seq for m in log.read("t1", limit=2, before=10)] == [8, 9]
+    assert log.read("t1", after=5, limit=3)[0].text == "Msg 6"
+    assert log.read("other") == []
+
+
+def test_history_survives_restart(make_log):
+    fill(make_log(segment_bytes=500), "t1", 12)
+
+    reopened = make_log(segment_bytes=500)
+    assert reopened.last_seq("t1") == 12
+    fill(reopened, "t1", 3, start=13)
+    assert [m.seq for m in reopened.read("t1", after=10)] == [11, 12, 13, 14, 15]
+
+
+def test_rotates_by_age_and_keeps_newest_segments(make_log):
+    clock = FakeClock()
+    log = make_log(segment_seconds=60, max_segments=2, clock=clock)
+    for i in range(4):
+        fill(log, "t1", 1, start=i + 1)
+        clock.now += 61
+
+    assert segment_files(log, "t1") == [
+        "000000000003.idx",
+        "000000000003.log",
+        "000000000004.idx",
+        "000000000004.log",
+    ]
+    assert [m.seq for m in log.read("t1", after=0)] == [3, 4]
+
+
+def test_segment_age_survives_restart(make_log):
+    clock = FakeClock()
+    log = make_log(segment_seconds=60, clock=clock)
+    log.append("t1", ChatMessage(seq=1, player_id="p1", text="Hi", timestamp=0.0))
+    log.close()
+
+    # Reopened within the minute, the segment is resumed
+    clock.now = 30
+    fill(make_log(segment_seconds=60, clock=clock), "t1", 1, start=2)
+    assert len(segment_files(log, "t1")) == 2
+    # Past it, the next message starts a new segment despite the restart
+    clock.now = 61
+    fill(make_log(segment_seconds=60, clock=clock), "t1", 1, start=3)
+    assert segment_files(log, "t1")[2:] == ["000000000003.idx", "000000000003.log"]
+
+
+def test_ignores_out_of_order_messages(make_log):
+    log = make_log()
+    fill(log, "t1", 3)
+    fill(log, "t1", 1, start=2)
+    assert [m.seq for m in log.read("t1")] == [1, 2, 3]
+
+
+def test_table_id_cannot_escape_directory(make_log, tmp_path):
+    log = make_log()
+    fill(log, "../escape", 1)
+    assert os.path.dirname(log._table_dir("../escape")) == str(tmp_path / "chat")
+    assert [m.text for m in log.read("../escape")] == ["Msg 1"]
+
+
+def test_chat_manager_reads_past_its_buffer_from_log(make_log):
+    log = make_log(segment_bytes=500)
+    manager = ChatManager(capacity=5)
+    manager.attach_log(log, "t1")
+    for i in range(20):
+        manager.add_message("p1", f"Msg {i + 1}")
+    log.flush()
+
+    assert [m.seq for m in manager.messages] == [16, 17, 18, 19, 20]
+    assert [m.seq for m in manager.get_messages(after=10, limit=8)] == list(
+        range(11, 19)
+    )
+    assert [m.seq for m in manager.get_messages(limit=7)] == list(range(14, 21))
+
+    restarted = ChatManager(capacity=5)
+    restarted.attach_log(make_log(segment_bytes=500), "t1")
+    assert restarted.last_seq == 20
+    assert restarted.add_message("p1", "Back").seq == 21
+
+
+def test_fetch_reads_past_the_buffer_off_the_loop(make_log):
+    log = make_log()
+    manager = ChatManager(capacity=5)
+    manager.attach_log(log, "t1")
+    for i in range(20):
+        manager.add_message("p1", f"Msg {i + 1}")
+    log.flush()
+    read = log.read
+    threads = []
+
+    def record_read(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return read(*args, **kwargs)
+
+    async def fetch(**kwargs):
+        return [m.seq for m in await manager.fetch_messages(**kwargs)]
+
+    with mock.patch.object(log, "read", side_effect=record_read):
+        assert asyncio.run(fetch(after=10, limit=8)) == list(range(11, 19))
+        assert asyncio.run(fetch(limit=7)) == list(range(14, 21))
+        assert asyncio.run(fetch(after=17)) == [18, 19, 20]
+
+    assert len(threads) == 2 and threading.main_thread() not in threads
+
+
+def test_reset_keeps_chat_history(make_log):
+    registry = TableRegistry(factory=new_table, chat_log=make_log())
+    table = registry.create("t1")
+    chat_manager = table.chat_manager
+    chat_manager.add_message("player1", "Before reset")
+
+    reset = registry.reset("t1")
+    assert reset.chat_manager is chat_manager
+    assert table.chat_manager is None
+    assert [m.text for m in reset.chat_manager.get_messages()] == ["Before reset"]
+
+
+def test_registry_reads_chat_log_off_the_loop(make_log):
+    log = make_log()
+    fill(log, "t1", 3)
+    restarted = make_log()
+    registry = TableRegistry(factory=new_table, chat_log=restarted)
+    tail = restarted.tail
+    threads = []
+
+    def record_tail(*args):
+        threads.append(threading.current_thread())
+        return tail(*args)
+
+    async def open_and_chat():
+        table = await registry.open("t1", create=True)
+        # Appending only checks the in-memory seq, never the disk index
+        with mock.patch.object(restarted, "_index", side_effect=AssertionError):
+            return table.chat_manager.add_message("p1", "Next")
+
+    with mock.patch.object(restarted, "tail", side_effect=record_tail):
+        msg = asyncio.run(open_and_chat())
+
+    assert threads and threading.main_thread() not in threads
+    assert msg.seq == 4
+    restarted.flush()
+    assert [m.seq for m in restarted.read("t1")] == [1, 2, 3, 4]
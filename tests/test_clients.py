@@ -0,0 +1,54 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from five_card_poker.ai import GeminiPokerAgent
+from five_card_poker.clients import ClientPool
+
+
+def fake_client(api_key):
+    client = MagicMock()
+    client.api_key = api_key
+    client.aio.models.get = AsyncMock()
+    client.aio.aclose = AsyncMock()
+    return client
+
+
+def test_agents_share_pooled_clients():
+    pool = ClientPool(size=2, factory=fake_client)
+    agents = [GeminiPokerAgent(api_key="key", client_pool=pool) for _ in range(6)]
+
+    assert len(pool) == 2
+    assert len({id(a.client) for a in agents}) == 2
+    assert agents[0].client is agents[2].client
+
+    GeminiPokerAgent(api_key="other", client_pool=pool)
+    assert len(pool) == 3
+
+
+def test_unpooled_agent_builds_its_own_client():
+    with patch("google.genai.Client") as MockClient:
+        GeminiPokerAgent(api_key="key")
+        GeminiPokerAgent(api_key="key", client_pool=ClientPool())
+    # The pooled agent's client also comes from genai.Client, created once
+    assert MockClient.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_warm_up_and_close():
+    pool = ClientPool(size=3, factory=fake_client)
+    await pool.warm_up(None, "model")
+    assert len(pool) == 0
+
+    await pool.warm_up("key", "model")
+    clients = [pool.borrow("key") for _ in range(3)]
+    assert len(pool) == 3
+    for client in clients:
+        client.aio.models.get.assert_awaited_once_with(model="model")
+
+    clients[0].aio.models.get.side_effect = RuntimeError("offline")
+    await pool.warm_up("key", "model")  # Failures are logged, not raised
+
+    await pool.aclose()
+    assert len(pool) == 0
+    for client in clients:
+        client.aio.aclose.assert_awaited_once()
+        client.close.assert_called_once()
@@ -0,0 +1,91 @@
+import pytest
+import asyncio
+import uvicorn
+from fastapi.testclient import TestClient
+from httpx import AsyncClient, ASGITransport
+from five_card_poker.main import app
+from five_card_poker.cluster import HashRing, TableRouter, table_id_from_query
+
+
+def test_hash_ring_is_stable_and_balanced():
+    ring = HashRing(range(4))
+    keys = [f"table-{i}" for i in range(2000)]
+    owners = [ring.node_for(k) for k in keys]
+
+    assert owners == [HashRing(range(4)).node_for(k) for k in keys]
+    for node in range(4):
+        assert 300 < owners.count(node) < 700
+
+
+def test_hash_ring_moves_few_tables_when_growing():
+    keys = [f"table-{i}" for i in range(2000)]
+    before = HashRing(range(4))
+    after = HashRing(range(5))
+
+    moved = sum(before.node_for(k) != after.node_for(k) for k in keys)
+    assert moved < len(keys) * 0.35
+
+
+def test_table_id_from_query_defaults():
+    assert table_id_from_query(b"") == "default"
+    assert table_id_from_query(b"player_id=p1&table_id=t7") == "t7"
+
+
+def test_table_ids_are_isolated():
+    with TestClient(app) as client:
+        client.post("/tables?table_id=t1")
+        client.post("/tables?table_id=t2")
+        response = client.post("/bet?table_id=t1", json={"bet": 10})
+        assert response.status_code == 200
+
+        assert client.get("/state?table_id=t1").json()["phase"] != "waiting"
+        assert client.get("/state?table_id=t2").json()["phase"] == "waiting"
+
+
+def echo_worker(name):
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        body = f"{name} {scope['path']}?{scope['query_string'].decode()}".encode()
+        if scope["path"] == "/metrics":
+            body = f'# HELP up Up.\n# TYPE up gauge\nup{{name="{name}"}} 1\n'.encode()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_router_forwards_to_owning_worker(tmp_path):
+    sockets = [str(tmp_path / f"w{i}.sock") for i in range(2)]
+    servers = [
+        uvicorn.Server(
+            uvicorn.Config(echo_worker(f"w{i}"), uds=path, log_level="error")
+        )
+        for i, path in enumerate(sockets)
+    ]
+    tasks = [asyncio.create_task(server.serve()) for server in servers]
+    while not all(server.started for server in servers):
+        await asyncio.sleep(0.01)
+
+    router = TableRouter(sockets)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=router), base_url="http://test"
+        ) as client:
+            for table_id in ("alpha", "beta", "gamma", "delta"):
+                response = await client.get(f"/state?table_id={table_id}")
+                owner = router.ring.node_for(table_id)
+                assert response.text == f"w{owner} /state?table_id={table_id}"
+
+            # Metrics come from every worker, not just the default table's
+            metrics = await client.get("/metrics")
+            assert metrics.text.splitlines()[2:] == [
+                'up{worker="0",name="w0"} 1',
+                'up{worker="1",name="w1"} 1',
+            ]
+    finally:
+        await router.aclose()
+        for server in servers:
+            server.should_exit = True
+        await asyncio.gather(*tasks)
@@ -0,0 +1,180 @@
+import pytest
+import random
+from unittest.mock import AsyncMock, MagicMock, patch
+from five_card_poker.ai import GeminiPokerAgent
+from five_card_poker.cache import (
+    TTLCache,
+    DecisionCache,
+    ChatReplyCache,
+    canonical_hand,
+    normalize_message,
+)
+from five_card_poker.models import Card, Suit, Rank
+from helpers import make_states
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+HEARTS_HAND = [
+    Card(suit=Suit.HEARTS, rank=Rank.ACE),
+    Card(suit=Suit.SPADES, rank=Rank.ACE),
+    Card(suit=Suit.HEARTS, rank=Rank.KING),
+    Card(suit=Suit.CLUBS, rank=Rank.SEVEN),
+    Card(suit=Suit.DIAMONDS, rank=Rank.TWO),
+]
+# Same hand with suits relabelled and cards in a different order
+SHUFFLED_HAND = [
+    Card(suit=Suit.HEARTS, rank=Rank.TWO),
+    Card(suit=Suit.CLUBS, rank=Rank.KING),
+    Card(suit=Suit.DIAMONDS, rank=Rank.SEVEN),
+    Card(suit=Suit.CLUBS, rank=Rank.ACE),
+    Card(suit=Suit.SPADES, rank=Rank.ACE),
+]
+
+
+def test_ttl_cache_expires_and_evicts_lru():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)  # evicts "b", the least recently used
+
+    assert cache.get("b") is None
+    clock.now = 11
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 2
+    assert cache.hit_rate == pytest.approx(1 / 3)
+
+
+def test_canonical_hand_ignores_suit_names_and_order():
+    _, key1 = canonical_hand(HEARTS_HAND)
+    _, key2 = canonical_hand(
+        [
+            Card(suit=Suit.SPADES, rank=Rank.ACE),
+            Card(suit=Suit.DIAMONDS, rank=Rank.ACE),
+            Card(suit=Suit.SPADES, rank=Rank.KING),
+            Card(suit=Suit.HEARTS, rank=Rank.SEVEN),
+            Card(suit=Suit.CLUBS, rank=Rank.TWO),
+        ]
+    )
+    assert key1 == key2
+
+    assert canonical_hand(SHUFFLED_HAND)[1] == key1
+
+    offsuit = list(HEARTS_HAND)
+    offsuit[2] = Card(suit=Suit.DIAMONDS, rank=Rank.KING)
+    assert canonical_hand(offsuit)[1] != key1  # K no longer suited with an ace
+
+
+@pytest.fixture
+def mock_genai_client():
+    with patch("google.genai.Client") as MockClient:
+        mock_client = MockClient.return_value
+        mock_client.aio = MagicMock()
+        mock_client.aio.models = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock()
+        yield mock_client
+
+
+@pytest.mark.asyncio
+async def test_betting_decision_cached_across_equivalent_situations(
+    mock_genai_client,
+):
+    response = MagicMock()
+    response.text = '{"action": "raise", "amount": 20}'
+    mock_genai_client.aio.models.generate_content.return_value = response
+    cache = DecisionCache()
+    agent = GeminiPokerAgent(api_key="fake", decision_cache=cache)
+
+    first = await agent.decide_betting_action(*make_states(HEARTS_HAND))
+    # Slightly different pot and bet fall in the same buckets
+    second = await agent.decide_betting_action(
+        *make_states(HEARTS_HAND, pot=11, current_bet=11)
+    )
+
+    assert first == ("raise", 20)
+    assert second == ("raise", 21)  # Same raise size over the new bet
+    assert mock_genai_client.aio.models.generate_content.await_count == 1
+    assert cache.hits == 1 and cache.misses == 1
+
+    await agent.decide_betting_action(*make_states(HEARTS_HAND, phase="betting_2"))
+    assert mock_genai_client.aio.models.generate_content.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_draw_decision_cache_maps_indices_back(mock_genai_client):
+    hand = [
+        Card(suit=Suit.HEARTS, rank=Rank.TWO),
+        Card(suit=Suit.HEARTS, rank=Rank.ACE),
+        Card(suit=Suit.CLUBS, rank=Rank.SEVEN),
+        Card(suit=Suit.SPADES, rank=Rank.ACE),
+        Card(suit=Suit.DIAMONDS, rank=Rank.KING),
+    ]
+    response = MagicMock()
+    response.text = '{"held_indices": [1, 3]}'  # Hold the aces
+    mock_genai_client.aio.models.generate_content.return_value = response
+    agent = GeminiPokerAgent(api_key="fake", decision_cache=DecisionCache())
+
+    assert await agent.decide_draw_action(*make_states(hand)) == [1, 3]
+    # Same hand in a different order: the aces are now at 3 and 4
+    reordered = [hand[2], hand[0], hand[4], hand[1], hand[3]]
+    assert await agent.decide_draw_action(*make_states(reordered)) == [3, 4]
+    assert mock_genai_client.aio.models.generate_content.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_exploration_bypasses_cache(mock_genai_client):
+    response = MagicMock()
+    response.text = '{"action": "call", "amount": 0}'
+    mock_genai_client.aio.models.generate_content.return_value = response
+    cache = DecisionCache(explore=1.0, rng=random.Random(0))
+    agent = GeminiPokerAgent(api_key="fake", decision_cache=cache)
+
+    for _ in range(3):
+        await agent.decide_betting_action(*make_states(HEARTS_HAND))
+
+    assert mock_genai_client.aio.models.generate_content.await_count == 3
+    assert cache.explorations == 3
+
+
+def test_chat_cache_keeps_variants():
+    assert normalize_message("Niiice HAND!!") == "nice hand"
+    cache = ChatReplyCache(variants=2, fresh=0.0, rng=random.Random(0))
+    player_state, table_state = make_states(HEARTS_HAND)
+    key = cache.context_key("m", "gg", player_state, table_state)
+    assert cache.pick(key) is None
+
+    for reply in ("one", "two", "two", "three"):
+        cache.add(key, reply)
+    assert cache.peek(key) == ("two", "three")
+    assert {cache.pick(key) for _ in range(20)} == {"two", "three"}
+
+    # Different hand category, different context
+    other = make_states(HEARTS_HAND)[0].model_copy(update={"hand": None})
+    assert cache.context_key("m", "gg", other, table_state) != key
+
+
+@pytest.mark.asyncio
+async def test_chat_replies_served_from_cache(mock_genai_client):
+    response = MagicMock()
+    response.text = '{"response": "Keep dreaming."}'
+    mock_genai_client.aio.models.generate_content.return_value = response
+    cache = ChatReplyCache(fresh=0.0)
+    agent = GeminiPokerAgent(api_key="fake", chat_cache=cache)
+    states = make_states(HEARTS_HAND)
+
+    for text in ("Nice hand!", "nice hand", "NICE   hand!!!"):
+        assert await agent.decide_chat_response(text, [], *states) == "Keep dreaming."
+    assert mock_genai_client.aio.models.generate_content.await_count == 1
+
+    cache.fresh = 1.0  # Always ask the model
+    await agent.decide_chat_response("nice hand", [], *states)
+    assert mock_genai_client.aio.models.generate_content.await_count == 2
+    assert cache.stats()["fresh"] == 1
@@ -0,0 +1,71 @@
+from five_card_poker import evaluator
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.models import Card, Hand
+
+
+def cards(*codes):
+    return [Card.of(suit, rank) for rank, suit in codes]
+
+
+def make_table(seats=3):
+    table = Table()
+    for i in range(seats):
+        table.add_player(Player(id=f"p{i}", name=f"P{i}", type=PlayerType.HUMAN))
+    table.start_game(ante=5)
+    return table
+
+
+def test_hand_is_evaluated_once_on_first_access():
+    hand = Hand(cards=cards(("A", "Hearts"), ("A", "Spades"), *[("5", "Clubs")] * 3))
+    assert not hand.evaluated
+
+    before = evaluator.stats()["calls"]
+    assert (hand.rank, hand.score) == ("Full House", 605)
+    assert hand.score == 605
+    assert evaluator.stats()["calls"] == before + 1
+
+
+def test_given_rank_and_score_are_kept():
+    hand = Hand(cards=cards(*[("2", "Hearts")] * 5), rank="One Pair", score=114)
+    assert hand.evaluated
+    assert hand.model_dump()["rank"] == "One Pair"
+    assert hand == Hand(cards=hand.cards)
+
+
+def test_cache_shares_results_across_suits_and_order():
+    hand = cards(("K", "Hearts"), ("K", "Spades"), ("9", "Clubs"), ("4", "Hearts"))
+    evaluator.evaluate_hand(hand + cards(("2", "Diamonds")))
+    before = evaluator.stats()
+
+    reordered = cards(("2", "Clubs"), ("4", "Spades"), ("K", "Clubs"))
+    reordered += cards(("9", "Hearts"), ("K", "Diamonds"))
+    assert evaluator.evaluate_hand(reordered) == (113, "One Pair")
+    assert evaluator.stats()["hits"] == before["hits"] + 1
+    assert evaluator.stats()["misses"] == before["misses"]
+
+
+def test_deal_and_draw_do_not_evaluate():
+    table = make_table()
+    table.publish()
+    assert not any(p.hand.evaluated for p in table.players)
+
+    # An owner viewing their seat evaluates only their own hand
+    viewer = table.players[0]
+    table.publish().render(viewer.id)
+    assert [p.hand.evaluated for p in table.players] == [True, False, False]
+
+
+def test_showdown_evaluates_only_live_hands():
+    table = make_table()
+    folder = table.players[table.active_player_idx]
+    table.handle_action(folder.id, "fold")
+    while table.phase == "betting_1":
+        table.handle_action(table.players[table.active_player_idx].id, "check")
+    while table.phase == "drawing":
+        table.handle_draw(table.players[table.active_player_idx].id, [])
+    while table.phase == "betting_2":
+        table.handle_action(table.players[table.active_player_idx].id, "check")
+
+    assert table.phase == "waiting"
+    assert not folder.hand.evaluated
+    assert all(p.hand.evaluated for p in table.players if p is not folder)
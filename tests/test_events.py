@@ -0,0 +1,75 @@
+from unittest.mock import patch
+from five_card_poker.logic import Table, Player
+from five_card_poker.chat import ChatManager
+from five_card_poker.events import EventBus, GameEvent, render
+
+
+def two_player_table(**kwargs):
+    table = Table(**kwargs)
+    table.add_player(Player(id="p1", name="Alice", balance=100))
+    table.add_player(Player(id="p2", name="Bob", balance=100))
+    table.dealer_idx = 1
+    return table
+
+
+def test_table_publishes_typed_events():
+    table = two_player_table()
+    events = []
+    table.events.subscribe(events.append)
+
+    table.start_game(ante=5)
+    table.handle_action("p1", "raise", 20)
+    table.handle_action("p2", "fold")
+
+    assert events[:3] == [
+        GameEvent("shuffle"),
+        GameEvent("start", amount=5),
+        GameEvent("turn", "Alice"),
+    ]
+    assert GameEvent("raise", "Alice", 20) in events
+    assert events[-1] == GameEvent("win_uncontested", "Alice", 30)
+
+
+def test_events_render_as_chat_text():
+    table = two_player_table(chat_manager=ChatManager())
+    table.start_game(ante=5)
+    table.handle_action("p1", "raise", 20)
+
+    texts = [m.text for m in table.chat_manager.messages]
+    assert texts[:3] == ["Deck shuffled.", "Game started. Ante: $5", "Alice's turn."]
+    assert "Alice raises to 20." in texts
+    assert render(GameEvent("show", "Bob", 214, "Two Pair")) == (
+        "Bob shows Two Pair (214)"
+    )
+
+
+def test_unwatched_table_builds_no_events():
+    table = two_player_table()
+    with patch("five_card_poker.events.GameEvent") as event:
+        table.start_game(ante=5)
+        table.handle_action("p1", "call")
+    event.assert_not_called()
+
+
+def test_replacing_chat_manager_moves_the_subscription():
+    first, second = ChatManager(), ChatManager()
+    table = two_player_table(chat_manager=first)
+    table.chat_manager = second
+    table.start_game(ante=5)
+
+    assert first.messages == []
+    assert second.messages
+    assert table.events.subscribers == [second.on_event]
+
+
+def test_failing_subscriber_does_not_stop_the_others():
+    bus = EventBus()
+    seen = []
+
+    def broken(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe(broken)
+    bus.subscribe(seen.append)
+    bus.publish("check", "Alice")
+    assert seen == [GameEvent("check", "Alice")]
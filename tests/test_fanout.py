@@ -0,0 +1,51 @@
+import pytest
+import asyncio
+from unittest.mock import patch
+from five_card_poker.chat import ChatManager
+from five_card_poker.fanout import Subscription
+
+
+@pytest.mark.asyncio
+async def test_message_is_encoded_once_for_all_subscribers():
+    manager = ChatManager()
+    subscriptions = [manager.fanout.subscribe() for _ in range(1000)]
+
+    with patch(
+        "five_card_poker.fanout.encode_frame", wraps=lambda m: b"frame"
+    ) as encode:
+        manager.add_message("p1", "Hello")
+    encode.assert_called_once()
+
+    batches = await asyncio.gather(*(s.get() for s in subscriptions))
+    assert all(batch[0] is batches[0][0] for batch in batches)
+
+
+@pytest.mark.asyncio
+async def test_frames_are_server_sent_events():
+    manager = ChatManager()
+    subscription = manager.fanout.subscribe()
+    manager.add_message("p1", "Hi")
+    manager.add_message("p2", "Yo")
+
+    frames = await subscription.get()
+    assert frames[0].startswith(b"id: 1\ndata: {")
+    assert b'"text":"Yo"' in frames[1]
+    assert frames[1].endswith(b"\n\n")
+
+
+def test_slow_subscriber_drops_oldest():
+    subscription = Subscription(maxsize=2)
+    for frame in (b"a", b"b", b"c"):
+        subscription.push(frame)
+    assert list(subscription._frames) == [b"b", b"c"]
+    assert subscription.dropped == 1
+
+
+def test_no_encoding_without_subscribers():
+    manager = ChatManager()
+    subscription = manager.fanout.subscribe()
+    manager.fanout.unsubscribe(subscription)
+    with patch("five_card_poker.fanout.encode_frame") as encode:
+        manager.add_message("p1", "Nobody listening")
+    encode.assert_not_called()
+    assert len(subscription) == 0
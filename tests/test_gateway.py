@@ -0,0 +1,179 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from five_card_poker.ai import GeminiPokerAgent
+from five_card_poker.gateway import (
+    CircuitBreaker,
+    CircuitOpenError,
+    LLMGateway,
+    TokenBucket,
+)
+from five_card_poker.models import Card, Suit, Rank
+from helpers import make_states
+
+
+# A pair of aces
+HAND = [
+    Card(suit=Suit.HEARTS, rank=Rank.ACE),
+    Card(suit=Suit.SPADES, rank=Rank.ACE),
+    Card(suit=Suit.HEARTS, rank=Rank.KING),
+    Card(suit=Suit.CLUBS, rank=Rank.SEVEN),
+    Card(suit=Suit.DIAMONDS, rank=Rank.TWO),
+]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def mock_genai_client():
+    with patch("google.genai.Client") as MockClient:
+        mock_client = MockClient.return_value
+        mock_client.aio = MagicMock()
+        mock_client.aio.models = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock()
+        yield mock_client
+
+
+def test_token_bucket_refills_at_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == pytest.approx(0.5)
+    clock.now = 0.5
+    assert bucket.try_acquire() == 0
+
+
+def test_circuit_breaker_opens_and_probes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=2, reset_after=10, clock=clock)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    clock.now = 10
+    assert breaker.allow()  # One trial call
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.trips == 2
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_deadline_falls_back_to_rule_based(mock_genai_client):
+    async def hang(**kwargs):
+        await asyncio.sleep(10)
+
+    mock_genai_client.aio.models.generate_content.side_effect = hang
+    gateway = LLMGateway(timeout=0.05, rate=0)
+    agent = GeminiPokerAgent(api_key="fake", gateway=gateway)
+
+    loop = asyncio.get_running_loop()
+    began = loop.time()
+    action = await agent.decide_betting_action(*make_states(HAND))
+
+    assert loop.time() - began < 1
+    assert action == ("call", 0)  # Rule-based: a pair calls
+    assert gateway.timeouts == 1
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_switches_all_agents_to_rules(mock_genai_client):
+    mock_genai_client.aio.models.generate_content.side_effect = RuntimeError("503")
+    gateway = LLMGateway(failure_threshold=2, rate=0)
+    agents = [GeminiPokerAgent(api_key="fake", gateway=gateway) for _ in range(2)]
+
+    for agent in agents:
+        await agent.decide_betting_action(*make_states(HAND))
+    assert not gateway.available
+
+    assert await agents[0].decide_draw_action(*make_states(HAND)) == [0, 1]
+    assert await agents[1].decide_betting_action(*make_states(HAND)) == ("call", 0)
+    assert mock_genai_client.aio.models.generate_content.await_count == 2
+    with pytest.raises(CircuitOpenError):
+        await gateway.generate(mock_genai_client, model="m", contents="")
+
+
+@pytest.mark.asyncio
+async def test_gateway_caps_concurrency(mock_genai_client):
+    in_flight = peak = 0
+
+    async def slow(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        response = MagicMock()
+        response.text = '{"action": "check", "amount": 0}'
+        return response
+
+    mock_genai_client.aio.models.generate_content.side_effect = slow
+    gateway = LLMGateway(max_concurrency=2, rate=0)
+    agent = GeminiPokerAgent(api_key="fake", gateway=gateway)
+
+    await asyncio.gather(
+        *(agent.decide_betting_action(*make_states(HAND)) for _ in range(6))
+    )
+    assert peak == 2
+    assert gateway.calls == 6
+
+
+def test_gateway_built_outside_a_loop_serves_later_loops(mock_genai_client):
+    # Like the process-wide gateway, built at import time with no loop running
+    gateway = LLMGateway(max_concurrency=1, rate=0)
+
+    async def slow(**kwargs):
+        await asyncio.sleep(0)  # Hold the slot so the others wait on it
+
+    mock_genai_client.aio.models.generate_content.side_effect = slow
+
+    async def burst():
+        await asyncio.gather(
+            *(
+                gateway.generate(mock_genai_client, model="m", contents="")
+                for _ in range(3)
+            )
+        )
+
+    asyncio.run(burst())
+    asyncio.run(burst())
+    assert gateway.calls == 6
+
+
+@pytest.mark.asyncio
+async def test_saturation_falls_back_without_opening_the_breaker(mock_genai_client):
+    async def slow(**kwargs):
+        await asyncio.sleep(0.2)
+        response = MagicMock()
+        response.text = '{"action": "check", "amount": 0}'
+        return response
+
+    mock_genai_client.aio.models.generate_content.side_effect = slow
+    gateway = LLMGateway(
+        max_concurrency=1, timeout=1, queue_timeout=0.05, failure_threshold=2, rate=0
+    )
+    agent = GeminiPokerAgent(api_key="fake", gateway=gateway)
+
+    actions = await asyncio.gather(
+        *(agent.decide_betting_action(*make_states(HAND)) for _ in range(10))
+    )
+
+    assert actions.count(("check", 0)) == 1
+    assert actions.count(("call", 0)) == 9  # Rule-based: a pair calls
+    assert (gateway.calls, gateway.busy, gateway.timeouts) == (1, 9, 0)
+    assert gateway.breaker.state == "closed"
+    # No slot was leaked by the calls that gave up waiting
+    assert gateway.semaphore._value == 1
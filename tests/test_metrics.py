@@ -0,0 +1,109 @@
+import asyncio
+from fastapi.testclient import TestClient
+from five_card_poker.ai import GeminiPokerAgent
+from five_card_poker.main import app
+from five_card_poker.metrics import (
+    AI_DECISION_SECONDS,
+    AI_FALLBACKS,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    merge_expositions,
+)
+from five_card_poker.models import PlayerState, PlayerType, TableState
+
+
+def states():
+    me = PlayerState(id="bot1", name="Bot 1", type=PlayerType.AI, balance=100)
+    table = TableState(
+        players=[me],
+        pot=0,
+        current_bet=0,
+        phase="betting_1",
+        active_player_id="bot1",
+        dealer_idx=0,
+        deck_count=52,
+    )
+    return me, table
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1))
+    errors = Counter("errors_total", 'Errors "by" route.', ("route",))
+    registry.register(latency, errors)
+    for value in (0.05, 0.1, 0.5, 3):
+        latency.observe(value, "/state")
+    errors.inc("/a\\b")
+
+    lines = registry.render().decode().splitlines()
+    assert lines[:2] == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+    ]
+    assert 'latency_seconds_bucket{route="/state",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/state",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{route="/state",le="+Inf"} 4' in lines
+    assert 'latency_seconds_sum{route="/state"} 3.65' in lines
+    assert 'latency_seconds_count{route="/state"} 4' in lines
+    assert '# HELP errors_total Errors \\"by\\" route.' in lines
+    assert 'errors_total{route="/a\\\\b"} 1' in lines
+
+
+def test_worker_expositions_merge_under_one_header():
+    bodies = {}
+    for worker, route in (("0", "/state"), ("1", "/a {b}")):
+        registry = MetricsRegistry()
+        latency = Histogram("latency_seconds", "Latency.", ("route",), buckets=(1,))
+        tables = Counter("tables_total", "Tables.")
+        registry.register(latency, tables)
+        latency.observe(0.5, route)
+        tables.inc()
+        bodies[worker] = registry.render()
+
+    lines = merge_expositions(bodies).decode().splitlines()
+    assert lines.count("# TYPE latency_seconds histogram") == 1
+    assert 'latency_seconds_bucket{worker="0",route="/state",le="1"} 1' in lines
+    assert 'latency_seconds_count{worker="1",route="/a {b}"} 1' in lines
+    assert lines[-3:] == [
+        "# TYPE tables_total counter",
+        'tables_total{worker="0"} 1',
+        'tables_total{worker="1"} 1',
+    ]
+
+
+def test_agent_fallbacks_and_latency_are_recorded():
+    agent = GeminiPokerAgent(api_key=None)
+    before = AI_DECISION_SECONDS.count("gemini", "chat")
+    fallbacks = AI_FALLBACKS.value("chat", "unavailable")
+
+    reply = asyncio.run(agent.decide_chat_response("hi", [], *states()))
+
+    assert reply == "Nice move."
+    assert AI_DECISION_SECONDS.count("gemini", "chat") == before + 1
+    assert AI_FALLBACKS.value("chat", "unavailable") == fallbacks + 1
+
+
+def test_metrics_endpoint():
+    with TestClient(app) as client:
+        client.post("/tables?table_id=metrics")
+        client.get("/state?table_id=metrics")
+        client.post(
+            "/action?table_id=metrics", json={"player_id": "player1", "action": "x"}
+        )
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert (
+        'poker_http_request_duration_seconds_count{method="GET",route="/state",'
+        'status="200"}' in body
+    )
+    assert 'poker_table_queue_wait_seconds_count{command="action"}' in body
+    assert 'poker_table_command_seconds_count{command="action"}' in body
+    assert "poker_tables_active 1" in body
+    assert 'poker_players_seated{type="human"} 1' in body
+    assert 'poker_ai_tasks_pending{queue="actor"} 0' in body
+    assert 'poker_cache_hit_ratio{cache="evaluator"}' in body
+    assert "poker_evaluator_calls_total" in body
@@ -0,0 +1,139 @@
+import asyncio
+import pytest
+import sqlite3
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.chat import ChatManager
+from five_card_poker.ai import GeminiPokerAgent
+from five_card_poker.persistence import TableStore, dump_table, restore_table
+from five_card_poker.registry import TableRegistry
+
+
+def human_table(table_id="t1", bots=None):
+    table = Table(chat_manager=ChatManager(), table_id=table_id)
+    table.add_player(Player(id="p1", name="Alice", balance=100))
+    table.add_player(Player(id="p2", name="Bob", balance=100))
+    return table
+
+
+def mock_agent():
+    agent = MagicMock(spec=GeminiPokerAgent)
+    agent.decide_betting_action = AsyncMock(return_value=("call", 0))
+    return agent
+
+
+def test_dump_and_restore_round_trip():
+    table = human_table()
+    table.add_player(Player(id="bot", name="Bot", type=PlayerType.AI))
+    table.dealer_idx = 2
+    table.start_game(ante=5)
+    table.handle_action("p1", "raise", 10)
+
+    restored = restore_table(dump_table(table), mock_agent)
+
+    assert dump_table(restored) == dump_table(table)
+    assert restored.players[2].agent is not None
+    assert restored.players[0].hand.cards == table.players[0].hand.cards
+    assert all(
+        a is b
+        for a, b in zip(restored.players[0].hand.cards, table.players[0].hand.cards)
+    )
+    assert [(m.seq, m.text) for m in restored.chat_manager.messages] == [
+        (m.seq, m.text) for m in table.chat_manager.messages
+    ]
+
+
+def test_store_uses_wal_and_group_commits(tmp_path):
+    store = TableStore(str(tmp_path / "poker.db"))
+    table = human_table()
+    for _ in range(50):
+        store.save(table)
+    store.record(table, "start", (5,))
+    store.flush()
+
+    assert store.load("t1")["players"][0]["balance"] == 100
+    assert store.actions("t1") == [(table.version, "start", [5])]
+    store.close()
+
+    conn = sqlite3.connect(str(tmp_path / "poker.db"))
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("SELECT COUNT(*) FROM tables").fetchone()[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_registry_restores_tables_lazily(tmp_path):
+    path = str(tmp_path / "poker.db")
+    store = TableStore(path)
+    registry = TableRegistry(factory=human_table, store=store)
+
+    table = registry.create("t1")
+    table.dealer_idx = 1
+    await table.actor.submit("start", 5)
+    await table.actor.submit("action", "p1", "raise", 10)
+    store.close()
+
+    # Simulate a restart
+    store = TableStore(path)
+    registry = TableRegistry(factory=human_table, store=store)
+    assert len(registry) == 0
+    assert "t1" not in registry
+
+    load = store.load
+    threads = []
+
+    def record_load(table_id):
+        threads.append(threading.current_thread())
+        return load(table_id)
+
+    # Request handlers open tables; the SQLite read happens off the loop
+    with patch.object(store, "load", side_effect=record_load):
+        restored = await registry.open("t1")
+    assert threads and threading.main_thread() not in threads
+    assert restored.phase == "betting_1"
+    assert restored.pot == 20
+    assert restored.current_bet == 10
+    assert restored.players[0].balance == 85
+    assert [a[1] for a in store.actions("t1")] == ["start", "action"]
+
+    # The restored table keeps journaling
+    await restored.actor.submit("action", "p2", "call")
+    store.flush()
+    assert store.load("t1")["phase"] == "drawing"
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_reset_during_bot_move_keeps_the_new_game(tmp_path):
+    thinking = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_bet(player_state, table_state):
+        thinking.set()
+        await release.wait()
+        return "raise", 20
+
+    def bot_first_table(table_id, bots=None):
+        table = Table(chat_manager=ChatManager(), table_id=table_id)
+        agent = mock_agent()
+        agent.decide_betting_action = slow_bet
+        table.add_player(Player(id="bot", name="Bot", type=PlayerType.AI, agent=agent))
+        table.add_player(Player(id="p1", name="Alice", balance=100))
+        table.dealer_idx = 1
+        return table
+
+    store = TableStore(str(tmp_path / "poker.db"))
+    registry = TableRegistry(factory=bot_first_table, store=store)
+    old = registry.create("t1")
+    await old.actor.submit("start", 5)
+    await thinking.wait()
+
+    registry.reset("t1")
+    release.set()
+    await old.actor.join()
+    store.flush()
+
+    saved = store.load("t1")
+    assert saved["phase"] == "waiting"
+    assert [p["balance"] for p in saved["players"]] == [100, 100]
+    store.close()
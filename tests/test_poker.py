@@ -1,4 +1,5 @@
 import pytest
+from pydantic import ValidationError
 from fastapi.testclient import TestClient
 from five_card_poker.main import app
 from five_card_poker.logic import GameLogic, Card, Suit, Rank
@@ -15,6 +16,14 @@ def test_deck_creation(fresh_game):
     assert len(fresh_game.deck) == 52
 
 
+def test_cards_are_interned(fresh_game):
+    hand = fresh_game.deal(10)
+    assert all(card is Card.of(card.suit, card.rank) for card in hand.cards)
+    assert Card.of("Hearts", "10") is Card.of(Suit.HEARTS, Rank.TEN)
+    with pytest.raises(ValidationError):
+        hand.cards[0].rank = Rank.ACE
+
+
 def test_deal_cards(fresh_game):
     hand = fresh_game.deal(10)
     assert len(hand.cards) == 5
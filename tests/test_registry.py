@@ -0,0 +1,83 @@
+import pytest
+from fastapi.testclient import TestClient
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.main import app
+from five_card_poker.registry import TableLimitError, TableRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def human_table(table_id, bots=None):
+    table = Table(table_id=table_id)
+    table.add_player(Player(id="p1", name="Alice", type=PlayerType.HUMAN))
+    return table
+
+
+def test_only_default_table_is_created_on_access():
+    registry = TableRegistry(factory=human_table)
+    assert registry.get().id == "default"
+    with pytest.raises(KeyError):
+        registry.get("t1")
+    with pytest.raises(KeyError):
+        registry.reset("t1")
+    assert len(registry) == 1
+
+    created = registry.create("t1")
+    assert registry.get("t1") is created
+    assert registry.create("t1") is created
+
+
+def test_full_registry_evicts_least_recently_used_idle_table():
+    clock = FakeClock()
+    registry = TableRegistry(
+        factory=human_table, max_tables=2, idle_seconds=60, clock=clock
+    )
+    registry.create("t1")
+    registry.create("t2")
+    clock.now = 30
+    registry.get("t1")
+
+    clock.now = 70  # t2 idle for 70s, t1 for 40s
+    registry.create("t3")
+    assert "t2" not in registry
+    assert "t1" in registry
+
+    with pytest.raises(TableLimitError):
+        registry.create("t4")
+
+
+def test_unknown_table_ids_are_not_created_by_requests():
+    with TestClient(app) as client:
+        assert client.get("/state?table_id=nope").status_code == 404
+        assert client.post("/reset?table_id=nope").status_code == 404
+        assert "nope" not in app.state.tables
+
+        assert client.post("/tables?table_id=nope").json() == {"table_id": "nope"}
+        assert client.get("/state?table_id=nope").status_code == 200
+
+
+def test_bot_agents_are_chosen_per_table():
+    with TestClient(app) as client:
+        response = client.post("/tables?table_id=mixed&bots=strategy,gemini")
+        assert response.status_code == 200
+        table = app.state.tables.get("mixed")
+        kinds = [p.agent.kind for p in table.players if p.agent]
+        assert kinds == ["strategy", "gemini"]
+
+        # A reset keeps the table's bots; other tables keep the default
+        client.post("/reset?table_id=mixed")
+        table = app.state.tables.get("mixed")
+        assert [p.agent.kind for p in table.players if p.agent] == kinds
+        assert client.post("/tables?table_id=plain").status_code == 200
+        table = app.state.tables.get("plain")
+        assert [p.agent.kind for p in table.players if p.agent] == ["gemini"] * 2
+
+        response = client.post("/tables?table_id=bad&bots=oracle")
+        assert response.status_code == 400
+        assert "bad" not in app.state.tables
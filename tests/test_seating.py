@@ -0,0 +1,89 @@
+import pytest
+from five_card_poker.logic import Table, Player, MAX_SEATS
+
+
+def full_table():
+    table = Table()
+    for i in range(MAX_SEATS):
+        table.add_player(Player(id=f"p{i}", name=f"Player {i}", balance=100))
+    return table
+
+
+def test_seat_index_lookup():
+    table = full_table()
+    assert table.get_player("p7").seat == 7
+    assert table.get_player("nobody") is None
+
+
+def test_add_player_rejects_duplicates_and_overflow():
+    table = full_table()
+    with pytest.raises(ValueError, match="already seated"):
+        table.add_player(Player(id="p0", name="Again"))
+    table = Table()
+    table.add_player(Player(id="a", name="A"))
+    with pytest.raises(ValueError, match="already seated"):
+        table.add_player(Player(id="a", name="A"))
+    with pytest.raises(ValueError, match="Table is full"):
+        full_table().add_player(Player(id="extra", name="Extra"))
+
+
+def test_spectators_are_not_seated():
+    table = full_table()
+    table.add_spectator("watcher")
+    table.add_spectator("watcher")
+    assert table.spectators == ["watcher"]
+    with pytest.raises(ValueError):
+        table.add_spectator("p3")
+
+    state = table.to_state("watcher")
+    assert len(state.players) == MAX_SEATS
+    table.remove_spectator("watcher")
+    assert table.spectators == []
+
+
+def test_turn_skips_folded_and_inactive_seats():
+    table = full_table()
+    table.dealer_idx = MAX_SEATS - 1
+    table.start_game(ante=5)
+    assert table.active_player_idx == 0
+
+    # Direct flag writes keep the seat bitmask in sync
+    table.players[1].is_folded = True
+    table.players[2].is_active = False
+    table.handle_action("p0", "check")
+    assert table.active_player_idx == 3
+
+    # Wraps around past the last seat
+    table.active_player_idx = 9
+    table.handle_action("p9", "check")
+    assert table.active_player_idx == 0
+
+
+def test_ten_seat_betting_and_drawing_rounds():
+    table = full_table()
+    table.dealer_idx = MAX_SEATS - 1
+    table.start_game(ante=5)
+
+    table.handle_action("p0", "raise", 10)
+    for i in range(1, MAX_SEATS):
+        assert table.phase == "betting_1"
+        table.handle_action(f"p{i}", "fold" if i % 2 else "call")
+    assert table.phase == "drawing"
+    assert table.pot == 50 + 10 * 5
+
+    live = [p.id for p in table.players if not p.is_folded]
+    for player_id in live:
+        assert table.players[table.active_player_idx].id == player_id
+        table.handle_draw(player_id, [0, 1, 2, 3, 4])
+    assert table.phase == "betting_2"
+
+
+def test_all_but_one_fold_ends_hand():
+    table = full_table()
+    table.dealer_idx = MAX_SEATS - 1
+    table.start_game(ante=5)
+    for i in range(MAX_SEATS - 1):
+        table.handle_action(f"p{i}", "fold")
+
+    assert table.phase == "waiting"
+    assert table.players[-1].balance == 95 + 5 * MAX_SEATS
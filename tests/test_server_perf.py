@@ -6,6 +6,7 @@ from httpx import AsyncClient, ASGITransport
 from five_card_poker.main import app
 from five_card_poker.models import PlayerType
 from five_card_poker.logic import Table, Player
+from five_card_poker.registry import TableRegistry
 from five_card_poker.ai import GeminiPokerAgent
 
 
@@ -20,9 +21,9 @@ async def test_server_perf_slow_ai_does_not_block_state():
     """
     # 1. Setup App State
     # Initialize the table manually
-    table = Table()
-    app.state.table = table
-    app.state.chat_manager = MagicMock()  # Mock chat manager
+    table = Table(chat_manager=MagicMock())  # Mock chat manager
+    app.state.tables = TableRegistry()
+    app.state.tables.put("default", table)
 
     human = Player(id="p1", name="Human", type=PlayerType.HUMAN, balance=100)
 
@@ -0,0 +1,104 @@
+import json
+from fastapi.testclient import TestClient
+from five_card_poker.main import app
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.snapshot import encode_seat
+
+
+def make_table():
+    table = Table()
+    table.add_player(Player(id="p1", name="Alice", type=PlayerType.HUMAN))
+    table.add_player(Player(id="p2", name="Bob", type=PlayerType.HUMAN))
+    table.dealer_idx = 1
+    table.start_game(ante=5)
+    return table
+
+
+def test_snapshot_matches_to_state_for_each_observer():
+    table = make_table()
+    snapshot = table.publish()
+
+    for observer in ("p1", "p2", "spectator"):
+        rendered = json.loads(snapshot.render(observer))
+        assert rendered == table.to_state(observer).model_dump(mode="json")
+
+
+def test_snapshot_only_reveals_observer_hand():
+    table = make_table()
+    rendered = json.loads(table.publish().render("p1"))
+
+    hands = {p["id"]: p["hand"] for p in rendered["players"]}
+    assert hands["p1"] is not None
+    assert hands["p2"] is None
+
+
+def test_snapshot_is_immutable_after_mutation():
+    table = make_table()
+    before = table.publish()
+    before_bytes = before.render("p1")
+
+    table.handle_action("p1", "raise", 10)
+    after = table.publish()
+
+    assert before.render("p1") == before_bytes
+    assert after.version == before.version + 1
+    assert json.loads(after.render("p1"))["current_bet"] == 10
+
+
+def test_api_state_serves_published_snapshot():
+    table = make_table()
+    with TestClient(app) as client:
+        app.state.tables.put("default", table)
+        response = client.get("/state?player_id=p2")
+
+    assert response.status_code == 200
+    assert response.headers["X-Table-Version"] == str(table.version)
+    assert response.json() == table.to_state("p2").model_dump(mode="json")
+
+
+def test_encoded_seat_matches_player_state():
+    table = make_table()
+    player = table.players[0]
+    player.name = 'Zoë "the Rock"'
+    player.last_action = "Raise to 10"
+
+    visible, hidden = encode_seat(player)
+    assert json.loads(visible) == player.to_state(hide_hand=False).model_dump(
+        mode="json"
+    )
+    assert json.loads(hidden) == player.to_state().model_dump(mode="json")
+
+
+def test_api_action_returns_snapshot():
+    table = make_table()
+    with TestClient(app) as client:
+        app.state.tables.put("default", table)
+        response = client.post("/action", json={"player_id": "p1", "action": "call"})
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["X-Table-Version"] == str(table.version)
+    assert response.json() == table.to_state("p1").model_dump(mode="json")
+
+
+def test_to_state_shares_public_view_between_observers():
+    table = make_table()
+    p1_view = table.to_state("p1")
+    p2_view = table.to_state("p2")
+
+    assert p1_view.players[0].hand is not None
+    assert p1_view.players[1].hand is None
+    assert p2_view.players[1].hand is not None
+    # Seats the observer cannot see are the same shared objects
+    assert p1_view.players[1] is table.to_state("spectator").players[1]
+    assert p2_view.players[0] is table.to_state("spectator").players[0]
+
+
+def test_to_state_follows_engine_changes():
+    table = make_table()
+    assert table.to_state("p2").current_bet == 0
+
+    table.handle_action("p1", "raise", 10)
+    state = table.to_state("p2")
+    assert state.current_bet == 10
+    assert state.players[0].last_action == "Raise to 10"
+    assert state.active_player_id == "p2"
@@ -0,0 +1,140 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.ai import GeminiPokerAgent
+from five_card_poker.speculation import Speculator
+
+
+def make_table(budget=10, delay=0.2):
+    table = Table()
+    table.add_player(Player(id="p1", name="Alice", type=PlayerType.HUMAN))
+    for i in (1, 2):
+
+        async def slow_bet(player_state, table_state):
+            await asyncio.sleep(delay)
+            return ("call", 0)
+
+        agent = MagicMock(spec=GeminiPokerAgent)
+        agent.decide_betting_action = AsyncMock(side_effect=slow_bet)
+        agent.decide_draw_action = AsyncMock(return_value=[])
+        table.add_player(
+            Player(id=f"bot{i}", name=f"Bot {i}", type=PlayerType.AI, agent=agent)
+        )
+    table.actor.speculator = Speculator(budget=budget)
+    table.dealer_idx = 2  # p1 acts first
+    return table
+
+
+@pytest.mark.asyncio
+async def test_speculated_move_commits_when_human_acts():
+    table = make_table()
+    await table.actor.submit("start", 5)
+    speculator = table.actor.speculator
+    assert speculator.in_flight == 2  # After p1 checks, and after p1 folds
+
+    await asyncio.sleep(0.3)  # Human thinks; the bot's answers are ready
+    loop = asyncio.get_running_loop()
+    began = loop.time()
+    await table.actor.submit("action", "p1", "check")
+    # bot1's move is applied from the speculation without a new model call
+    while table.players[table.active_player_idx].id == "bot1":
+        await asyncio.sleep(0)
+    assert loop.time() - began < 0.1
+    await table.actor.join()
+
+    bot1 = table.players[1]
+    assert bot1.last_action == "Call"
+    assert bot1.agent.decide_betting_action.await_count == 2  # Both speculations
+    assert speculator.hits == 1
+    assert speculator.wasted == 0  # The fold branch was charged, then earned back
+    assert table.phase == "drawing"
+
+
+@pytest.mark.asyncio
+async def test_speculation_discarded_on_mismatch_and_capped_by_budget():
+    table = make_table(budget=1)
+    await table.actor.submit("start", 5)
+    speculator = table.actor.speculator
+    assert speculator.in_flight == 1  # Budget allows only one call
+
+    # A raise was not speculated on; the bot is asked afresh
+    await table.actor.submit("action", "p1", "raise", 10)
+    await table.actor.join()
+
+    assert speculator.hits == 0
+    assert speculator.wasted == 1
+    assert table.players[1].agent.decide_betting_action.await_count == 2
+    assert table.phase == "drawing"
+
+
+def test_clone_copies_only_engine_state():
+    table = make_table()
+    table.start_game(ante=5)
+    clone = table.clone()
+
+    clone.handle_action("p1", "fold")
+    assert table.players[0].is_folded is False
+    assert table.active_player_idx == 0
+    assert clone.players[0].is_folded is True
+    assert all(p.agent is None for p in clone.players)
+    assert clone.chat_manager is None
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_skips_cloning_until_next_hand(monkeypatch):
+    table = make_table(budget=1)
+    table.start_game(ante=5)
+    speculator = table.actor.speculator
+    speculator.speculate(table)
+    speculator.discard()
+    assert speculator.wasted == 1
+
+    clone = table.clone
+
+    def no_clone():
+        raise AssertionError("cloned after the budget ran out")
+
+    monkeypatch.setattr(table, "clone", no_clone)
+    speculator.speculate(table)
+    assert speculator.in_flight == 0
+
+    # Everyone but bot2 folds; the next hand gets a fresh allowance
+    monkeypatch.setattr(table, "clone", clone)
+    table.handle_action("p1", "fold")
+    table.handle_action("bot1", "fold")
+    speculator.speculate(table)
+    table.dealer_idx = 2
+    table.start_game(ante=5)
+    speculator.speculate(table)
+    assert speculator.wasted == 0
+    assert speculator.in_flight == 1
+    speculator.discard()
+
+
+@pytest.mark.asyncio
+async def test_turn_passing_to_another_human_replaces_speculations():
+    table = Table()
+    agents = []
+    for seat in ("p1", "bot1", "p2", "bot2"):
+        agent = None
+        if seat.startswith("bot"):
+            agent = MagicMock(spec=GeminiPokerAgent)
+            agent.decide_betting_action = AsyncMock(return_value=("call", 0))
+            agents.append(agent)
+        kind = PlayerType.AI if agent else PlayerType.HUMAN
+        table.add_player(Player(id=seat, name=seat, type=kind, agent=agent))
+    table.dealer_idx = 3  # p1 acts first
+    table.start_game(ante=5)
+    speculator = Speculator(budget=10)
+
+    speculator.speculate(table)
+    assert speculator.in_flight == 2  # bot1 after p1 checks or folds
+
+    table.active_player_idx = 2  # Now p2 is on turn
+    speculator.speculate(table)
+    await asyncio.sleep(0)
+    assert speculator.wasted == 2
+    assert speculator.in_flight == 2
+    assert agents[1].decide_betting_action.await_count == 2
+    speculator.discard()
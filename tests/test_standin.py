@@ -0,0 +1,57 @@
+import pytest
+from five_card_poker.ai import GeminiPokerAgent
+from five_card_poker.clients import ClientPool
+from five_card_poker.gateway import LLMGateway
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.standin import StandInClient, StandInConfig
+
+
+def standin_table(config, gateway=None):
+    pool = ClientPool(size=1, factory=lambda key: StandInClient(config))
+    table = Table()
+    for i in range(3):
+        agent = GeminiPokerAgent(api_key="standin", client_pool=pool, gateway=gateway)
+        table.add_player(
+            Player(id=f"bot{i}", name=f"Bot {i}", type=PlayerType.AI, agent=agent)
+        )
+    return table, pool.borrow("standin")
+
+
+def test_latency_distributions():
+    assert (
+        StandInClient(StandInConfig(latency="fixed", median=0.3)).sample_latency()
+        == 0.3
+    )
+    client = StandInClient(
+        StandInConfig(latency="uniform", median=1, spread=0.5, seed=1)
+    )
+    assert all(0.5 <= client.sample_latency() <= 1.5 for _ in range(100))
+    with pytest.raises(ValueError):
+        StandInConfig(latency="gamma")
+
+
+@pytest.mark.asyncio
+async def test_hand_plays_through_standin():
+    table, client = standin_table(StandInConfig(latency="fixed", median=0, seed=7))
+    await table.actor.submit("start", 5)
+    await table.actor.join()
+
+    assert table.phase == "waiting"
+    assert client.calls > 0
+    assert client.stats()["errors"] == 0
+
+
+@pytest.mark.asyncio
+async def test_injected_faults_fall_back_to_rules():
+    config = StandInConfig(
+        latency="fixed", median=0, error_rate=0.5, malformed_rate=0.5, seed=3
+    )
+    gateway = LLMGateway(rate=0, failure_threshold=1000)
+    table, client = standin_table(config, gateway)
+    await table.actor.submit("start", 5)
+    await table.actor.join()
+
+    # Every fault turned into a rule-based move and the hand still finished
+    assert table.phase == "waiting"
+    assert client.errors > 0 and client.malformed > 0
+    assert gateway.failures == client.errors
@@ -0,0 +1,125 @@
+import pytest
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.models import Card, Suit, Rank
+from five_card_poker.persistence import dump_table, restore_table
+from five_card_poker.registry import new_agent
+from five_card_poker.strategy import (
+    RANK_VALUES,
+    STRENGTH,
+    StrategyAgent,
+    hand_strength,
+    score,
+)
+from helpers import make_states
+
+DECK = [Card(suit=s, rank=r) for s in Suit for r in Rank]
+
+
+def cards(*specs):
+    suits = {"h": Suit.HEARTS, "d": Suit.DIAMONDS, "c": Suit.CLUBS, "s": Suit.SPADES}
+    return [Card(rank=Rank(spec[:-1]), suit=suits[spec[-1]]) for spec in specs]
+
+
+@pytest.mark.parametrize(
+    "hand, expected",
+    [
+        (("Ah", "Kh", "Qh", "Jh", "10h"), 900),
+        (("9s", "8s", "7s", "6s", "5s"), 809),
+        (("5d", "4d", "3d", "2d", "Ad"), 805),
+        (("Qh", "Qd", "Qs", "Qc", "3h"), 712),
+        (("8h", "8d", "8s", "Kc", "Kh"), 608),
+        (("2c", "9c", "Jc", "4c", "7c"), 511),
+        (("Ah", "2d", "3s", "4c", "5h"), 405),
+        (("10h", "Jd", "Qs", "Kc", "Ah"), 414),
+        (("7h", "7d", "7s", "2c", "9h"), 307),
+        (("3h", "3d", "9s", "9c", "Kh"), 209),
+        (("Jh", "Jd", "4s", "8c", "2h"), 111),
+        (("Kh", "9d", "7s", "4c", "2h"), 13),
+    ],
+)
+def test_score(hand, expected):
+    played = cards(*hand)
+    flush = len({c.suit for c in played}) == 1
+    assert score([RANK_VALUES[c.rank] for c in played], flush) == expected
+
+
+def test_strength_table_covers_every_hand():
+    assert len(STRENGTH) == 6175
+    royal = cards("Ah", "Kh", "Qh", "Jh", "10h")
+    assert hand_strength([14, 13, 12, 11, 10], [c.suit for c in royal]) > 0.9999
+    assert hand_strength([7, 5, 4, 3, 2], ["h", "d", "h", "h", "h"]) < 0.01
+
+
+@pytest.mark.asyncio
+async def test_draws_hold_highest_ev():
+    agent = StrategyAgent()
+    pair = cards("Ah", "7c", "As", "2d", "9h")
+    assert await agent.decide_draw_action(*make_states(pair)) == [0, 2]
+
+    # Open-ended straight flush draw beats keeping any high cards
+    four_to_royal = cards("10h", "Jh", "Qh", "Kh", "3c")
+    assert await agent.decide_draw_action(*make_states(four_to_royal)) == [0, 1, 2, 3]
+
+    two_pair = cards("3h", "3d", "9s", "9c", "Kh")
+    assert await agent.decide_draw_action(*make_states(two_pair)) == [0, 1, 2, 3]
+
+    full_house = cards("3h", "3d", "8s", "8c", "3c")
+    assert await agent.decide_draw_action(*make_states(full_house)) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_betting_uses_equity_and_pot_odds():
+    agent = StrategyAgent()
+    # After the draw, heads-up, with nothing bet yet unless given
+    river = dict(pot=20, current_bet=0, phase="betting_2", opponents=1)
+    trips = cards("Qh", "Qd", "Qs", "4c", "9h")
+    assert await agent.decide_betting_action(*make_states(trips, **river)) == (
+        "raise",
+        10,
+    )
+
+    junk = cards("2h", "7d", "9s", "Jc", "4h")
+    assert await agent.decide_betting_action(*make_states(junk, **river)) == (
+        "check",
+        0,
+    )
+    # Facing a big bet with nothing: fold
+    assert await agent.decide_betting_action(
+        *make_states(junk, **dict(river, current_bet=50))
+    ) == ("fold", 0)
+    # A middling pair calls a small bet into a big pot
+    pair = cards("9h", "9d", "Ks", "4c", "2h")
+    assert await agent.decide_betting_action(
+        *make_states(pair, **dict(river, pot=200, current_bet=5))
+    ) == ("call", 0)
+
+
+@pytest.mark.asyncio
+async def test_strategy_seats_play_and_persist(monkeypatch):
+    table = Table()
+    # Stack the deck: Alice gets junk, bot1 quads, bot2 junk
+    dealt = cards(
+        *("2h", "7d", "9s", "Jc", "4h"),
+        *("Qh", "Qd", "Qs", "Qc", "3h"),
+        *("2c", "3d", "6s", "8c", "10d"),
+    )
+    deck = [c for c in DECK if c not in dealt] + dealt[::-1]
+    monkeypatch.setattr(table, "_create_deck", lambda: list(deck))
+    monkeypatch.setattr("five_card_poker.logic.random.shuffle", lambda cards: None)
+    table.add_player(Player(id="p1", name="Alice", type=PlayerType.HUMAN))
+    for i in (1, 2):
+        table.add_player(
+            Player(
+                id=f"bot{i}", name=f"Bot {i}", type=PlayerType.AI, agent=StrategyAgent()
+            )
+        )
+    table.dealer_idx = 0  # bots act first
+    await table.actor.submit("start", 5)
+    await table.actor.join()
+    alice, bot1, bot2 = table.players
+    assert (bot1.last_action, bot2.last_action) == ("Raise to 10", "Fold")
+    assert table.phase == "betting_1"
+    assert table.players[table.active_player_idx] is alice
+
+    restored = restore_table(dump_table(table), new_agent)
+    assert all(p.agent.kind == "strategy" for p in restored.players[1:])
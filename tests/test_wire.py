@@ -0,0 +1,92 @@
+import json
+from fastapi.testclient import TestClient
+from five_card_poker.main import app
+from five_card_poker.logic import Table, Player, PlayerType
+from five_card_poker.models import Card, Suit, Rank
+from five_card_poker.wire import COMPACT_MEDIA_TYPE, CARD_CODES
+
+SUITS = {"h": "Hearts", "d": "Diamonds", "c": "Clubs", "s": "Spades"}
+
+
+def expand(data):
+    """The decoding static/script.js does, for checking it is lossless."""
+
+    def player(p):
+        hand = p.get("h")
+        return {
+            "id": p["i"],
+            "name": p["n"],
+            "type": "human" if p["t"] == "h" else "ai",
+            "balance": p["b"],
+            "hand": {
+                "cards": [
+                    {
+                        "suit": SUITS[code[1]],
+                        "rank": "10" if code[0] == "T" else code[0],
+                    }
+                    for code in (
+                        hand["c"][i : i + 2] for i in range(0, len(hand["c"]), 2)
+                    )
+                ],
+                "rank": hand["r"],
+                "score": hand["s"],
+            }
+            if hand
+            else None,
+            "is_folded": bool(p.get("f", 0)),
+            "current_bet": p.get("cb", 0),
+            "last_action": p.get("la", ""),
+            "is_active": bool(p.get("ac", 1)),
+            "has_acted": bool(p.get("ha", 0)),
+        }
+
+    return {
+        "players": [player(p) for p in data["pl"]],
+        "pot": data["po"],
+        "current_bet": data["cb"],
+        "phase": data["ph"],
+        "active_player_id": data["ap"],
+        "dealer_idx": data["di"],
+        "deck_count": data["dc"],
+    }
+
+
+def make_table():
+    table = Table()
+    table.add_player(Player(id="p1", name="Alice", type=PlayerType.HUMAN))
+    table.add_player(Player(id="p2", name="Bot", type=PlayerType.AI))
+    table.add_player(Player(id="p3", name="Bob", type=PlayerType.HUMAN))
+    table.dealer_idx = 2
+    table.start_game(ante=5)
+    table.handle_action("p1", "raise", 20)
+    return table
+
+
+def test_card_codes():
+    assert CARD_CODES[Card.of(Suit.HEARTS, Rank.TEN)] == "Th"
+    assert CARD_CODES[Card.of(Suit.SPADES, Rank.ACE)] == "As"
+    assert len(set(CARD_CODES.values())) == 52
+
+
+def test_compact_snapshot_is_lossless_and_smaller():
+    snapshot = make_table().publish()
+    for observer in ("p1", "p2", "spectator"):
+        full = snapshot.render(observer)
+        compact = snapshot.compact.render(observer)
+        assert expand(json.loads(compact)) == json.loads(full)
+        assert len(compact) * 2 < len(full)
+
+
+def test_compact_format_is_negotiated():
+    table = make_table()
+    with TestClient(app) as client:
+        app.state.tables.put("default", table)
+        plain = client.get("/state?player_id=p1")
+        compact = client.get(
+            "/state?player_id=p1", headers={"Accept": COMPACT_MEDIA_TYPE}
+        )
+
+    assert plain.headers["content-type"] == "application/json"
+    assert compact.headers["content-type"] == COMPACT_MEDIA_TYPE
+    assert compact.headers["vary"] == "Accept"
+    assert expand(compact.json()) == plain.json()